@@ -0,0 +1,103 @@
+"""
+Code generation helpers for CEW Training Platform dataclasses.
+
+Builds straight-line serialization methods once per class, the same way
+the dataclasses module generates __init__, so per-call work is limited
+to the attribute loads and conversions each field actually needs.
+"""
+import dataclasses
+import typing
+from datetime import datetime
+from enum import Enum
+from typing import Any, Callable, Optional
+
+
+def _is_enum(tp: Any) -> bool:
+    return isinstance(tp, type) and issubclass(tp, Enum)
+
+
+def _store_iso(obj: Any, cache_attr: str, dt: datetime) -> str:
+    """Format dt and remember the result on obj alongside the value it came from."""
+    iso = dt.isoformat()
+    setattr(obj, cache_attr, (dt, iso))
+    return iso
+
+
+def _field_expr(name: str, tp: Any, cached: frozenset[str] = frozenset()) -> str:
+    """Return the source expression that serializes self.<name> of type tp."""
+    attr = f"self.{name}"
+    args = typing.get_args(tp)
+    if typing.get_origin(tp) is typing.Union and type(None) in args:
+        inner = [a for a in args if a is not type(None)]
+        if len(inner) == 1:
+            expr = _field_expr(name, inner[0], cached)
+            if expr != attr:
+                return f"({expr}) if {attr} is not None else None"
+        return attr
+    if tp is datetime:
+        cache_attr = f"_{name}_iso"
+        if cache_attr in cached:
+            # Reuse the stored string while the field still holds the same object
+            return (
+                f"__c[1] if (__c := self.{cache_attr}) is not None and __c[0] is {attr}"
+                f" else _store_iso(self, {cache_attr!r}, {attr})"
+            )
+        return f"{attr}.isoformat()"
+    if _is_enum(tp):
+        return f"{attr}.value"
+    origin = typing.get_origin(tp)
+    if origin in (list, tuple) and args and _is_enum(args[0]):
+        return f"[__v.value for __v in {attr}]"
+    if origin in (set, frozenset) and args and _is_enum(args[0]):
+        # Sort unordered collections so the output is stable
+        return f"sorted([__v.value for __v in {attr}])"
+    return attr
+
+
+def make_to_dict(
+    cls: Optional[type] = None,
+    *,
+    extra: Optional[dict[str, str]] = None
+) -> Any:
+    """
+    Generate and attach a to_dict() method for a dataclass.
+
+    Enums serialize to their value, datetimes to ISO format and lists or
+    sets of enums to lists of values (sorted, for sets); fields starting
+    with an underscore are skipped. A datetime field x is formatted once
+    and reused if the class declares an `_x_iso` field to hold the cached
+    string. extra maps keys to source expressions evaluated against self;
+    a key naming a field replaces that field's expression in place, other
+    keys are appended. Usable as a bare decorator or called with extra=.
+    """
+    def wrap(cls: type) -> type:
+        hints = typing.get_type_hints(cls)
+        fields = dataclasses.fields(cls)
+        cached = frozenset(f.name for f in fields if f.name.endswith("_iso"))
+        overrides = dict(extra or {})
+        items = [
+            f"{f.name!r}: "
+            f"{overrides.pop(f.name, None) or _field_expr(f.name, hints[f.name], cached)}"
+            for f in fields
+            if not f.name.startswith("_")
+        ]
+        items.extend(f"{key!r}: {expr}" for key, expr in overrides.items())
+        body = ",\n        ".join(items)
+        source = f"def to_dict(self) -> dict:\n    return {{\n        {body}\n    }}\n"
+
+        namespace: dict[str, Any] = {}
+        exec(
+            compile(source, f"<generated {cls.__name__}.to_dict>", "exec"),
+            {"_store_iso": _store_iso},
+            namespace
+        )
+        to_dict: Callable[[Any], dict] = namespace["to_dict"]
+        to_dict.__qualname__ = f"{cls.__qualname__}.to_dict"
+        to_dict.__module__ = cls.__module__
+        to_dict.__doc__ = f"Serialize this {cls.__name__} to a JSON-compatible dict."
+        cls.to_dict = to_dict
+        return cls
+
+    if cls is None:
+        return wrap
+    return wrap(cls)
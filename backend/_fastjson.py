@@ -0,0 +1,52 @@
+"""
+Fast JSON encoding for CEW Training Platform dataclasses.
+
+Encodes dataclass instances directly with orjson, so bulk exports don't
+build an intermediate dict per object before serializing it. Falls back
+to the standard library encoder when orjson is not installed.
+"""
+import dataclasses
+import json
+from datetime import date, datetime, time
+from enum import Enum
+from typing import Any
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def _default(obj: Any) -> Any:
+    """Encode values orjson doesn't handle natively."""
+    if isinstance(obj, Enum):
+        return obj.value
+    if isinstance(obj, (set, frozenset)):
+        return sorted(obj)
+    if isinstance(obj, (datetime, date, time)):
+        return obj.isoformat()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _default_stdlib(obj: Any) -> Any:
+    """Stdlib fallback: also walk dataclasses, skipping private fields like orjson."""
+    if dataclasses.is_dataclass(obj) and not isinstance(obj, type):
+        return {
+            f.name: getattr(obj, f.name)
+            for f in dataclasses.fields(obj)
+            if not f.name.startswith("_")
+        }
+    return _default(obj)
+
+
+def dumps(obj: Any, indent: bool = False) -> bytes:
+    """Encode obj, including nested dataclasses, as UTF-8 JSON."""
+    if ORJSON_AVAILABLE:
+        option = orjson.OPT_NAIVE_UTC | orjson.OPT_SERIALIZE_DATACLASS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, default=_default, option=option)
+    return json.dumps(
+        obj, default=_default_stdlib, indent=2 if indent else None
+    ).encode("utf-8")
@@ -2,11 +2,13 @@
 Audit logging module for CEW Training Platform.
 Tracks user actions for security and compliance.
 """
-from collections import deque
+from array import array
+from collections import defaultdict, deque
 from datetime import datetime, timezone
-from typing import Optional
+from typing import Iterable, Optional
 from pydantic import BaseModel
-import uuid
+import threading
+import time
 
 
 class AuditAction:
@@ -42,9 +44,92 @@ class AuditLog(BaseModel):
     success: bool = True
 
 
-# In-memory audit log store using deque for O(1) removal (replace with database in production)
+# In-memory audit log store (replace with database in production).
+# Entries live in a fixed-size ring buffer laid out as one list per column;
+# the entry with sequence number `seq` occupies slot `seq % MAX_AUDIT_LOGS`.
+# Pydantic AuditLog objects are only built for rows returned to callers.
 MAX_AUDIT_LOGS = 1000
-audit_logs: deque[AuditLog] = deque(maxlen=MAX_AUDIT_LOGS)
+_timestamps: list[float] = [0.0] * MAX_AUDIT_LOGS
+_usernames: list[Optional[str]] = [None] * MAX_AUDIT_LOGS
+_action_codes = array("I", [0]) * MAX_AUDIT_LOGS
+_resource_types: list[Optional[str]] = [None] * MAX_AUDIT_LOGS
+_resource_ids: list[Optional[str]] = [None] * MAX_AUDIT_LOGS
+_details: list[Optional[str]] = [None] * MAX_AUDIT_LOGS
+_ip_addresses: list[Optional[str]] = [None] * MAX_AUDIT_LOGS
+_successes: list[bool] = [True] * MAX_AUDIT_LOGS
+
+# Action strings are interned to small integer codes so the action column is
+# a compact array and filtering compares integers. Codes are assigned on first
+# use, which keeps ad-hoc action names working alongside AuditAction's.
+_action_names: list[str] = [
+    value for name, value in vars(AuditAction).items() if not name.startswith("_")
+]
+_action_lookup: dict[str, int] = {name: code for code, name in enumerate(_action_names)}
+
+# Guards the columns, sequence numbers and indexes below. Sync endpoints run
+# in the threadpool, so entries can be logged and read from several threads.
+_lock = threading.Lock()
+
+# Sequence number of the next entry, and of the first entry after the last clear
+_log_seq = 0
+_first_seq = 0
+
+# Secondary indexes of sequence numbers so filtered queries only touch
+# matching entries. Overwritten entries are skipped lazily by comparing their
+# sequence number against the oldest live one. Usernames can come from
+# unauthenticated requests (failed logins), so an entry is also dropped from
+# its user's index when its slot is reused, and empty user keys are removed;
+# the index never holds more users than live entries.
+_by_user: defaultdict[str, deque[int]] = defaultdict(
+    lambda: deque(maxlen=MAX_AUDIT_LOGS)
+)
+_by_action: defaultdict[int, deque[int]] = defaultdict(
+    lambda: deque(maxlen=MAX_AUDIT_LOGS)
+)
+
+
+def _action_code(action: str) -> int:
+    """Return the integer code for an action string, assigning one if new."""
+    code = _action_lookup.get(action)
+    if code is None:
+        code = len(_action_names)
+        _action_names.append(action)
+        _action_lookup[action] = code
+    return code
+
+
+def _oldest_live_seq() -> int:
+    """Sequence number of the oldest entry still held in the ring buffer."""
+    return max(_first_seq, _log_seq - MAX_AUDIT_LOGS)
+
+
+def _unindex_user(seq: int, username: Optional[str]):
+    """Drop an entry that is being overwritten from its user's index."""
+    if not username:
+        return
+    seqs = _by_user.get(username)
+    # The overwritten entry is the oldest, so it can only be first in line;
+    # it is absent if the index was cleared since it was logged
+    if seqs and seqs[0] == seq:
+        seqs.popleft()
+        if not seqs:
+            del _by_user[username]
+
+
+def _materialize(seq: int) -> AuditLog:
+    """Build the AuditLog model for a stored entry."""
+    slot = seq % MAX_AUDIT_LOGS
+    return AuditLog.model_construct(
+        id=str(seq),
+        timestamp=datetime.fromtimestamp(_timestamps[slot], timezone.utc),
+        username=_usernames[slot],
+        action=_action_names[_action_codes[slot]],
+        resource_type=_resource_types[slot],
+        resource_id=_resource_ids[slot],
+        details=_details[slot],
+        ip_address=_ip_addresses[slot],
+        success=_successes[slot]
+    )
 
 
 def log_action(
@@ -55,21 +140,67 @@ def log_action(
     details: Optional[str] = None,
     ip_address: Optional[str] = None,
     success: bool = True
-) -> AuditLog:
-    """Log an audit event."""
-    entry = AuditLog(
-        id=str(uuid.uuid4()),
-        timestamp=datetime.now(timezone.utc),
-        username=username,
-        action=action,
-        resource_type=resource_type,
-        resource_id=resource_id,
-        details=details,
-        ip_address=ip_address,
-        success=success
-    )
-    audit_logs.append(entry)
-    return entry
+) -> str:
+    """
+    Log an audit event.
+
+    Only the raw column values are stored; the AuditLog model is built
+    when the entry is read back through get_audit_logs.
+
+    Returns:
+        The id of the new entry
+    """
+    global _log_seq
+    timestamp = time.time()
+    with _lock:
+        seq = _log_seq
+        slot = seq % MAX_AUDIT_LOGS
+        if seq >= MAX_AUDIT_LOGS:
+            _unindex_user(seq - MAX_AUDIT_LOGS, _usernames[slot])
+        _timestamps[slot] = timestamp
+        _usernames[slot] = username
+        action_code = _action_code(action)
+        _action_codes[slot] = action_code
+        _resource_types[slot] = resource_type
+        _resource_ids[slot] = resource_id
+        _details[slot] = details
+        _ip_addresses[slot] = ip_address
+        _successes[slot] = success
+        _log_seq = seq + 1
+
+        if username:
+            _by_user[username].append(seq)
+        _by_action[action_code].append(seq)
+    return str(seq)
+
+
+def _scan(
+    candidates: Iterable[int],
+    oldest_live_seq: int,
+    username: Optional[str],
+    action_code: Optional[int],
+    limit: int
+) -> list[int]:
+    """
+    Return up to `limit` sequence numbers from `candidates` matching the filters.
+
+    Only integer codes and username strings are compared, so the loop never
+    builds a Python object per row beyond the column lookups.
+    `candidates` must be ordered newest-first.
+    """
+    matches: list[int] = []
+    for seq in candidates:
+        if seq < oldest_live_seq:
+            break
+        slot = seq % MAX_AUDIT_LOGS
+        if action_code is not None and _action_codes[slot] != action_code:
+            continue
+        if username is not None and _usernames[slot] != username:
+            continue
+        matches.append(seq)
+        if len(matches) >= limit:
+            break
+    return matches
 
 
 def get_audit_logs(
@@ -77,21 +208,40 @@ def get_audit_logs(
     action: Optional[str] = None,
     limit: int = 100
 ) -> list[AuditLog]:
-    """Retrieve audit logs with optional filtering."""
-    filtered = list(audit_logs)
-
-    if username:
-        filtered = [log for log in filtered if log.username == username]
-
-    if action:
-        filtered = [log for log in filtered if log.action == action]
-
-    # Return most recent entries first
-    filtered.reverse()
-
-    return filtered[:limit]
+    """Retrieve audit logs with optional filtering, most recent first."""
+    if limit <= 0:
+        return []
+
+    username = username or None
+
+    with _lock:
+        action_code = None
+        if action:
+            action_code = _action_lookup.get(action)
+            if action_code is None:
+                return []
+
+        oldest_live_seq = _oldest_live_seq()
+        if username is not None or action_code is not None:
+            # Walk the smallest applicable index newest-to-oldest
+            indexes = []
+            if username is not None:
+                indexes.append(_by_user.get(username, ()))
+            if action_code is not None:
+                indexes.append(_by_action.get(action_code, ()))
+            candidates = reversed(min(indexes, key=len))
+        else:
+            candidates = range(_log_seq - 1, oldest_live_seq - 1, -1)
+
+        # Filter on the raw columns and only materialize matching rows
+        matches = _scan(candidates, oldest_live_seq, username, action_code, limit)
+        return [_materialize(seq) for seq in matches]
 
 
 def clear_audit_logs():
     """Clear all audit logs (for testing only)."""
-    audit_logs.clear()
+    global _first_seq
+    with _lock:
+        _first_seq = _log_seq
+        _by_user.clear()
+        _by_action.clear()
@@ -2,15 +2,32 @@
 Authentication and authorization module for CEW Training Platform.
 Implements JWT-based authentication with role-based access control.
 """
-from datetime import datetime, timedelta, timezone
-from typing import Optional
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+from functools import lru_cache
+from typing import Iterable, Optional
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from pydantic import BaseModel
 from jose import JWTError, jwt
 from passlib.context import CryptContext
+import asyncio
+import base64
+import binascii
+import hashlib
+import hmac
+import json
 import secrets
 import os
+import sys
+import threading
+import time
+
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
 
 # Security configuration
 # In production, set CEW_SECRET_KEY environment variable
@@ -18,8 +35,23 @@ SECRET_KEY = os.environ.get("CEW_SECRET_KEY", secrets.token_urlsafe(32))
 ALGORITHM = "HS256"
 ACCESS_TOKEN_EXPIRE_MINUTES = 60
 
+# Built once and shared by every encode/decode call
+_ALGORITHMS = (ALGORITHM,)
+_EXPIRE_DEFAULT_SECONDS = ACCESS_TOKEN_EXPIRE_MINUTES * 60
+
+# The key and algorithm never change at runtime, so tokens are verified with
+# hmac directly instead of going through jose's per-call dispatch.
+_HS256_KEY = SECRET_KEY.encode()
+
+# bcrypt work factor. Each +1 doubles hashing/verify cost; 10 keeps login
+# latency low while staying within OWASP's recommended minimum. Hashes created
+# with other round counts still verify. Override with CEW_BCRYPT_ROUNDS.
+BCRYPT_ROUNDS = int(os.environ.get("CEW_BCRYPT_ROUNDS", "10"))
+
 # Password hashing context
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+pwd_context = CryptContext(
+    schemes=["bcrypt"], bcrypt__rounds=BCRYPT_ROUNDS, deprecated="auto"
+)
 
 # HTTP Bearer token scheme
 security = HTTPBearer()
@@ -80,6 +112,20 @@ class LoginRequest(BaseModel):
 
 users_db: dict[str, UserInDB] = {}
 
+# Public User projection of each stored user, built once per stored record
+_user_views: dict[str, User] = {}
+
+# Immutable list_users() snapshot, rebuilt copy-on-write under _users_lock
+# whenever users are created or deleted so readers never need the lock
+_users_snapshot: tuple[User, ...] = ()
+_users_lock = threading.Lock()
+
+
+def _refresh_users_snapshot():
+    """Rebuild the list_users() snapshot; callers must hold _users_lock."""
+    global _users_snapshot
+    _users_snapshot = tuple(_public_user(user) for user in users_db.values())
+
 
 def _init_default_users():
     """Initialize default users for development."""
@@ -106,9 +152,14 @@ def _init_default_users():
             role=UserRole.TRAINEE
         ),
     ]
-    for user in default_users:
-        if user.username not in users_db:
-            create_user(user)
+    missing = [user for user in default_users if user.username not in users_db]
+    if not missing:
+        return
+    # bcrypt releases the GIL, so the hashes genuinely run in parallel
+    with ThreadPoolExecutor(max_workers=len(missing)) as pool:
+        hashes = list(pool.map(get_password_hash, [user.password for user in missing]))
+    for user, hashed_password in zip(missing, hashes):
+        _store_user(user, hashed_password)
 
 
 def get_password_hash(password: str) -> str:
@@ -121,15 +172,36 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     return pwd_context.verify(plain_password, hashed_password)
 
 
-def create_user(user_data: UserCreate) -> User:
-    """Create a new user."""
-    if user_data.username in users_db:
+async def get_password_hash_async(password: str) -> str:
+    """Hash a password in a worker thread so the event loop stays responsive."""
+    return await asyncio.to_thread(pwd_context.hash, password)
+
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    """Verify a password in a worker thread so the event loop stays responsive."""
+    return await asyncio.to_thread(pwd_context.verify, plain_password, hashed_password)
+
+
+def _check_username_available(username: str):
+    """Raise if a username is already registered."""
+    if username in users_db:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Username already registered"
         )
 
-    hashed_password = get_password_hash(user_data.password)
+
+async def create_user(user_data: UserCreate) -> User:
+    """Create a new user."""
+    _check_username_available(user_data.username)
+    hashed_password = await get_password_hash_async(user_data.password)
+    # Re-check: another request may have registered the name while hashing
+    _check_username_available(user_data.username)
+    return _store_user(user_data, hashed_password)
+
+
+def _store_user(user_data: UserCreate, hashed_password: str) -> User:
+    """Store a user record with an already-computed password hash."""
     user_in_db = UserInDB(
         username=user_data.username,
         email=user_data.email,
@@ -137,8 +209,34 @@ def create_user(user_data: UserCreate) -> User:
         role=user_data.role,
         hashed_password=hashed_password
     )
-    users_db[user_data.username] = user_in_db
-    return User(**user_in_db.model_dump(exclude={"hashed_password"}))
+    # Interned keys let dict lookups short-circuit on identity
+    username = sys.intern(user_data.username)
+    with _users_lock:
+        users_db[username] = user_in_db
+        _user_views.pop(username, None)
+        _refresh_users_snapshot()
+    return _public_user(user_in_db)
+
+
+def _public_user(user: UserInDB) -> User:
+    """
+    Return the public model of a stored user, without the password hash.
+
+    The projection is built once per stored record and then shared, so
+    callers must treat the returned User as read-only.
+    """
+    view = _user_views.get(user.username)
+    if view is None:
+        # Fields were validated when the UserInDB was built, so skip revalidation
+        view = User.model_construct(
+            username=user.username,
+            email=user.email,
+            full_name=user.full_name,
+            role=user.role,
+            disabled=user.disabled
+        )
+        _user_views[user.username] = view
+    return view
 
 
 def get_user(username: str) -> Optional[UserInDB]:
@@ -146,12 +244,12 @@ def get_user(username: str) -> Optional[UserInDB]:
     return users_db.get(username)
 
 
-def authenticate_user(username: str, password: str) -> Optional[UserInDB]:
+async def authenticate_user(username: str, password: str) -> Optional[UserInDB]:
     """Authenticate a user by username and password."""
     user = get_user(username)
     if not user:
         return None
-    if not verify_password(password, user.hashed_password):
+    if not await verify_password_async(password, user.hashed_password):
         return None
     return user
 
@@ -159,47 +257,156 @@ def authenticate_user(username: str, password: str) -> Optional[UserInDB]:
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -> str:
     """Create a JWT access token."""
     to_encode = data.copy()
-    if expires_delta:
-        expire = datetime.now(timezone.utc) + expires_delta
-    else:
-        expire = datetime.now(timezone.utc) + timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
-    to_encode.update({"exp": expire})
+    # JWT "exp" is epoch seconds, so skip building aware datetimes
+    lifetime = int(expires_delta.total_seconds()) if expires_delta else _EXPIRE_DEFAULT_SECONDS
+    to_encode["exp"] = int(time.time()) + lifetime
     encoded_jwt = jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
     return encoded_jwt
 
 
-async def get_current_user(
-    credentials: HTTPAuthorizationCredentials = Depends(security)
-) -> User:
-    """Get the current user from JWT token."""
-    credentials_exception = HTTPException(
+# NumericDate claims python-jose requires to be numbers, with its names
+_NUMERIC_DATE_CLAIMS = (
+    ("exp", "Expiration Time"),
+    ("iat", "Issued At"),
+    ("nbf", "Not Before"),
+)
+
+
+def _b64url_decode(segment: str) -> bytes:
+    """Decode an unpadded base64url JWT segment."""
+    return base64.urlsafe_b64decode(segment + "=" * (-len(segment) % 4))
+
+
+def _verify_hs256(token: str) -> dict:
+    """
+    Verify an HS256 JWT signed with SECRET_KEY and return its claims.
+
+    Applies the same registered-claim checks python-jose does by default
+    that do not depend on the current time: exp, iat and nbf must be
+    numeric, sub and jti must be strings, and aud must be absent. The
+    exp and nbf times are checked in decode_token.
+
+    Raises:
+        JWTError: If the token is malformed, uses another algorithm, its
+            signature does not match, or a claim has the wrong type
+    """
+    try:
+        signing_input, _, signature_segment = token.rpartition(".")
+        header_segment, _, payload_segment = signing_input.partition(".")
+        header = _json_loads(_b64url_decode(header_segment))
+        signature = _b64url_decode(signature_segment)
+    except (ValueError, TypeError, binascii.Error):
+        raise JWTError("Invalid token format.")
+    if not isinstance(header, dict) or header.get("alg") not in _ALGORITHMS:
+        raise JWTError("The specified alg value is not allowed")
+    expected = hmac.new(_HS256_KEY, signing_input.encode(), hashlib.sha256).digest()
+    if not hmac.compare_digest(signature, expected):
+        raise JWTError("Signature verification failed.")
+    try:
+        payload = _json_loads(_b64url_decode(payload_segment))
+    except (ValueError, TypeError, binascii.Error):
+        raise JWTError("Invalid payload string.")
+    if not isinstance(payload, dict):
+        raise JWTError("Invalid payload string: must be a json object")
+    for claim, name in _NUMERIC_DATE_CLAIMS:
+        value = payload.get(claim)
+        if value is not None and not isinstance(value, (int, float)):
+            raise JWTError(f"{name} claim ({claim}) must be an integer.")
+    if "aud" in payload:
+        # No audience is configured, so any token naming one is not for us
+        raise JWTError("Invalid audience")
+    if "sub" in payload and not isinstance(payload["sub"], str):
+        raise JWTError("Subject must be a string.")
+    if "jti" in payload and not isinstance(payload["jti"], str):
+        raise JWTError("JWT ID must be a string.")
+    return payload
+
+
+@lru_cache(maxsize=1024)
+def _decode_cached(token: str) -> dict:
+    """
+    Verify a JWT, memoized by the raw token string.
+
+    Invalid tokens raise JWTError, which lru_cache never stores, so only
+    payloads with a valid signature are cached.
+    """
+    return _verify_hs256(token)
+
+
+def decode_token(token: str) -> dict:
+    """
+    Decode a JWT, reusing the cached parse for tokens seen before.
+
+    The signature and claim types are verified once per token; the exp and
+    nbf times are time-dependent and are therefore re-checked on every
+    call, including cache hits.
+
+    Raises:
+        JWTError: If the token is invalid, has expired, or is not yet valid
+    """
+    payload = _decode_cached(token)
+    now = time.time()
+    exp = payload.get("exp")
+    if exp is not None and exp <= now:
+        raise JWTError("Signature has expired.")
+    nbf = payload.get("nbf")
+    if nbf is not None and nbf > now:
+        raise JWTError("The token is not yet valid (nbf)")
+    return payload
+
+
+def clear_token_cache():
+    """Drop all cached token payloads (forced logout / tests)."""
+    _decode_cached.cache_clear()
+
+
+def _credentials_exception() -> HTTPException:
+    """Build the 401 raised for missing, invalid or expired credentials."""
+    return HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Could not validate credentials",
         headers={"WWW-Authenticate": "Bearer"},
     )
+
+
+async def get_current_user(
+    credentials: HTTPAuthorizationCredentials = Depends(security)
+) -> User:
+    """Get the current user from JWT token."""
+    # Runs on every authenticated request: work with the plain payload dict
+    # and only build exception objects on the failure path.
     try:
-        token = credentials.credentials
-        payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
-        username: str = payload.get("sub")
-        if username is None:
-            raise credentials_exception
-        token_data = TokenData(username=username, role=payload.get("role"))
+        payload = decode_token(credentials.credentials)
     except JWTError:
-        raise credentials_exception
+        raise _credentials_exception()
+    username: Optional[str] = payload.get("sub")
+    if username is None:
+        raise _credentials_exception()
 
-    user = get_user(token_data.username)
+    user = get_user(username)
     if user is None:
-        raise credentials_exception
+        raise _credentials_exception()
     if user.disabled:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="User account is disabled"
         )
-    return User(**user.model_dump(exclude={"hashed_password"}))
+    return _public_user(user)
+
+
+def require_role(allowed_roles: Iterable[str]):
+    """
+    Dependency to require specific roles.
+
+    Routes that allow the same set of roles share one checker, so FastAPI
+    resolves it once per request and route registration reuses it.
+    """
+    return _role_checker(frozenset(allowed_roles))
 
 
-def require_role(allowed_roles: list[str]):
-    """Dependency to require specific roles."""
+@lru_cache(maxsize=16)
+def _role_checker(allowed_roles: frozenset[str]):
+    """Build (once per distinct role set) the role-checking dependency."""
     async def role_checker(current_user: User = Depends(get_current_user)) -> User:
         if current_user.role not in allowed_roles:
             raise HTTPException(
@@ -210,20 +417,20 @@ def require_role(allowed_roles: list[str]):
     return role_checker
 
 
-def list_users() -> list[User]:
+def list_users() -> tuple[User, ...]:
     """List all users (excluding passwords)."""
-    return [
-        User(**user.model_dump(exclude={"hashed_password"}))
-        for user in users_db.values()
-    ]
+    return _users_snapshot
 
 
 def delete_user(username: str) -> bool:
     """Delete a user by username."""
-    if username in users_db:
+    with _users_lock:
+        if username not in users_db:
+            return False
         del users_db[username]
-        return True
-    return False
+        _user_views.pop(username, None)
+        _refresh_users_snapshot()
+    return True
 
 
 def get_user_from_token(token: str) -> Optional[User]:
@@ -238,7 +445,7 @@ def get_user_from_token(token: str) -> Optional[User]:
         User object if token is valid, None otherwise
     """
     try:
-        payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
+        payload = decode_token(token)
         username: str = payload.get("sub")
         if username is None:
             return None
@@ -247,7 +454,7 @@ def get_user_from_token(token: str) -> Optional[User]:
         if user is None or user.disabled:
             return None
 
-        return User(**user.model_dump(exclude={"hashed_password"}))
+        return _public_user(user)
     except JWTError:
         return None
 
@@ -6,18 +6,86 @@ lab state snapshots, and one-click restore functionality.
 """
 
 from enum import Enum
+from collections import Counter, defaultdict, deque
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Any, Union
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, Union
 import json
 import yaml
 import gzip
 import base64
+import bisect
+import calendar
 import hashlib
-import uuid
+import heapq
+import io
+import itertools
+import logging
+import ssl
+import struct
+import secrets
+import threading
+import zlib
 from pathlib import Path
 import os
 
+try:
+    import zstandard
+    ZSTD_AVAILABLE = True
+except ImportError:
+    ZSTD_AVAILABLE = False
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# libyaml's C loader and dumper are much faster than PyYAML's pure-Python ones
+try:
+    from yaml import CSafeDumper as _YamlDumper, CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeDumper as _YamlDumper, SafeLoader as _YamlLoader
+
+try:
+    import google_crc32c
+    CRC32C_AVAILABLE = True
+except ImportError:
+    CRC32C_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+# zstd level 3 compresses several times faster than gzip at a similar ratio
+ZSTD_LEVEL = 3
+
+# Marks threads of the backup worker pools. The pools already spread work
+# over the cores, so compression inside them stays single-threaded rather
+# than starting zstd worker threads per stream.
+_pool_worker = threading.local()
+
+
+def _mark_pool_worker():
+    _pool_worker.active = True
+
+
+def _worker_pool(max_workers: int) -> ThreadPoolExecutor:
+    """Create a thread pool whose threads compress single-threaded."""
+    return ThreadPoolExecutor(max_workers=max_workers, initializer=_mark_pool_worker)
+
+
+def _new_sha256(data: bytes = b""):
+    """
+    Create a SHA-256 hasher for integrity checksums.
+    
+    usedforsecurity=False lets OpenSSL pick its fastest provider (SHA-NI
+    where the CPU has it); the digests only detect corruption.
+    """
+    return hashlib.new("sha256", data, usedforsecurity=False)
+
+
+logger.debug("Backup checksums use SHA-256 from %s", ssl.OPENSSL_VERSION)
+
 
 class BackupType(Enum):
     """Types of backups."""
@@ -52,10 +120,130 @@ class CompressionType(Enum):
     """Compression algorithms."""
     NONE = "none"
     GZIP = "gzip"
+    ZSTD = "zstd"
+
+
+class ChecksumType(Enum):
+    """Integrity checksum algorithms."""
+    SHA256 = "sha256"
+    CRC32C = "crc32c"  # Hardware-accelerated, corruption detection only
+
+
+def _json_dumps(data: Any, indent: bool = False) -> bytes:
+    """Encode data as UTF-8 JSON, stringifying values JSON can't represent."""
+    if ORJSON_AVAILABLE:
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if indent else 0)
+        try:
+            return orjson.dumps(data, default=str, option=option)
+        except orjson.JSONEncodeError:
+            pass  # e.g. integers beyond 64 bits; the stdlib encoder handles them
+    return json.dumps(data, default=str, indent=2 if indent else None).encode("utf-8")
+
+
+def _json_loads(data: Union[bytes, str]) -> Any:
+    """Decode JSON from bytes or str."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+# Chunk size used when streaming payloads through the compressor
+_STREAM_CHUNK_SIZE = 1024 * 1024
+
+# Sectioned payloads: _SECTION_MAGIC followed by one frame per top-level key,
+# each framed as [u16 name length][name][u8 compression][u32 length][payload]
+_SECTION_MAGIC = b"CEWSECT1"
+_SECTION_HEADER = struct.Struct(">BI")
+_SECTION_NAME_LENGTH = struct.Struct(">H")
+_SECTION_COMPRESSION = [CompressionType.NONE, CompressionType.GZIP, CompressionType.ZSTD]
+_MAX_SECTION_WORKERS = 4
+_MAX_SCHEDULE_WORKERS = 8
+
+# Incremental payloads: _INCREMENTAL_MAGIC followed by a JSON manifest that
+# points at per-record and per-chunk blobs in the blob store
+_INCREMENTAL_MAGIC = b"CEWINCR1"
+# List chunks end after any item whose CRC-32 has these low bits clear, so
+# boundaries follow content and resync after inserts (~64 items per chunk)
+_CHUNK_BOUNDARY_MASK = 0x3F
+
+
+class _Crc32cHasher:
+    """hashlib-style wrapper around google_crc32c.Checksum."""
+    
+    def __init__(self, data: bytes = b""):
+        self._checksum = google_crc32c.Checksum(data)
+    
+    def update(self, data):
+        self._checksum.update(data)
+    
+    def hexdigest(self) -> str:
+        return self._checksum.hexdigest().decode("ascii")
+
+
+def _new_hasher(algo: ChecksumType, data: bytes = b""):
+    """Create a hasher for the given checksum algorithm."""
+    if algo == ChecksumType.CRC32C:
+        if not CRC32C_AVAILABLE:
+            raise ValueError("crc32c checksums require the google-crc32c package")
+        return _Crc32cHasher(data)
+    return _new_sha256(data)
+
+
+class _HashingBuffer(io.BytesIO):
+    """In-memory byte sink that hashes everything written to it."""
+    
+    def __init__(self, algo: ChecksumType = ChecksumType.SHA256):
+        super().__init__()
+        self._hasher = _new_hasher(algo)
+    
+    def write(self, data) -> int:
+        self._hasher.update(data)
+        return super().write(data)
+    
+    def hexdigest(self) -> str:
+        return self._hasher.hexdigest()
+
+
+# Backup types whose checksums only guard against silent corruption, so
+# scheduled runs use the much faster CRC32C when it is available
+_INTEGRITY_ONLY_TYPES = frozenset({BackupType.LAB_STATE})
+
+# to_dict() results are only cached once a record can no longer change status
+_TERMINAL_BACKUP_STATUSES = frozenset(
+    {BackupStatus.COMPLETED, BackupStatus.VERIFIED, BackupStatus.FAILED}
+)
+_TERMINAL_RESTORE_STATUSES = frozenset(
+    {RestoreStatus.COMPLETED, RestoreStatus.FAILED, RestoreStatus.PARTIAL}
+)
+
+
+class _DictCacheMixin:
+    """
+    Memoizes to_dict() for dataclasses.
+    
+    Subclasses implement _build_dict() and may override _dict_cacheable()
+    to only cache once the record has reached a terminal state. Code that
+    changes a record after creation, by assignment or in place, must call
+    _invalidate_dict() so the next to_dict() rebuilds.
+    """
+    
+    def _dict_cacheable(self) -> bool:
+        return True
+    
+    def _invalidate_dict(self):
+        self._cached_dict = None
+    
+    def to_dict(self) -> dict:
+        cached = self._cached_dict
+        if cached is None:
+            cached = self._build_dict()
+            if self._dict_cacheable():
+                self._cached_dict = cached
+        return cached
 
 
 @dataclass
-class BackupMetadata:
+class BackupMetadata(_DictCacheMixin):
     """Metadata for a backup."""
     backup_id: str
     backup_type: BackupType
@@ -67,14 +255,20 @@ class BackupMetadata:
     compressed: bool = False
     compression_type: CompressionType = CompressionType.NONE
     checksum: str = ""
+    checksum_algo: ChecksumType = ChecksumType.SHA256
     version: str = "1.0"
     items_count: int = 0
     error_message: Optional[str] = None
     completed_at: Optional[datetime] = None
     retention_days: int = 30
     tags: List[str] = field(default_factory=list)
+    section_checksums: Dict[str, str] = field(default_factory=dict)
+    _cached_dict: Optional[dict] = field(default=None, init=False, repr=False, compare=False)
     
-    def to_dict(self) -> dict:
+    def _dict_cacheable(self) -> bool:
+        return self.status in _TERMINAL_BACKUP_STATUSES
+    
+    def _build_dict(self) -> dict:
         return {
             "backup_id": self.backup_id,
             "backup_type": self.backup_type.value,
@@ -86,20 +280,45 @@ class BackupMetadata:
             "compressed": self.compressed,
             "compression_type": self.compression_type.value,
             "checksum": self.checksum,
+            "checksum_algo": self.checksum_algo.value,
             "version": self.version,
             "items_count": self.items_count,
             "error_message": self.error_message,
             "completed_at": self.completed_at.isoformat() if self.completed_at else None,
             "retention_days": self.retention_days,
-            "tags": self.tags
+            "tags": self.tags,
+            "section_checksums": self.section_checksums
         }
 
 
 @dataclass
 class BackupData:
-    """Container for backup data."""
+    """
+    Container for backup data.
+    
+    The serialized (and possibly compressed) payload lives in the manager's
+    content-addressed blob store, shared with any backup holding identical
+    blobs. `payload` reassembles it from the blob digests and `data` decodes
+    it on each access using the manager's deserializer.
+    """
     metadata: BackupMetadata
-    data: Dict[str, Any] = field(default_factory=dict)
+    blob_digests: Tuple[str, ...]
+    _load: Callable[[Tuple[str, ...]], bytes] = field(repr=False, compare=False)
+    _decode: Callable[[bytes, bool, CompressionType], Dict] = field(
+        repr=False, compare=False
+    )
+    # Record and chunk blobs an incremental payload points at
+    ref_digests: Tuple[str, ...] = ()
+    
+    @property
+    def payload(self) -> bytes:
+        return self._load(self.blob_digests)
+    
+    @property
+    def data(self) -> Dict[str, Any]:
+        return self._decode(
+            self.payload, self.metadata.compressed, self.metadata.compression_type
+        )
     
     def to_dict(self) -> dict:
         return {
@@ -109,7 +328,7 @@ class BackupData:
 
 
 @dataclass
-class RestorePoint:
+class RestorePoint(_DictCacheMixin):
     """A restore point in time."""
     restore_id: str
     backup_id: str
@@ -121,8 +340,12 @@ class RestorePoint:
     error_message: Optional[str] = None
     completed_at: Optional[datetime] = None
     rollback_data: Optional[Dict] = None
+    _cached_dict: Optional[dict] = field(default=None, init=False, repr=False, compare=False)
     
-    def to_dict(self) -> dict:
+    def _dict_cacheable(self) -> bool:
+        return self.status in _TERMINAL_RESTORE_STATUSES
+    
+    def _build_dict(self) -> dict:
         return {
             "restore_id": self.restore_id,
             "backup_id": self.backup_id,
@@ -137,7 +360,7 @@ class RestorePoint:
 
 
 @dataclass
-class LabSnapshot:
+class LabSnapshot(_DictCacheMixin):
     """Snapshot of a lab's state."""
     snapshot_id: str
     lab_id: str
@@ -149,8 +372,9 @@ class LabSnapshot:
     networks: List[Dict] = field(default_factory=list)
     environment: Dict = field(default_factory=dict)
     notes: str = ""
+    _cached_dict: Optional[dict] = field(default=None, init=False, repr=False, compare=False)
     
-    def to_dict(self) -> dict:
+    def _build_dict(self) -> dict:
         return {
             "snapshot_id": self.snapshot_id,
             "lab_id": self.lab_id,
@@ -166,7 +390,7 @@ class LabSnapshot:
 
 
 @dataclass
-class BackupSchedule:
+class BackupSchedule(_DictCacheMixin):
     """Automated backup schedule."""
     schedule_id: str
     backup_type: BackupType
@@ -180,8 +404,18 @@ class BackupSchedule:
     last_run: Optional[datetime] = None
     next_run: Optional[datetime] = None
     created_by: str = ""
+    _hour: int = field(default=0, init=False, repr=False, compare=False)
+    _minute: int = field(default=0, init=False, repr=False, compare=False)
+    _cached_dict: Optional[dict] = field(default=None, init=False, repr=False, compare=False)
     
-    def to_dict(self) -> dict:
+    def __post_init__(self):
+        self._parse_time_of_day()
+    
+    def _parse_time_of_day(self):
+        """Cache the hour and minute of time_of_day for next-run calculations."""
+        self._hour, self._minute = map(int, self.time_of_day.split(":"))
+    
+    def _build_dict(self) -> dict:
         return {
             "schedule_id": self.schedule_id,
             "backup_type": self.backup_type.value,
@@ -198,6 +432,47 @@ class BackupSchedule:
         }
 
 
+def _at_schedule_time(schedule: BackupSchedule, day: datetime) -> datetime:
+    """Return `day` at the schedule's time of day."""
+    return day.replace(
+        hour=schedule._hour, minute=schedule._minute, second=0, microsecond=0
+    )
+
+
+def _next_daily_run(schedule: BackupSchedule, now: datetime) -> datetime:
+    next_run = _at_schedule_time(schedule, now)
+    if next_run <= now:
+        next_run += timedelta(days=1)
+    return next_run
+
+
+def _next_weekly_run(schedule: BackupSchedule, now: datetime) -> datetime:
+    days_ahead = (schedule.day_of_week or 0) - now.weekday()
+    if days_ahead <= 0:
+        days_ahead += 7
+    return _at_schedule_time(schedule, now) + timedelta(days=days_ahead)
+
+
+def _next_monthly_run(schedule: BackupSchedule, now: datetime) -> datetime:
+    # Days past the end of a month (e.g. the 31st in February) run on its last day
+    day_of_month = schedule.day_of_month or 1
+    year, month = now.year, now.month
+    day = min(day_of_month, calendar.monthrange(year, month)[1])
+    next_run = _at_schedule_time(schedule, now.replace(day=day))
+    if next_run <= now:
+        year, month = (year + 1, 1) if month == 12 else (year, month + 1)
+        day = min(day_of_month, calendar.monthrange(year, month)[1])
+        next_run = next_run.replace(year=year, month=month, day=day)
+    return next_run
+
+
+_NEXT_RUN_CALCULATORS = {
+    "daily": _next_daily_run,
+    "weekly": _next_weekly_run,
+    "monthly": _next_monthly_run,
+}
+
+
 class BackupManager:
     """
     Manages backup and disaster recovery operations.
@@ -218,6 +493,45 @@ class BackupManager:
         self._lab_snapshots: Dict[str, LabSnapshot] = {}
         self._schedules: Dict[str, BackupSchedule] = {}
         
+        # Secondary indexes over self._backups (backup IDs per value), plus
+        # (created_at, insertion seq, backup_id) keys kept sorted by bisect
+        self._by_type: Dict[BackupType, set] = defaultdict(set)
+        self._by_status: Dict[BackupStatus, set] = defaultdict(set)
+        self._by_creator: Dict[str, set] = defaultdict(set)
+        self._by_tag: Dict[str, set] = defaultdict(set)
+        self._by_created: List[tuple] = []
+        self._created_keys: Dict[str, tuple] = {}
+        self._backup_seq = itertools.count()
+        self._total_size_bytes = 0
+        
+        # Content-addressed payload blobs with reference counts; identical
+        # payloads and full-backup sections are stored once
+        self._blob_store: Dict[str, bytes] = {}
+        self._blob_refs: Dict[str, int] = {}
+        self._blob_bytes = 0
+        
+        # Guards the backup store, its indexes and the blob store so that
+        # scheduled backups can run concurrently; serialization happens
+        # outside the lock
+        self._lock = threading.RLock()
+        
+        # Restore points and lab snapshots kept in creation order the same
+        # way, with ID sets per filterable value
+        self._restores_by_created: List[tuple] = []
+        self._restores_by_backup: Dict[str, set] = defaultdict(set)
+        self._restores_by_status: Dict[RestoreStatus, set] = defaultdict(set)
+        self._snapshots_by_created: List[tuple] = []
+        self._snapshot_keys: Dict[str, tuple] = {}
+        self._snap_by_lab: Dict[str, set] = defaultdict(set)
+        self._snap_by_scenario: Dict[str, set] = defaultdict(set)
+        self._snap_by_creator: Dict[str, set] = defaultdict(set)
+        
+        # Backup IDs produced by each schedule, oldest first, and a min-heap
+        # of (expires_at, insertion seq, backup_id) so retention cleanup only
+        # touches the backups it removes
+        self._schedule_backups: Dict[str, deque] = defaultdict(deque)
+        self._expiry_heap: List[tuple] = []
+        
         # Backup directory (in-memory for prototype, would be filesystem in production)
         self._backup_dir = backup_dir or "/tmp/cew_backups"
         
@@ -225,38 +539,260 @@ class BackupManager:
         self._default_retention_days = 30
         self._max_backup_size_mb = 100
         self._compression_threshold_kb = 100
+        # gzip level used when zstd is unavailable; level 1 is several times
+        # faster than the default 9 for only slightly larger JSON payloads
+        self._gzip_level = 1
         
         # Version for backup format
         self._backup_version = "1.0"
     
-    def _generate_checksum(self, data: bytes) -> str:
-        """Generate SHA-256 checksum for data."""
-        return hashlib.sha256(data).hexdigest()
+    @staticmethod
+    def _new_id() -> str:
+        """Generate a random URL-safe ID (128 random bits, more than uuid4's 122)."""
+        return secrets.token_urlsafe(16)
+    
+    def _generate_checksum(
+        self,
+        data: bytes,
+        algo: ChecksumType = ChecksumType.SHA256
+    ) -> str:
+        """Generate a checksum (SHA-256 by default) for data."""
+        return _new_hasher(algo, data).hexdigest()
+    
+    def _hash_stream(self, chunks, algo: ChecksumType = ChecksumType.SHA256) -> str:
+        """Generate a checksum over a sequence of byte chunks."""
+        hasher = _new_hasher(algo)
+        for chunk in chunks:
+            hasher.update(chunk)
+        return hasher.hexdigest()
+    
+    def _compress_data(self, data: bytes) -> tuple:
+        """
+        Compress data with zstd, or gzip when zstandard is not installed.
+        
+        Returns:
+            Tuple of (compressed bytes, CompressionType used)
+        """
+        compressed, comp_type, _ = self._compress_and_hash(data)
+        return compressed, comp_type
     
-    def _compress_data(self, data: bytes) -> bytes:
-        """Compress data using gzip."""
-        return gzip.compress(data)
+    def _compress_and_hash(
+        self,
+        data: bytes,
+        algo: ChecksumType = ChecksumType.SHA256
+    ) -> tuple:
+        """
+        Compress data and checksum the compressed output in a single pass.
+        
+        The input is fed to a streaming compressor in chunks and every
+        compressed chunk is hashed as it is written, so the output is never
+        re-read just to compute its checksum.
+        
+        Returns:
+            Tuple of (compressed bytes, CompressionType used, hex digest)
+        """
+        sink = _HashingBuffer(algo)
+        if ZSTD_AVAILABLE:
+            # ZstdCompressor instances must not be shared across threads.
+            # Outside a worker pool, let zstd use every core for one stream.
+            threads = 0 if getattr(_pool_worker, "active", False) else -1
+            compressor = zstandard.ZstdCompressor(level=ZSTD_LEVEL, threads=threads)
+            # The content size must be recorded for one-shot decompression
+            stream = compressor.stream_writer(sink, size=len(data), closefd=False)
+            comp_type = CompressionType.ZSTD
+        else:
+            stream = gzip.GzipFile(fileobj=sink, mode="wb", compresslevel=self._gzip_level)
+            comp_type = CompressionType.GZIP
+        
+        with stream:
+            view = memoryview(data)
+            for offset in range(0, len(view), _STREAM_CHUNK_SIZE):
+                stream.write(view[offset:offset + _STREAM_CHUNK_SIZE])
+        
+        return sink.getvalue(), comp_type, sink.hexdigest()
     
-    def _decompress_data(self, data: bytes) -> bytes:
-        """Decompress gzip data."""
+    def _decompress_data(self, data: bytes, compression_type: CompressionType) -> bytes:
+        """Decompress data written with the given compression type."""
+        if compression_type == CompressionType.ZSTD:
+            if not ZSTD_AVAILABLE:
+                raise ValueError("zstd-compressed backup requires the zstandard package")
+            return zstandard.ZstdDecompressor().decompress(data)
         return gzip.decompress(data)
     
     def _serialize_backup(
         self,
         data: Dict,
-        compress: bool = True
+        compress: bool = True,
+        checksum_algo: ChecksumType = ChecksumType.SHA256
     ) -> tuple:
         """Serialize backup data and optionally compress."""
-        json_data = json.dumps(data, default=str).encode('utf-8')
+        json_data = _json_dumps(data)
         
         if compress and len(json_data) > self._compression_threshold_kb * 1024:
-            compressed = self._compress_data(json_data)
-            checksum = self._generate_checksum(compressed)
-            return compressed, len(compressed), True, CompressionType.GZIP, checksum
+            compressed, comp_type, checksum = self._compress_and_hash(
+                json_data, checksum_algo
+            )
+            return compressed, len(compressed), True, comp_type, checksum
         
-        checksum = self._generate_checksum(json_data)
+        checksum = self._generate_checksum(json_data, checksum_algo)
         return json_data, len(json_data), False, CompressionType.NONE, checksum
     
+    def _serialize_sections(
+        self,
+        data: Dict,
+        compress: bool = True,
+        checksum_algo: ChecksumType = ChecksumType.SHA256
+    ) -> tuple:
+        """
+        Serialize each top-level section of the data independently.
+        
+        Sections are encoded, compressed and checksummed concurrently (json,
+        zstd and gzip release the GIL on large inputs) and then framed into a
+        single container. Each section's frame is returned as a separate
+        blob keyed by its checksum and name, so unchanged sections can be
+        shared between backups.
+        
+        Returns:
+            Tuple of ([(blob key, blob bytes), ...] making up the container,
+            size, compressed, compression type, checksum, per-section checksums)
+        """
+        items = list(data.items())
+        workers = max(1, min(_MAX_SECTION_WORKERS, len(items)))
+        with _worker_pool(workers) as pool:
+            encoded = list(pool.map(
+                lambda item: self._serialize_backup(
+                    item[1], compress=compress, checksum_algo=checksum_algo
+                ),
+                items
+            ))
+        
+        blobs = [(_SECTION_MAGIC.decode("ascii"), _SECTION_MAGIC)]
+        section_checksums = {}
+        comp_type = CompressionType.NONE
+        for (name, _), (payload, size, compressed, section_type, checksum) in zip(
+            items, encoded
+        ):
+            name_bytes = str(name).encode("utf-8")
+            frame = b"".join((
+                _SECTION_NAME_LENGTH.pack(len(name_bytes)),
+                name_bytes,
+                _SECTION_HEADER.pack(_SECTION_COMPRESSION.index(section_type), size),
+                payload
+            ))
+            blobs.append((f"{checksum_algo.value}:{checksum}:{name}", frame))
+            section_checksums[str(name)] = checksum
+            if compressed:
+                comp_type = section_type
+        
+        checksum = self._hash_stream((blob for _, blob in blobs), checksum_algo)
+        size = sum(len(blob) for _, blob in blobs)
+        compressed = comp_type != CompressionType.NONE
+        return blobs, size, compressed, comp_type, checksum, section_checksums
+    
+    def _deserialize_sections(self, data: bytes) -> Dict:
+        """Parse a sectioned container and decode its sections concurrently."""
+        sections = []
+        offset = len(_SECTION_MAGIC)
+        while offset < len(data):
+            (name_length,) = _SECTION_NAME_LENGTH.unpack_from(data, offset)
+            offset += _SECTION_NAME_LENGTH.size
+            name = data[offset:offset + name_length].decode("utf-8")
+            offset += name_length
+            compression, size = _SECTION_HEADER.unpack_from(data, offset)
+            offset += _SECTION_HEADER.size
+            section_type = _SECTION_COMPRESSION[compression]
+            sections.append((name, data[offset:offset + size], section_type))
+            offset += size
+        
+        workers = max(1, min(_MAX_SECTION_WORKERS, len(sections)))
+        with _worker_pool(workers) as pool:
+            values = list(pool.map(
+                lambda section: self._deserialize_backup(
+                    section[1], section[2] != CompressionType.NONE, section[2]
+                ),
+                sections
+            ))
+        return {name: value for (name, _, _), value in zip(sections, values)}
+    
+    def _record_blob(self, blob: bytes) -> tuple:
+        """Key a record or chunk blob by its SHA-256 digest."""
+        return f"{ChecksumType.SHA256.value}:{self._generate_checksum(blob)}", blob
+    
+    def _chunk_list(self, items: list) -> List[bytes]:
+        """Split a list into JSON array chunks at content-defined item boundaries."""
+        chunks = []
+        current = []
+        for item in items:
+            encoded = _json_dumps(item)
+            current.append(encoded)
+            if zlib.crc32(encoded) & _CHUNK_BOUNDARY_MASK == 0:
+                chunks.append(b"[" + b",".join(current) + b"]")
+                current = []
+        if current:
+            chunks.append(b"[" + b",".join(current) + b"]")
+        return chunks
+    
+    def _serialize_incremental(
+        self,
+        data: Dict,
+        checksum_algo: ChecksumType = ChecksumType.SHA256
+    ) -> tuple:
+        """
+        Serialize data as a manifest of pointers to content-addressed blobs.
+        
+        Each record of a dict section and each content-defined chunk of a
+        list section becomes its own blob, so records unchanged since an
+        earlier backup are already in the blob store and add no new bytes.
+        Other values are stored inline in the manifest.
+        
+        Returns:
+            Tuple of (manifest container bytes, [(blob key, blob bytes), ...]
+            referenced by the manifest, size, checksum)
+        """
+        manifest = {}
+        references = []
+        for name, value in data.items():
+            if isinstance(value, dict):
+                records = {}
+                for record_id, record in value.items():
+                    key, blob = self._record_blob(_json_dumps(record))
+                    records[str(record_id)] = key
+                    references.append((key, blob))
+                manifest[str(name)] = {"records": records}
+            elif isinstance(value, list):
+                chunk_keys = []
+                for chunk in self._chunk_list(value):
+                    key, blob = self._record_blob(chunk)
+                    chunk_keys.append(key)
+                    references.append((key, blob))
+                manifest[str(name)] = {"chunks": chunk_keys}
+            else:
+                manifest[str(name)] = {"value": value}
+        
+        container = _INCREMENTAL_MAGIC + _json_dumps(manifest)
+        checksum = self._generate_checksum(container, checksum_algo)
+        size = len(container) + sum(len(blob) for _, blob in references)
+        return container, references, size, checksum
+    
+    def _deserialize_incremental(self, data: bytes) -> Dict:
+        """Resolve an incremental manifest's pointers back into the full data."""
+        manifest = _json_loads(data[len(_INCREMENTAL_MAGIC):])
+        result = {}
+        for name, entry in manifest.items():
+            if "records" in entry:
+                result[name] = {
+                    record_id: _json_loads(self._blob_store[key])
+                    for record_id, key in entry["records"].items()
+                }
+            elif "chunks" in entry:
+                items = []
+                for key in entry["chunks"]:
+                    items.extend(_json_loads(self._blob_store[key]))
+                result[name] = items
+            else:
+                result[name] = entry["value"]
+        return result
+    
     def _deserialize_backup(
         self,
         data: bytes,
@@ -264,9 +800,13 @@ class BackupManager:
         compression_type: CompressionType
     ) -> Dict:
         """Deserialize backup data."""
-        if compressed and compression_type == CompressionType.GZIP:
-            data = self._decompress_data(data)
-        return json.loads(data.decode('utf-8'))
+        if data.startswith(_SECTION_MAGIC):
+            return self._deserialize_sections(data)
+        if data.startswith(_INCREMENTAL_MAGIC):
+            return self._deserialize_incremental(data)
+        if compressed and compression_type != CompressionType.NONE:
+            data = self._decompress_data(data, compression_type)
+        return _json_loads(data)
     
     def create_backup(
         self,
@@ -275,7 +815,9 @@ class BackupManager:
         description: str = "",
         data: Optional[Dict] = None,
         tags: Optional[List[str]] = None,
-        retention_days: int = 30
+        retention_days: int = 30,
+        sectioned: bool = False,
+        checksum_algo: ChecksumType = ChecksumType.SHA256
     ) -> BackupMetadata:
         """
         Create a new backup.
@@ -287,12 +829,18 @@ class BackupManager:
             data: Data to backup (scenarios, users, config, etc.)
             tags: Tags for categorization
             retention_days: Days to retain backup
+            sectioned: Serialize each top-level key as a separate section,
+                in parallel, with its own checksum
+            checksum_algo: Integrity checksum algorithm; CRC32C falls back
+                to SHA-256 when google-crc32c is not installed
         
         Returns:
             BackupMetadata for the created backup
         """
-        backup_id = str(uuid.uuid4())
+        backup_id = self._new_id()
         now = datetime.utcnow()
+        if checksum_algo == ChecksumType.CRC32C and not CRC32C_AVAILABLE:
+            checksum_algo = ChecksumType.SHA256
         
         # Create metadata
         metadata = BackupMetadata(
@@ -304,7 +852,8 @@ class BackupManager:
             status=BackupStatus.IN_PROGRESS,
             version=self._backup_version,
             retention_days=retention_days,
-            tags=tags or []
+            tags=tags or [],
+            checksum_algo=checksum_algo
         )
         
         try:
@@ -314,9 +863,23 @@ class BackupManager:
             backup_data["_backup_type"] = backup_type.value
             
             # Serialize and optionally compress
-            serialized, size, compressed, comp_type, checksum = self._serialize_backup(
-                backup_data
-            )
+            references = []
+            if backup_type == BackupType.INCREMENTAL:
+                serialized, references, size, checksum = self._serialize_incremental(
+                    backup_data, checksum_algo=checksum_algo
+                )
+                compressed, comp_type = False, CompressionType.NONE
+                blobs = [(f"{checksum_algo.value}:{checksum}", serialized)]
+            elif sectioned:
+                (blobs, size, compressed, comp_type, checksum,
+                 metadata.section_checksums) = self._serialize_sections(
+                    backup_data, checksum_algo=checksum_algo
+                )
+            else:
+                serialized, size, compressed, comp_type, checksum = self._serialize_backup(
+                    backup_data, checksum_algo=checksum_algo
+                )
+                blobs = [(f"{checksum_algo.value}:{checksum}", serialized)]
             
             # Update metadata
             metadata.size_bytes = size
@@ -327,18 +890,47 @@ class BackupManager:
             metadata.status = BackupStatus.COMPLETED
             metadata.completed_at = datetime.utcnow()
             
-            # Store backup
-            self._backups[backup_id] = BackupData(
-                metadata=metadata,
-                data=backup_data
-            )
+            # Store backup, sharing blobs already held by other backups
+            with self._lock:
+                self._backups[backup_id] = BackupData(
+                    metadata=metadata,
+                    blob_digests=tuple(self._put_blob(key, blob) for key, blob in blobs),
+                    _load=self._load_blobs,
+                    _decode=self._deserialize_backup,
+                    ref_digests=tuple(
+                        self._put_blob(key, blob) for key, blob in references
+                    )
+                )
+                self._index_backup(metadata)
             
         except Exception as e:
             metadata.status = BackupStatus.FAILED
             metadata.error_message = str(e)
+            metadata._invalidate_dict()
         
         return metadata
     
+    def create_incremental_backup(
+        self,
+        created_by: str,
+        data: Dict,
+        description: str = ""
+    ) -> BackupMetadata:
+        """
+        Create an incremental backup.
+        
+        Records and list chunks already stored by earlier backups are
+        referenced rather than stored again, so only changed records cost
+        new space.
+        """
+        return self.create_backup(
+            backup_type=BackupType.INCREMENTAL,
+            created_by=created_by,
+            description=description or "Incremental backup",
+            data=data,
+            tags=["incremental"]
+        )
+    
     def create_full_backup(
         self,
         created_by: str,
@@ -361,7 +953,8 @@ class BackupManager:
             created_by=created_by,
             description=description or "Full system backup",
             data=data,
-            tags=["full", "system"]
+            tags=["full", "system"],
+            sectioned=True
         )
     
     def create_scenario_backup(
@@ -379,6 +972,42 @@ class BackupManager:
             tags=["scenarios"]
         )
     
+    def _index_backup(self, metadata: BackupMetadata):
+        """Add a stored backup to the secondary indexes."""
+        backup_id = metadata.backup_id
+        self._total_size_bytes += metadata.size_bytes
+        self._by_type[metadata.backup_type].add(backup_id)
+        self._by_status[metadata.status].add(backup_id)
+        self._by_creator[metadata.created_by].add(backup_id)
+        for tag in metadata.tags:
+            self._by_tag[tag].add(backup_id)
+        key = (metadata.created_at, next(self._backup_seq), backup_id)
+        self._created_keys[backup_id] = key
+        bisect.insort(self._by_created, key)
+        expires_at = metadata.created_at + timedelta(days=metadata.retention_days)
+        heapq.heappush(self._expiry_heap, (expires_at, key[1], backup_id))
+    
+    def _unindex_backup(self, metadata: BackupMetadata):
+        """Remove a backup from the secondary indexes."""
+        backup_id = metadata.backup_id
+        self._total_size_bytes -= metadata.size_bytes
+        self._by_type[metadata.backup_type].discard(backup_id)
+        self._by_status[metadata.status].discard(backup_id)
+        self._by_creator[metadata.created_by].discard(backup_id)
+        for tag in metadata.tags:
+            self._by_tag[tag].discard(backup_id)
+        key = self._created_keys.pop(backup_id)
+        position = bisect.bisect_left(self._by_created, key)
+        del self._by_created[position]
+    
+    def _set_backup_status(self, metadata: BackupMetadata, status: BackupStatus):
+        """Change a stored backup's status, keeping the status index in sync."""
+        with self._lock:
+            self._by_status[metadata.status].discard(metadata.backup_id)
+            metadata.status = status
+            metadata._invalidate_dict()
+            self._by_status[status].add(metadata.backup_id)
+    
     def get_backup(self, backup_id: str) -> Optional[BackupData]:
         """Get a backup by ID."""
         return self._backups.get(backup_id)
@@ -392,34 +1021,124 @@ class BackupManager:
         limit: int = 100
     ) -> List[BackupMetadata]:
         """List backups with optional filters."""
-        backups = list(self._backups.values())
-        
-        if backup_type:
-            backups = [b for b in backups if b.metadata.backup_type == backup_type]
-        
-        if status:
-            backups = [b for b in backups if b.metadata.status == status]
+        with self._lock:
+            # Intersect the index sets for each filter given
+            candidates = None
+            if backup_type:
+                candidates = set(self._by_type.get(backup_type, ()))
+            if status:
+                candidates = self._narrow(candidates, self._by_status.get(status, ()))
+            if created_by:
+                candidates = self._narrow(candidates, self._by_creator.get(created_by, ()))
+            if tags:
+                tagged = set().union(*(self._by_tag.get(t, ()) for t in tags))
+                candidates = self._narrow(candidates, tagged)
+            
+            # Walk newest-first and stop once enough matches were found
+            results = []
+            if limit <= 0 or candidates is not None and not candidates:
+                return results
+            for _, _, backup_id in reversed(self._by_created):
+                if candidates is None or backup_id in candidates:
+                    results.append(self._backups[backup_id].metadata)
+                    if len(results) >= limit:
+                        break
+            return results
+    
+    @staticmethod
+    def _narrow(candidates: Optional[set], ids) -> set:
+        """Intersect the candidate set so far with an index set."""
+        if candidates is None:
+            return set(ids)
+        return candidates.intersection(ids)
+    
+    def delete_backup(self, backup_id: str) -> bool:
+        """Delete a backup."""
+        return self._bulk_delete((backup_id,)) == 1
+    
+    def _bulk_delete(self, backup_ids: Iterable[str]) -> int:
+        """
+        Delete several backups, updating each index and blob once.
         
-        if created_by:
-            backups = [b for b in backups if b.metadata.created_by == created_by]
+        Index entries are removed with one set difference per indexed value
+        and the creation-order list is rebuilt in a single pass; each blob's
+        reference count drops once by the number of deleted users.
         
-        if tags:
-            backups = [
-                b for b in backups
-                if any(t in b.metadata.tags for t in tags)
-            ]
+        Returns:
+            Number of backups deleted
+        """
+        with self._lock:
+            removed = []
+            for backup_id in set(backup_ids):
+                backup = self._backups.pop(backup_id, None)
+                if backup is not None:
+                    removed.append(backup)
+            
+            if len(removed) == 1:
+                self._unindex_backup(removed[0].metadata)
+            elif removed:
+                removed_ids = set()
+                for backup in removed:
+                    self._total_size_bytes -= backup.metadata.size_bytes
+                    removed_ids.add(self._created_keys.pop(backup.metadata.backup_id)[2])
+                for index, values_of in (
+                    (self._by_type, lambda m: (m.backup_type,)),
+                    (self._by_status, lambda m: (m.status,)),
+                    (self._by_creator, lambda m: (m.created_by,)),
+                    (self._by_tag, lambda m: m.tags),
+                ):
+                    grouped = defaultdict(set)
+                    for backup in removed:
+                        for value in values_of(backup.metadata):
+                            grouped[value].add(backup.metadata.backup_id)
+                    for value, ids in grouped.items():
+                        index[value] -= ids
+                self._by_created = [key for key in self._by_created if key[2] not in removed_ids]
+            
+            released = Counter(
+                digest for backup in removed
+                for digest in backup.blob_digests + backup.ref_digests
+            )
+            for digest, count in released.items():
+                self._release_blob(digest, count)
+        return len(removed)
+    
+    def _put_blob(self, key: str, blob: bytes) -> str:
+        """
+        Store a blob by content key, or reference the identical stored copy.
         
-        # Sort by creation date (newest first)
-        backups.sort(key=lambda x: x.metadata.created_at, reverse=True)
+        Keys are derived from checksums, which for CRC32C can collide, so a
+        hit is only shared when the bytes match; otherwise a suffixed key is
+        used.
         
-        return [b.metadata for b in backups[:limit]]
+        Returns:
+            The key the blob is stored under
+        """
+        digest = key
+        suffix = 0
+        while digest in self._blob_store and self._blob_store[digest] != blob:
+            suffix += 1
+            digest = f"{key}#{suffix}"
+        if digest in self._blob_store:
+            self._blob_refs[digest] += 1
+        else:
+            self._blob_store[digest] = blob
+            self._blob_refs[digest] = 1
+            self._blob_bytes += len(blob)
+        return digest
     
-    def delete_backup(self, backup_id: str) -> bool:
-        """Delete a backup."""
-        if backup_id in self._backups:
-            del self._backups[backup_id]
-            return True
-        return False
+    def _release_blob(self, digest: str, count: int = 1):
+        """Drop references to a blob, removing it once unreferenced."""
+        self._blob_refs[digest] -= count
+        if not self._blob_refs[digest]:
+            del self._blob_refs[digest]
+            self._blob_bytes -= len(self._blob_store.pop(digest))
+    
+    def _load_blobs(self, digests: Tuple[str, ...]) -> bytes:
+        """Reassemble a payload from its blobs."""
+        if len(digests) == 1:
+            return self._blob_store[digests[0]]
+        return b"".join(self._blob_store[digest] for digest in digests)
     
     def verify_backup(self, backup_id: str) -> dict:
         """Verify backup integrity."""
@@ -428,13 +1147,27 @@ class BackupManager:
             return {"valid": False, "error": "Backup not found"}
         
         try:
-            # Re-serialize and check checksum
-            serialized, _, compressed, comp_type, checksum = self._serialize_backup(
-                backup.data, compress=backup.metadata.compressed
+            # The checksum covers the stored payload, so hash its blobs directly
+            checksum = self._hash_stream(
+                (self._blob_store[digest] for digest in backup.blob_digests),
+                backup.metadata.checksum_algo
             )
             
-            if checksum == backup.metadata.checksum:
-                backup.metadata.status = BackupStatus.VERIFIED
+            # Blobs an incremental backup points at are keyed by their SHA-256
+            corrupted = [
+                digest for digest in backup.ref_digests
+                if self._generate_checksum(self._blob_store[digest])
+                != digest.partition(":")[2].partition("#")[0]
+            ]
+            
+            if corrupted:
+                return {
+                    "valid": False,
+                    "error": "Referenced blob checksum mismatch",
+                    "blobs": corrupted
+                }
+            elif checksum == backup.metadata.checksum:
+                self._set_backup_status(backup.metadata, BackupStatus.VERIFIED)
                 return {
                     "valid": True,
                     "checksum": checksum,
@@ -468,7 +1201,7 @@ class BackupManager:
         Returns:
             RestorePoint with restore status
         """
-        restore_id = str(uuid.uuid4())
+        restore_id = self._new_id()
         now = datetime.utcnow()
         
         restore_point = RestorePoint(
@@ -483,17 +1216,17 @@ class BackupManager:
         if not backup:
             restore_point.status = RestoreStatus.FAILED
             restore_point.error_message = "Backup not found"
-            self._restore_points[restore_id] = restore_point
+            self._store_restore_point(restore_point)
             return restore_point
         
         try:
             restore_point.status = RestoreStatus.IN_PROGRESS
             
             # In a real implementation, this would restore data to the database
-            # For the prototype, we just track the restore operation
-            items_count = len(backup.data)
-            
-            restore_point.items_restored = items_count
+            # For the prototype, we just track the restore operation. The
+            # item count was recorded at creation, so the payload is not
+            # decoded here.
+            restore_point.items_restored = backup.metadata.items_count
             restore_point.status = RestoreStatus.COMPLETED
             restore_point.completed_at = datetime.utcnow()
             
@@ -501,9 +1234,19 @@ class BackupManager:
             restore_point.status = RestoreStatus.FAILED
             restore_point.error_message = str(e)
         
-        self._restore_points[restore_id] = restore_point
+        self._store_restore_point(restore_point)
         return restore_point
     
+    def _store_restore_point(self, restore_point: RestorePoint):
+        """Store a restore point and add it to the restore point indexes."""
+        with self._lock:
+            restore_id = restore_point.restore_id
+            self._restore_points[restore_id] = restore_point
+            self._restores_by_backup[restore_point.backup_id].add(restore_id)
+            self._restores_by_status[restore_point.status].add(restore_id)
+            key = (restore_point.created_at, next(self._backup_seq), restore_id)
+            bisect.insort(self._restores_by_created, key)
+    
     def get_restore_point(self, restore_id: str) -> Optional[RestorePoint]:
         """Get a restore point by ID."""
         return self._restore_points.get(restore_id)
@@ -515,16 +1258,23 @@ class BackupManager:
         limit: int = 50
     ) -> List[RestorePoint]:
         """List restore points."""
-        points = list(self._restore_points.values())
-        
-        if backup_id:
-            points = [p for p in points if p.backup_id == backup_id]
-        
-        if status:
-            points = [p for p in points if p.status == status]
-        
-        points.sort(key=lambda x: x.created_at, reverse=True)
-        return points[:limit]
+        with self._lock:
+            candidates = None
+            if backup_id:
+                candidates = set(self._restores_by_backup.get(backup_id, ()))
+            if status:
+                candidates = self._narrow(candidates, self._restores_by_status.get(status, ()))
+            
+            # Walk newest-first and stop once enough matches were found
+            points = []
+            if limit <= 0 or candidates is not None and not candidates:
+                return points
+            for _, _, restore_id in reversed(self._restores_by_created):
+                if candidates is None or restore_id in candidates:
+                    points.append(self._restore_points[restore_id])
+                    if len(points) >= limit:
+                        break
+            return points
     
     def create_lab_snapshot(
         self,
@@ -538,7 +1288,7 @@ class BackupManager:
         notes: str = ""
     ) -> LabSnapshot:
         """Create a snapshot of a lab's state."""
-        snapshot_id = str(uuid.uuid4())
+        snapshot_id = self._new_id()
         
         snapshot = LabSnapshot(
             snapshot_id=snapshot_id,
@@ -553,7 +1303,14 @@ class BackupManager:
             notes=notes
         )
         
-        self._lab_snapshots[snapshot_id] = snapshot
+        with self._lock:
+            self._lab_snapshots[snapshot_id] = snapshot
+            self._snap_by_lab[lab_id].add(snapshot_id)
+            self._snap_by_scenario[scenario_id].add(snapshot_id)
+            self._snap_by_creator[created_by].add(snapshot_id)
+            key = (snapshot.created_at, next(self._backup_seq), snapshot_id)
+            self._snapshot_keys[snapshot_id] = key
+            bisect.insort(self._snapshots_by_created, key)
         return snapshot
     
     def get_lab_snapshot(self, snapshot_id: str) -> Optional[LabSnapshot]:
@@ -568,26 +1325,40 @@ class BackupManager:
         limit: int = 50
     ) -> List[LabSnapshot]:
         """List lab snapshots."""
-        snapshots = list(self._lab_snapshots.values())
-        
-        if lab_id:
-            snapshots = [s for s in snapshots if s.lab_id == lab_id]
-        
-        if scenario_id:
-            snapshots = [s for s in snapshots if s.scenario_id == scenario_id]
-        
-        if created_by:
-            snapshots = [s for s in snapshots if s.created_by == created_by]
-        
-        snapshots.sort(key=lambda x: x.created_at, reverse=True)
-        return snapshots[:limit]
+        with self._lock:
+            # Intersect the index sets for each filter given
+            candidates = None
+            if lab_id:
+                candidates = set(self._snap_by_lab.get(lab_id, ()))
+            if scenario_id:
+                candidates = self._narrow(candidates, self._snap_by_scenario.get(scenario_id, ()))
+            if created_by:
+                candidates = self._narrow(candidates, self._snap_by_creator.get(created_by, ()))
+            
+            # Walk newest-first and stop once enough matches were found
+            snapshots = []
+            if limit <= 0 or candidates is not None and not candidates:
+                return snapshots
+            for _, _, snapshot_id in reversed(self._snapshots_by_created):
+                if candidates is None or snapshot_id in candidates:
+                    snapshots.append(self._lab_snapshots[snapshot_id])
+                    if len(snapshots) >= limit:
+                        break
+            return snapshots
     
     def delete_lab_snapshot(self, snapshot_id: str) -> bool:
         """Delete a lab snapshot."""
-        if snapshot_id in self._lab_snapshots:
-            del self._lab_snapshots[snapshot_id]
-            return True
-        return False
+        with self._lock:
+            snapshot = self._lab_snapshots.pop(snapshot_id, None)
+            if snapshot is not None:
+                self._snap_by_lab[snapshot.lab_id].discard(snapshot_id)
+                self._snap_by_scenario[snapshot.scenario_id].discard(snapshot_id)
+                self._snap_by_creator[snapshot.created_by].discard(snapshot_id)
+                key = self._snapshot_keys.pop(snapshot_id)
+                position = bisect.bisect_left(self._snapshots_by_created, key)
+                del self._snapshots_by_created[position]
+                return True
+            return False
     
     def restore_lab_snapshot(
         self,
@@ -626,7 +1397,7 @@ class BackupManager:
         max_backups: int = 10
     ) -> BackupSchedule:
         """Create an automated backup schedule."""
-        schedule_id = str(uuid.uuid4())
+        schedule_id = self._new_id()
         
         schedule = BackupSchedule(
             schedule_id=schedule_id,
@@ -646,41 +1417,17 @@ class BackupManager:
         self._schedules[schedule_id] = schedule
         return schedule
     
-    def _calculate_next_run(self, schedule: BackupSchedule) -> datetime:
-        """Calculate the next run time for a schedule."""
-        now = datetime.utcnow()
-        hour, minute = map(int, schedule.time_of_day.split(":"))
-        
-        if schedule.frequency == "daily":
-            next_run = now.replace(hour=hour, minute=minute, second=0, microsecond=0)
-            if next_run <= now:
-                next_run += timedelta(days=1)
-                
-        elif schedule.frequency == "weekly":
-            next_run = now.replace(hour=hour, minute=minute, second=0, microsecond=0)
-            days_ahead = schedule.day_of_week - now.weekday()
-            if days_ahead <= 0:
-                days_ahead += 7
-            next_run += timedelta(days=days_ahead)
-            
-        elif schedule.frequency == "monthly":
-            next_run = now.replace(
-                day=schedule.day_of_month or 1,
-                hour=hour,
-                minute=minute,
-                second=0,
-                microsecond=0
-            )
-            if next_run <= now:
-                # Move to next month
-                if next_run.month == 12:
-                    next_run = next_run.replace(year=next_run.year + 1, month=1)
-                else:
-                    next_run = next_run.replace(month=next_run.month + 1)
-        else:
-            next_run = now + timedelta(days=1)
-        
-        return next_run
+    def _calculate_next_run(
+        self,
+        schedule: BackupSchedule,
+        now: Optional[datetime] = None
+    ) -> datetime:
+        """Calculate the next run time for a schedule, relative to `now`."""
+        now = now or datetime.utcnow()
+        calculate = _NEXT_RUN_CALCULATORS.get(schedule.frequency)
+        if calculate is None:
+            return now + timedelta(days=1)
+        return calculate(schedule, now)
     
     def get_schedule(self, schedule_id: str) -> Optional[BackupSchedule]:
         """Get a backup schedule by ID."""
@@ -715,11 +1462,13 @@ class BackupManager:
             schedule.enabled = enabled
         if time_of_day:
             schedule.time_of_day = time_of_day
+            schedule._parse_time_of_day()
             schedule.next_run = self._calculate_next_run(schedule)
         if retention_days is not None:
             schedule.retention_days = retention_days
         if max_backups is not None:
             schedule.max_backups = max_backups
+        schedule._invalidate_dict()
         
         return schedule
     
@@ -727,6 +1476,7 @@ class BackupManager:
         """Delete a backup schedule."""
         if schedule_id in self._schedules:
             del self._schedules[schedule_id]
+            self._schedule_backups.pop(schedule_id, None)
             return True
         return False
     
@@ -750,46 +1500,101 @@ class BackupManager:
             description=f"Scheduled {schedule.frequency} backup",
             data=data,
             tags=["scheduled", schedule.frequency],
-            retention_days=schedule.retention_days
+            retention_days=schedule.retention_days,
+            checksum_algo=(
+                ChecksumType.CRC32C if schedule.backup_type in _INTEGRITY_ONLY_TYPES
+                else ChecksumType.SHA256
+            )
         )
-        
-        # Update schedule
-        schedule.last_run = datetime.utcnow()
-        schedule.next_run = self._calculate_next_run(schedule)
-        
-        # Clean up old backups if needed
-        self._cleanup_old_backups(schedule)
+        with self._lock:
+            if metadata.backup_id in self._backups:
+                self._schedule_backups[schedule_id].append(metadata.backup_id)
+            
+            # Update schedule; one clock read serves the run time, the next
+            # run and the retention cutoff
+            now = datetime.utcnow()
+            schedule.last_run = now
+            schedule.next_run = self._calculate_next_run(schedule, now)
+            schedule._invalidate_dict()
+            
+            # Clean up old backups if needed
+            self._cleanup_old_backups(schedule, now)
         
         return metadata
     
-    def _cleanup_old_backups(self, schedule: BackupSchedule):
-        """Remove old backups exceeding retention or max count."""
-        # Get backups from this schedule
-        scheduled_backups = [
-            b for b in self._backups.values()
-            if b.metadata.created_by == f"scheduled:{schedule.schedule_id}"
+    def run_due_schedules(
+        self,
+        data_provider: callable,
+        now: Optional[datetime] = None
+    ) -> List[BackupMetadata]:
+        """
+        Run every enabled schedule whose next run is due, concurrently.
+        
+        Each schedule's backup is independent, so they are serialized and
+        compressed in parallel worker threads; only storing the results
+        takes the manager lock. `data_provider` may be called from several
+        threads at once.
+        
+        Returns:
+            Metadata of the backups created, in schedule order
+        """
+        now = now or datetime.utcnow()
+        due = [
+            schedule.schedule_id for schedule in self._schedules.values()
+            if schedule.enabled and schedule.next_run and schedule.next_run <= now
         ]
+        if not due:
+            return []
         
-        # Sort by date
-        scheduled_backups.sort(key=lambda x: x.metadata.created_at)
+        workers = min(_MAX_SCHEDULE_WORKERS, len(due))
+        with _worker_pool(workers) as pool:
+            results = list(pool.map(
+                lambda schedule_id: self.run_scheduled_backup(schedule_id, data_provider),
+                due
+            ))
+        return [metadata for metadata in results if metadata is not None]
+    
+    def _cleanup_old_backups(
+        self,
+        schedule: BackupSchedule,
+        now: Optional[datetime] = None
+    ):
+        """Remove old backups exceeding retention or max count."""
+        # Backups from this schedule, oldest first; drop any deleted elsewhere
+        scheduled_backups = self._schedule_backups[schedule.schedule_id]
+        if any(backup_id not in self._backups for backup_id in scheduled_backups):
+            scheduled_backups = deque(
+                backup_id for backup_id in scheduled_backups
+                if backup_id in self._backups
+            )
+            self._schedule_backups[schedule.schedule_id] = scheduled_backups
         
         # Remove by count if exceeding max
+        doomed = []
         while len(scheduled_backups) > schedule.max_backups:
-            oldest = scheduled_backups.pop(0)
-            self.delete_backup(oldest.metadata.backup_id)
+            doomed.append(scheduled_backups.popleft())
+        
+        # Remove by retention; only the oldest entries can be past the cutoff
+        cutoff = (now or datetime.utcnow()) - timedelta(days=schedule.retention_days)
+        while (
+            scheduled_backups
+            and self._backups[scheduled_backups[0]].metadata.created_at < cutoff
+        ):
+            doomed.append(scheduled_backups.popleft())
         
-        # Remove by retention
-        cutoff = datetime.utcnow() - timedelta(days=schedule.retention_days)
-        for backup in scheduled_backups:
-            if backup.metadata.created_at < cutoff:
-                self.delete_backup(backup.metadata.backup_id)
+        self._bulk_delete(doomed)
     
     def export_backup(
         self,
         backup_id: str,
         format: str = "json"
     ) -> Optional[str]:
-        """Export a backup to a string format."""
+        """
+        Export a backup to a string format.
+        
+        JSON is the fast path; YAML is a human-readable convenience and uses
+        libyaml's C dumper when PyYAML was built with it.
+        """
         backup = self._backups.get(backup_id)
         if not backup:
             return None
@@ -797,8 +1602,8 @@ class BackupManager:
         export_data = backup.to_dict()
         
         if format == "yaml":
-            return yaml.dump(export_data, default_flow_style=False)
-        return json.dumps(export_data, indent=2, default=str)
+            return yaml.dump(export_data, Dumper=_YamlDumper, default_flow_style=False)
+        return _json_dumps(export_data, indent=True).decode("utf-8")
     
     def import_backup(
         self,
@@ -809,9 +1614,9 @@ class BackupManager:
         """Import a backup from a string format."""
         try:
             if format == "yaml":
-                data = yaml.safe_load(content)
+                data = yaml.load(content, Loader=_YamlLoader)
             else:
-                data = json.loads(content)
+                data = _json_loads(content)
             
             # Extract metadata and backup data
             metadata_dict = data.get("metadata", {})
@@ -833,29 +1638,16 @@ class BackupManager:
     
     def get_statistics(self) -> dict:
         """Get backup statistics."""
-        backups = list(self._backups.values())
-        
-        total_size = sum(b.metadata.size_bytes for b in backups)
-        by_type = {}
-        for b in backups:
-            t = b.metadata.backup_type.value
-            if t not in by_type:
-                by_type[t] = 0
-            by_type[t] += 1
-        
-        by_status = {}
-        for b in backups:
-            s = b.metadata.status.value
-            if s not in by_status:
-                by_status[s] = 0
-            by_status[s] += 1
+        # Counts come straight from the index sets, no pass over the backups
+        total_size = self._total_size_bytes
         
         return {
-            "total_backups": len(backups),
+            "total_backups": len(self._backups),
             "total_size_bytes": total_size,
             "total_size_mb": round(total_size / (1024 * 1024), 2),
-            "by_type": by_type,
-            "by_status": by_status,
+            "stored_size_bytes": self._blob_bytes,
+            "by_type": {t.value: len(ids) for t, ids in self._by_type.items() if ids},
+            "by_status": {s.value: len(ids) for s, ids in self._by_status.items() if ids},
             "total_snapshots": len(self._lab_snapshots),
             "total_restore_points": len(self._restore_points),
             "active_schedules": len([s for s in self._schedules.values() if s.enabled])
@@ -866,17 +1658,24 @@ class BackupManager:
         now = datetime.utcnow()
         expired = []
         
-        for backup_id, backup in self._backups.items():
-            expiry = backup.metadata.created_at + timedelta(
-                days=backup.metadata.retention_days
-            )
-            if now > expiry:
-                expired.append(backup_id)
-        
-        for backup_id in expired:
-            self.delete_backup(backup_id)
-        
-        return len(expired)
+        # Pop heap entries that have expired, skipping ones already deleted.
+        # An entry is re-pushed if its backup's retention was extended since.
+        with self._lock:
+            heap = self._expiry_heap
+            while heap and heap[0][0] < now:
+                _, seq, backup_id = heapq.heappop(heap)
+                backup = self._backups.get(backup_id)
+                if backup is None:
+                    continue
+                expiry = backup.metadata.created_at + timedelta(
+                    days=backup.metadata.retention_days
+                )
+                if now > expiry:
+                    expired.append(backup_id)
+                else:
+                    heapq.heappush(heap, (expiry, seq, backup_id))
+            
+            return self._bulk_delete(expired)
 
 
 # Global backup manager instance
@@ -10,12 +10,26 @@ Provides functionality for:
 This module helps organizations track and report on their cybersecurity
 training compliance requirements.
 """
-import json
+import bisect
+import calendar
+import csv
+import io
+import itertools
+import math
+import operator
+import os
+import time
 import uuid
+from array import array
+from collections import Counter, defaultdict
 from dataclasses import dataclass, field
 from datetime import datetime, timezone, timedelta
 from enum import Enum
-from typing import Optional
+from functools import lru_cache
+from typing import Iterator, Optional
+
+from _codegen import make_to_dict
+from _fastjson import dumps as _json_dumps
 
 
 class NISTFunction(str, Enum):
@@ -59,6 +73,189 @@ class NISTCategory(str, Enum):
     RC_CO = "RC.CO"  # Communications
 
 
+# Rows buffered per chunk yielded by the streaming CSV exporter
+_CSV_CHUNK_ROWS = 1000
+
+_TRAINING_CSV_HEADER = (
+    "record_id", "username", "scenario_id", "scenario_name", "exercise_id",
+    "exercise_name", "started_at", "completed_at", "duration_minutes", "score",
+    "passed", "nist_categories", "verified_by", "verified_at"
+)
+
+# Training record columns in report CSV exports, read from the report's
+# serialized records in one C call per row
+_REPORT_RECORD_ROW = operator.itemgetter(
+    "record_id", "scenario_name", "duration_minutes", "score", "passed"
+)
+
+
+class _ChunkBuffer:
+    """File-like sink for csv.writer that collects rows until drained."""
+
+    def __init__(self):
+        self.parts: list[str] = []
+
+    def write(self, s: str) -> None:
+        self.parts.append(s)
+
+    def drain(self) -> bytes:
+        data = "".join(self.parts).encode("utf-8")
+        self.parts.clear()
+        return data
+
+
+# Each category belongs to the function named by its two-letter prefix
+_FUNCTION_BY_PREFIX = {
+    "ID": NISTFunction.IDENTIFY,
+    "PR": NISTFunction.PROTECT,
+    "DE": NISTFunction.DETECT,
+    "RS": NISTFunction.RESPOND,
+    "RC": NISTFunction.RECOVER,
+}
+_CAT_TO_FUNCTION: dict[NISTCategory, NISTFunction] = {
+    cat: _FUNCTION_BY_PREFIX[cat.value[:2]] for cat in NISTCategory
+}
+
+# Enum members are singletons, so filters below compare them by identity
+_get_nist_function = operator.attrgetter("nist_function")
+_get_status = operator.attrgetter("status")
+
+# NIST Framework reference data: function -> description and category names
+_NIST_REFERENCE: dict[NISTFunction, dict] = {
+    NISTFunction.IDENTIFY: {
+        "description": "Develop organizational understanding to manage cybersecurity risk",
+        "categories": {
+            NISTCategory.ID_AM: "Asset Management",
+            NISTCategory.ID_BE: "Business Environment",
+            NISTCategory.ID_GV: "Governance",
+            NISTCategory.ID_RA: "Risk Assessment",
+            NISTCategory.ID_RM: "Risk Management Strategy",
+            NISTCategory.ID_SC: "Supply Chain Risk Management"
+        }
+    },
+    NISTFunction.PROTECT: {
+        "description": "Develop and implement appropriate safeguards",
+        "categories": {
+            NISTCategory.PR_AC: "Identity Management and Access Control",
+            NISTCategory.PR_AT: "Awareness and Training",
+            NISTCategory.PR_DS: "Data Security",
+            NISTCategory.PR_IP: "Information Protection Processes and Procedures",
+            NISTCategory.PR_MA: "Maintenance",
+            NISTCategory.PR_PT: "Protective Technology"
+        }
+    },
+    NISTFunction.DETECT: {
+        "description": "Develop and implement activities to identify cybersecurity events",
+        "categories": {
+            NISTCategory.DE_AE: "Anomalies and Events",
+            NISTCategory.DE_CM: "Security Continuous Monitoring",
+            NISTCategory.DE_DP: "Detection Processes"
+        }
+    },
+    NISTFunction.RESPOND: {
+        "description": "Develop and implement activities to take action on detected events",
+        "categories": {
+            NISTCategory.RS_RP: "Response Planning",
+            NISTCategory.RS_CO: "Communications",
+            NISTCategory.RS_AN: "Analysis",
+            NISTCategory.RS_MI: "Mitigation",
+            NISTCategory.RS_IM: "Improvements"
+        }
+    },
+    NISTFunction.RECOVER: {
+        "description": "Develop and implement activities to maintain resilience",
+        "categories": {
+            NISTCategory.RC_RP: "Recovery Planning",
+            NISTCategory.RC_IM: "Improvements",
+            NISTCategory.RC_CO: "Communications"
+        }
+    }
+}
+
+
+@lru_cache(maxsize=None)
+def _compute_nist_functions() -> tuple[dict, ...]:
+    """Build the NIST function list; the reference data is constant."""
+    return tuple(
+        {
+            "value": func.value,
+            "name": func.value.title(),
+            "description": _NIST_REFERENCE[func]["description"]
+        }
+        for func in NISTFunction
+    )
+
+
+@lru_cache(maxsize=None)
+def _compute_nist_categories(function_value: Optional[str]) -> tuple[dict, ...]:
+    """Build the NIST category list, optionally for a single function."""
+    categories = []
+    for func, data in _NIST_REFERENCE.items():
+        if function_value and func.value != function_value:
+            continue
+        for cat, name in data["categories"].items():
+            categories.append({
+                "value": cat.value,
+                "name": name,
+                "function": func.value
+            })
+    return tuple(categories)
+
+
+def _add_months(dt: datetime, months: int) -> datetime:
+    """Add calendar months to dt, clamping the day to the target month's length."""
+    years, month0 = divmod(dt.month - 1 + months, 12)
+    year = dt.year + years
+    day = min(dt.day, calendar.monthrange(year, month0 + 1)[1])
+    return dt.replace(year=year, month=month0 + 1, day=day)
+
+
+# Internal ids: a process-unique prefix plus a counter, much cheaper than
+# uuid4. Records and reports keep uuid4 because any authenticated user can
+# address them by id, so those ids must not be guessable.
+_ID_PREFIX = f"{os.getpid():x}-{int(time.time()):x}"
+_ID_COUNTER = itertools.count()
+
+
+def _new_id() -> str:
+    """Return a new process-unique id for internally referenced objects."""
+    return f"{_ID_PREFIX}-{next(_ID_COUNTER):x}"
+
+
+# One bit per category, so a record's category list packs into a single int
+_CAT_BIT: dict[NISTCategory, int] = {cat: 1 << i for i, cat in enumerate(NISTCategory)}
+
+
+def _category_mask(categories) -> int:
+    """Pack a collection of categories into a bitmask."""
+    mask = 0
+    for cat in categories:
+        mask |= _CAT_BIT[cat]
+    return mask
+
+
+class _HoursColumns:
+    """
+    Completed training for one user, stored column-wise.
+    
+    Row i holds the start timestamp, duration and category bitmask of one
+    completed record, so hour totals are computed from flat arrays rather
+    than by walking TrainingRecord objects.
+    """
+    __slots__ = ("started", "minutes", "cat_masks")
+
+    def __init__(self):
+        self.started = array("d")
+        self.minutes = array("d")
+        self.cat_masks = array("L")
+
+    def append(self, started: float, minutes: float, cat_mask: int) -> int:
+        self.started.append(started)
+        self.minutes.append(minutes)
+        self.cat_masks.append(cat_mask)
+        return len(self.minutes) - 1
+
+
 class CertificationType(str, Enum):
     """Common cybersecurity certification types."""
     CEH = "ceh"  # Certified Ethical Hacker
@@ -88,7 +285,31 @@ class ReportFormat(str, Enum):
     PDF = "pdf"
 
 
-@dataclass
+# Status members bound once for the tracker and report hot paths
+_CS_COMPLIANT = ComplianceStatus.COMPLIANT
+_CS_PARTIAL = ComplianceStatus.PARTIAL
+_CS_PENDING = ComplianceStatus.PENDING
+_CS_EXPIRED = ComplianceStatus.EXPIRED
+_CS_MEMBERS = tuple(ComplianceStatus)
+
+# Trackers in these states no longer accrue training hours
+_INACTIVE_STATUSES = frozenset({_CS_EXPIRED, _CS_COMPLIANT})
+
+# Tracker status indexed by (expired << 2) | (requirements_met << 1) | started
+_STATUS_TABLE = (
+    _CS_PENDING,
+    _CS_PARTIAL,
+    _CS_COMPLIANT,
+    _CS_COMPLIANT,
+    _CS_EXPIRED,
+    _CS_EXPIRED,
+    _CS_EXPIRED,
+    _CS_EXPIRED,
+)
+
+
+@make_to_dict
+@dataclass(slots=True)
 class NISTMapping:
     """Maps a scenario or exercise to NIST Framework categories."""
     mapping_id: str
@@ -102,24 +323,11 @@ class NISTMapping:
     created_by: str
     created_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
     updated_at: Optional[datetime] = None
-
-    def to_dict(self) -> dict:
-        return {
-            "mapping_id": self.mapping_id,
-            "scenario_id": self.scenario_id,
-            "scenario_name": self.scenario_name,
-            "nist_function": self.nist_function.value,
-            "nist_categories": [c.value for c in self.nist_categories],
-            "subcategories": self.subcategories,
-            "description": self.description,
-            "learning_objectives": self.learning_objectives,
-            "created_by": self.created_by,
-            "created_at": self.created_at.isoformat(),
-            "updated_at": self.updated_at.isoformat() if self.updated_at else None
-        }
+    _created_at_iso: Optional[tuple] = field(default=None, init=False, repr=False, compare=False)
 
 
-@dataclass
+@make_to_dict
+@dataclass(slots=True)
 class TrainingRecord:
     """Records a user's training activity."""
     record_id: str
@@ -138,29 +346,15 @@ class TrainingRecord:
     notes: str = ""
     verified_by: Optional[str] = None
     verified_at: Optional[datetime] = None
-
-    def to_dict(self) -> dict:
-        return {
-            "record_id": self.record_id,
-            "username": self.username,
-            "scenario_id": self.scenario_id,
-            "scenario_name": self.scenario_name,
-            "exercise_id": self.exercise_id,
-            "exercise_name": self.exercise_name,
-            "started_at": self.started_at.isoformat(),
-            "completed_at": self.completed_at.isoformat() if self.completed_at else None,
-            "duration_minutes": self.duration_minutes,
-            "score": self.score,
-            "passed": self.passed,
-            "nist_categories": [c.value for c in self.nist_categories],
-            "certification_credits": self.certification_credits,
-            "notes": self.notes,
-            "verified_by": self.verified_by,
-            "verified_at": self.verified_at.isoformat() if self.verified_at else None
-        }
+    # Monotonic clock reading at start, used to time the session
+    _start_monotonic_ns: Optional[int] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _started_at_iso: Optional[tuple] = field(default=None, init=False, repr=False, compare=False)
 
 
-@dataclass
+@make_to_dict
+@dataclass(slots=True)
 class CertificationRequirement:
     """Defines requirements for maintaining a certification."""
     requirement_id: str
@@ -173,23 +367,16 @@ class CertificationRequirement:
     description: str = ""
     active: bool = True
     created_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
-
-    def to_dict(self) -> dict:
-        return {
-            "requirement_id": self.requirement_id,
-            "certification_type": self.certification_type.value,
-            "certification_name": self.certification_name,
-            "hours_required": self.hours_required,
-            "period_months": self.period_months,
-            "categories_required": [c.value for c in self.categories_required],
-            "min_categories": self.min_categories,
-            "description": self.description,
-            "active": self.active,
-            "created_at": self.created_at.isoformat()
-        }
+    _created_at_iso: Optional[tuple] = field(default=None, init=False, repr=False, compare=False)
 
 
-@dataclass
+@make_to_dict(extra={
+    "progress_percent": (
+        "min(100, (self.hours_completed / self.hours_required * 100))"
+        " if self.hours_required > 0 else 0"
+    )
+})
+@dataclass(slots=True)
 class UserCertificationTracker:
     """Tracks a user's progress toward certification requirements."""
     tracker_id: str
@@ -200,30 +387,16 @@ class UserCertificationTracker:
     end_date: datetime
     hours_completed: float = 0.0
     hours_required: float = 0.0
-    categories_covered: list[NISTCategory] = field(default_factory=list)
+    categories_covered: set[NISTCategory] = field(default_factory=set)
     status: ComplianceStatus = ComplianceStatus.PENDING
     training_records: list[str] = field(default_factory=list)  # record_ids
     last_updated: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
-
-    def to_dict(self) -> dict:
-        return {
-            "tracker_id": self.tracker_id,
-            "username": self.username,
-            "requirement_id": self.requirement_id,
-            "certification_name": self.certification_name,
-            "start_date": self.start_date.isoformat(),
-            "end_date": self.end_date.isoformat(),
-            "hours_completed": self.hours_completed,
-            "hours_required": self.hours_required,
-            "categories_covered": [c.value for c in self.categories_covered],
-            "status": self.status.value,
-            "training_records": self.training_records,
-            "last_updated": self.last_updated.isoformat(),
-            "progress_percent": min(100, (self.hours_completed / self.hours_required * 100)) if self.hours_required > 0 else 0
-        }
+    _start_date_iso: Optional[tuple] = field(default=None, init=False, repr=False, compare=False)
+    _end_date_iso: Optional[tuple] = field(default=None, init=False, repr=False, compare=False)
 
 
-@dataclass
+@make_to_dict
+@dataclass(slots=True)
 class ComplianceReport:
     """Generated compliance report."""
     report_id: str
@@ -236,20 +409,9 @@ class ComplianceReport:
     data: dict = field(default_factory=dict)
     summary: dict = field(default_factory=dict)
     format: ReportFormat = ReportFormat.JSON
-
-    def to_dict(self) -> dict:
-        return {
-            "report_id": self.report_id,
-            "report_type": self.report_type,
-            "title": self.title,
-            "generated_by": self.generated_by,
-            "generated_at": self.generated_at.isoformat(),
-            "period_start": self.period_start.isoformat(),
-            "period_end": self.period_end.isoformat(),
-            "data": self.data,
-            "summary": self.summary,
-            "format": self.format.value
-        }
+    _generated_at_iso: Optional[tuple] = field(default=None, init=False, repr=False, compare=False)
+    _period_start_iso: Optional[tuple] = field(default=None, init=False, repr=False, compare=False)
+    _period_end_iso: Optional[tuple] = field(default=None, init=False, repr=False, compare=False)
 
 
 class ComplianceManager:
@@ -269,6 +431,23 @@ class ComplianceManager:
         self._certification_requirements: dict[str, CertificationRequirement] = {}
         self._user_trackers: dict[str, UserCertificationTracker] = {}
         self._reports: dict[str, ComplianceReport] = {}
+        # Requirements grouped by the bitmask of their required categories,
+        # rebuilt lazily after the requirement set changes
+        self._credit_table: Optional[list[tuple[int, list[CertificationRequirement]]]] = None
+        # Secondary indexes so per-user and per-scenario lookups avoid full scans
+        self._mappings_by_scenario: dict[str, list[str]] = {}
+        # Records per user in start-time order, with their start timestamps
+        # in a parallel list for bisecting date ranges
+        self._records_by_user: dict[str, list[TrainingRecord]] = {}
+        self._record_starts_by_user: dict[str, list[float]] = {}
+        self._trackers_by_user: dict[str, list[str]] = {}
+        # Resolved tracker tuples per user, dropped when the user enrolls again
+        self._tracker_snapshots: dict[str, tuple[UserCertificationTracker, ...]] = {}
+        # Per-user columns of completed training, and record_id -> row in them
+        self._hours_by_user: dict[str, _HoursColumns] = {}
+        self._hours_rows: dict[str, int] = {}
+        # (username, requirement_id) -> most recent tracker for that enrollment
+        self._enrollment_index: dict[tuple[str, str], str] = {}
         self._initialize_default_requirements()
         self._initialize_nist_reference()
 
@@ -321,55 +500,14 @@ class ComplianceManager:
 
     def _initialize_nist_reference(self):
         """Initialize NIST Framework reference data."""
-        self._nist_reference = {
-            NISTFunction.IDENTIFY: {
-                "description": "Develop organizational understanding to manage cybersecurity risk",
-                "categories": {
-                    NISTCategory.ID_AM: "Asset Management",
-                    NISTCategory.ID_BE: "Business Environment",
-                    NISTCategory.ID_GV: "Governance",
-                    NISTCategory.ID_RA: "Risk Assessment",
-                    NISTCategory.ID_RM: "Risk Management Strategy",
-                    NISTCategory.ID_SC: "Supply Chain Risk Management"
-                }
-            },
-            NISTFunction.PROTECT: {
-                "description": "Develop and implement appropriate safeguards",
-                "categories": {
-                    NISTCategory.PR_AC: "Identity Management and Access Control",
-                    NISTCategory.PR_AT: "Awareness and Training",
-                    NISTCategory.PR_DS: "Data Security",
-                    NISTCategory.PR_IP: "Information Protection Processes and Procedures",
-                    NISTCategory.PR_MA: "Maintenance",
-                    NISTCategory.PR_PT: "Protective Technology"
-                }
-            },
-            NISTFunction.DETECT: {
-                "description": "Develop and implement activities to identify cybersecurity events",
-                "categories": {
-                    NISTCategory.DE_AE: "Anomalies and Events",
-                    NISTCategory.DE_CM: "Security Continuous Monitoring",
-                    NISTCategory.DE_DP: "Detection Processes"
-                }
-            },
-            NISTFunction.RESPOND: {
-                "description": "Develop and implement activities to take action on detected events",
-                "categories": {
-                    NISTCategory.RS_RP: "Response Planning",
-                    NISTCategory.RS_CO: "Communications",
-                    NISTCategory.RS_AN: "Analysis",
-                    NISTCategory.RS_MI: "Mitigation",
-                    NISTCategory.RS_IM: "Improvements"
-                }
-            },
-            NISTFunction.RECOVER: {
-                "description": "Develop and implement activities to maintain resilience",
-                "categories": {
-                    NISTCategory.RC_RP: "Recovery Planning",
-                    NISTCategory.RC_IM: "Improvements",
-                    NISTCategory.RC_CO: "Communications"
-                }
+        self._nist_reference = _NIST_REFERENCE
+        # The reference is constant, so its serialized form is built once
+        self._nist_reference_serialized = {
+            func.value: {
+                "description": data["description"],
+                "categories": {k.value: v for k, v in data["categories"].items()}
             }
+            for func, data in self._nist_reference.items()
         }
 
     # NIST Mapping Management
@@ -387,7 +525,7 @@ class ComplianceManager:
     ) -> NISTMapping:
         """Create a NIST Framework mapping for a scenario."""
         mapping = NISTMapping(
-            mapping_id=str(uuid.uuid4()),
+            mapping_id=_new_id(),
             scenario_id=scenario_id,
             scenario_name=scenario_name,
             nist_function=nist_function,
@@ -398,6 +536,7 @@ class ComplianceManager:
             created_by=created_by
         )
         self._nist_mappings[mapping.mapping_id] = mapping
+        self._mappings_by_scenario.setdefault(scenario_id, []).append(mapping.mapping_id)
         return mapping
 
     def get_nist_mapping(self, mapping_id: str) -> Optional[NISTMapping]:
@@ -406,10 +545,10 @@ class ComplianceManager:
 
     def get_mapping_for_scenario(self, scenario_id: str) -> Optional[NISTMapping]:
         """Get NIST mapping for a specific scenario."""
-        for mapping in self._nist_mappings.values():
-            if mapping.scenario_id == scenario_id:
-                return mapping
-        return None
+        mapping_ids = self._mappings_by_scenario.get(scenario_id)
+        if not mapping_ids:
+            return None
+        return self._nist_mappings[mapping_ids[0]]
 
     def list_nist_mappings(
         self,
@@ -420,7 +559,8 @@ class ComplianceManager:
         mappings = list(self._nist_mappings.values())
         
         if nist_function:
-            mappings = [m for m in mappings if m.nist_function == nist_function]
+            nist_function = NISTFunction(nist_function)
+            mappings = [m for m in mappings if _get_nist_function(m) is nist_function]
         
         if category:
             mappings = [m for m in mappings if category in m.nist_categories]
@@ -454,45 +594,35 @@ class ComplianceManager:
 
     def delete_nist_mapping(self, mapping_id: str) -> bool:
         """Delete a NIST mapping."""
-        if mapping_id in self._nist_mappings:
-            del self._nist_mappings[mapping_id]
-            return True
-        return False
+        mapping = self._nist_mappings.pop(mapping_id, None)
+        if mapping is None:
+            return False
+        mapping_ids = self._mappings_by_scenario[mapping.scenario_id]
+        mapping_ids.remove(mapping_id)
+        if not mapping_ids:
+            del self._mappings_by_scenario[mapping.scenario_id]
+        return True
 
     def get_nist_reference(self) -> dict:
-        """Get NIST Framework reference data."""
-        result = {}
-        for func, data in self._nist_reference.items():
-            result[func.value] = {
-                "description": data["description"],
-                "categories": {k.value: v for k, v in data["categories"].items()}
-            }
-        return result
+        """
+        Get NIST Framework reference data.
+        
+        The same dict is returned on every call and must not be mutated.
+        """
+        return self._nist_reference_serialized
 
     def get_nist_functions(self) -> list[dict]:
-        """Get list of NIST Functions."""
-        return [
-            {
-                "value": func.value,
-                "name": func.value.title(),
-                "description": self._nist_reference[func]["description"]
-            }
-            for func in NISTFunction
-        ]
+        """Get list of NIST Functions. The entries are shared and must not be mutated."""
+        return list(_compute_nist_functions())
 
     def get_nist_categories(self, function: Optional[NISTFunction] = None) -> list[dict]:
-        """Get list of NIST Categories, optionally filtered by function."""
-        categories = []
-        for func, data in self._nist_reference.items():
-            if function and func != function:
-                continue
-            for cat, name in data["categories"].items():
-                categories.append({
-                    "value": cat.value,
-                    "name": name,
-                    "function": func.value
-                })
-        return categories
+        """
+        Get list of NIST Categories, optionally filtered by function.
+        
+        The entries are shared and must not be mutated.
+        """
+        function_value = NISTFunction(function).value if function else None
+        return list(_compute_nist_categories(function_value))
 
     # Training Record Management
 
@@ -519,7 +649,14 @@ class ComplianceManager:
             started_at=datetime.now(timezone.utc),
             nist_categories=nist_categories
         )
+        record._start_monotonic_ns = time.monotonic_ns()
         self._training_records[record.record_id] = record
+        # Start times only ever grow, so this insert is an append in practice
+        started = record.started_at.timestamp()
+        starts = self._record_starts_by_user.setdefault(username, [])
+        i = bisect.bisect_right(starts, started)
+        starts.insert(i, started)
+        self._records_by_user.setdefault(username, []).insert(i, record)
         return record
 
     def complete_training_record(
@@ -535,24 +672,31 @@ class ComplianceManager:
             return None
         
         record.completed_at = datetime.now(timezone.utc)
-        record.duration_minutes = (
-            record.completed_at - record.started_at
-        ).total_seconds() / 60.0
+        if record._start_monotonic_ns is not None:
+            # Immune to wall-clock adjustments during the session
+            record.duration_minutes = (
+                time.monotonic_ns() - record._start_monotonic_ns
+            ) / 60e9
+        else:
+            record.duration_minutes = (
+                record.completed_at - record.started_at
+            ).total_seconds() / 60.0
         record.score = score
         record.passed = passed
         record.notes = notes
+        cat_mask = _category_mask(record.nist_categories)
+        self._record_hours(record, cat_mask)
         
-        # Calculate certification credits based on duration and categories
+        # Calculate certification credits: a requirement applies when it has
+        # no required categories or the training covers any of them
         credits = {}
         hours = record.duration_minutes / 60.0
         
-        for req in self._certification_requirements.values():
-            if req.active:
-                # Check if training covers required categories
-                if not req.categories_required or any(
-                    cat in record.nist_categories for cat in req.categories_required
-                ):
-                    credits[req.certification_type.value] = hours
+        for req_mask, reqs in self._get_credit_table():
+            if req_mask == 0 or req_mask & cat_mask:
+                for req in reqs:
+                    if req.active:
+                        credits[req.certification_type.value] = hours
         
         record.certification_credits = credits
         
@@ -575,6 +719,29 @@ class ComplianceManager:
         record.verified_at = datetime.now(timezone.utc)
         return record
 
+    def _get_credit_table(self) -> list[tuple[int, list[CertificationRequirement]]]:
+        """Return requirements grouped by required-category bitmask."""
+        if self._credit_table is None:
+            by_mask: dict[int, list[CertificationRequirement]] = {}
+            for req in self._certification_requirements.values():
+                by_mask.setdefault(_category_mask(req.categories_required), []).append(req)
+            self._credit_table = list(by_mask.items())
+        return self._credit_table
+
+    def _record_hours(self, record: TrainingRecord, cat_mask: int):
+        """Store or refresh a completed record's row in its user's hour columns."""
+        columns = self._hours_by_user.get(record.username)
+        if columns is None:
+            columns = self._hours_by_user[record.username] = _HoursColumns()
+        row = self._hours_rows.get(record.record_id)
+        if row is None:
+            self._hours_rows[record.record_id] = columns.append(
+                record.started_at.timestamp(), record.duration_minutes, cat_mask
+            )
+        else:
+            columns.minutes[row] = record.duration_minutes
+            columns.cat_masks[row] = cat_mask
+
     def get_training_record(self, record_id: str) -> Optional[TrainingRecord]:
         """Get a training record by ID."""
         return self._training_records.get(record_id)
@@ -586,22 +753,23 @@ class ComplianceManager:
         end_date: Optional[datetime] = None,
         verified_only: bool = False
     ) -> list[TrainingRecord]:
-        """Get training records for a user."""
-        records = [
-            r for r in self._training_records.values()
-            if r.username == username
-        ]
+        """Get training records for a user, most recently started first."""
+        user_records = self._records_by_user.get(username)
+        if not user_records:
+            return []
         
-        if start_date:
-            records = [r for r in records if r.started_at >= start_date]
+        # Select the date window from the sorted start times
+        starts = self._record_starts_by_user[username]
+        lo = bisect.bisect_left(starts, start_date.timestamp()) if start_date else 0
+        hi = bisect.bisect_right(starts, end_date.timestamp()) if end_date else len(starts)
         
-        if end_date:
-            records = [r for r in records if r.started_at <= end_date]
+        records = user_records[lo:hi]
+        records.reverse()
         
         if verified_only:
             records = [r for r in records if r.verified_by is not None]
         
-        return sorted(records, key=lambda r: r.started_at, reverse=True)
+        return records
 
     def get_user_training_hours(
         self,
@@ -610,41 +778,42 @@ class ComplianceManager:
         end_date: Optional[datetime] = None
     ) -> dict:
         """Calculate total training hours for a user."""
-        records = self.get_user_training_records(username, start_date, end_date)
+        columns = self._hours_by_user.get(username) or _HoursColumns()
+        minutes = columns.minutes
+        cat_masks = columns.cat_masks
+        if start_date or end_date:
+            lo = start_date.timestamp() if start_date else float("-inf")
+            hi = end_date.timestamp() if end_date else float("inf")
+            rows = [i for i, ts in enumerate(columns.started) if lo <= ts <= hi]
+            minutes = [minutes[i] for i in rows]
+            cat_masks = [cat_masks[i] for i in rows]
         
-        completed_records = [r for r in records if r.completed_at]
+        total_hours = sum(minutes) / 60.0
         
-        total_hours = sum(r.duration_minutes for r in completed_records) / 60.0
+        # Sum minutes per distinct category combination, then spread each
+        # combination's total over its categories
+        by_mask = defaultdict(float)
+        for mask, mins in zip(cat_masks, minutes):
+            by_mask[mask] += mins
         
         # Hours by NIST category
-        by_category = {}
-        for record in completed_records:
-            hours = record.duration_minutes / 60.0
-            for cat in record.nist_categories:
-                cat_key = cat.value
-                by_category[cat_key] = by_category.get(cat_key, 0) + hours
-        
-        # Hours by NIST function - map category prefixes to functions
-        by_function = {}
-        func_prefixes = {
-            NISTFunction.IDENTIFY: "ID",
-            NISTFunction.PROTECT: "PR",
-            NISTFunction.DETECT: "DE",
-            NISTFunction.RESPOND: "RS",
-            NISTFunction.RECOVER: "RC"
-        }
-        for cat_key, hours in by_category.items():
-            for func, prefix in func_prefixes.items():
-                if cat_key.startswith(prefix):
-                    by_function[func.value] = by_function.get(func.value, 0) + hours
-                    break
+        by_category = defaultdict(float)
+        for cat, bit in _CAT_BIT.items():
+            for mask, mins in by_mask.items():
+                if mask & bit:
+                    by_category[cat] += mins / 60.0
+        
+        # Hours by NIST function, via the precomputed category lookup
+        by_function = defaultdict(float)
+        for cat, hours in by_category.items():
+            by_function[_CAT_TO_FUNCTION[cat]] += hours
         
         return {
             "username": username,
             "total_hours": round(total_hours, 2),
-            "total_records": len(completed_records),
-            "by_category": {k: round(v, 2) for k, v in by_category.items()},
-            "by_function": {k: round(v, 2) for k, v in by_function.items()},
+            "total_records": len(minutes),
+            "by_category": {k.value: round(v, 2) for k, v in by_category.items()},
+            "by_function": {k.value: round(v, 2) for k, v in by_function.items()},
             "period": {
                 "start": start_date.isoformat() if start_date else None,
                 "end": end_date.isoformat() if end_date else None
@@ -665,7 +834,7 @@ class ComplianceManager:
     ) -> CertificationRequirement:
         """Create a certification requirement."""
         requirement = CertificationRequirement(
-            requirement_id=str(uuid.uuid4()),
+            requirement_id=_new_id(),
             certification_type=certification_type,
             certification_name=certification_name,
             hours_required=hours_required,
@@ -675,6 +844,7 @@ class ComplianceManager:
             description=description
         )
         self._certification_requirements[requirement.requirement_id] = requirement
+        self._credit_table = None
         return requirement
 
     def get_certification_requirement(
@@ -702,34 +872,59 @@ class ComplianceManager:
         if not requirement:
             return None
         
-        # Check if already enrolled
-        for tracker in self._user_trackers.values():
-            if tracker.username == username and tracker.requirement_id == requirement_id:
-                if tracker.status not in [ComplianceStatus.EXPIRED, ComplianceStatus.COMPLIANT]:
-                    return tracker  # Already tracking
+        # Check if already enrolled. Older trackers for the same requirement
+        # are always finished, so only the latest one needs checking.
+        key = (username, requirement_id)
+        tracker_id = self._enrollment_index.get(key)
+        if tracker_id is not None:
+            tracker = self._user_trackers[tracker_id]
+            status = tracker.status
+            if status is not _CS_EXPIRED and status is not _CS_COMPLIANT:
+                return tracker  # Already tracking
         
         start_date = datetime.now(timezone.utc)
-        end_date = start_date + timedelta(days=requirement.period_months * 30)
+        end_date = _add_months(start_date, requirement.period_months)
         
         tracker = UserCertificationTracker(
-            tracker_id=str(uuid.uuid4()),
+            tracker_id=_new_id(),
             username=username,
             requirement_id=requirement_id,
             certification_name=requirement.certification_name,
             start_date=start_date,
             end_date=end_date,
             hours_required=requirement.hours_required,
-            status=ComplianceStatus.PENDING
+            status=_CS_PENDING
         )
         self._user_trackers[tracker.tracker_id] = tracker
+        self._trackers_by_user.setdefault(username, []).append(tracker.tracker_id)
+        self._tracker_snapshots.pop(username, None)
+        self._enrollment_index[key] = tracker.tracker_id
         return tracker
 
+    def _user_tracker_snapshot(self, username: str) -> tuple[UserCertificationTracker, ...]:
+        """
+        Get a user's certification trackers in enrollment order.
+        
+        The resolved tuple is reused until the user enrolls in another
+        certification; trackers are updated in place, so it never goes stale
+        otherwise. Users without trackers are not cached.
+        """
+        snapshot = self._tracker_snapshots.get(username)
+        if snapshot is None:
+            tracker_ids = self._trackers_by_user.get(username)
+            if not tracker_ids:
+                return ()
+            user_trackers = self._user_trackers
+            snapshot = tuple([user_trackers[tracker_id] for tracker_id in tracker_ids])
+            self._tracker_snapshots[username] = snapshot
+        return snapshot
+
     def _update_user_trackers(self, record: TrainingRecord):
         """Update certification trackers when training is completed."""
-        for tracker in self._user_trackers.values():
-            if tracker.username != record.username:
-                continue
-            if tracker.status in [ComplianceStatus.EXPIRED, ComplianceStatus.COMPLIANT]:
+        now = datetime.now(timezone.utc)
+        for tracker in self._user_tracker_snapshot(record.username):
+            status = tracker.status
+            if status is _CS_EXPIRED or status is _CS_COMPLIANT:
                 continue
             
             # Check if within tracking period
@@ -742,38 +937,31 @@ class ComplianceManager:
             tracker.training_records.append(record.record_id)
             
             # Update categories covered
-            for cat in record.nist_categories:
-                if cat not in tracker.categories_covered:
-                    tracker.categories_covered.append(cat)
+            tracker.categories_covered.update(record.nist_categories)
             
             # Update status
-            tracker.last_updated = datetime.now(timezone.utc)
-            tracker.status = self._calculate_tracker_status(tracker)
+            tracker.last_updated = now
+            tracker.status = self._calculate_tracker_status(tracker, now)
 
     def _calculate_tracker_status(
-        self, tracker: UserCertificationTracker
+        self, tracker: UserCertificationTracker, now: Optional[datetime] = None
     ) -> ComplianceStatus:
         """Calculate the compliance status of a tracker."""
         requirement = self._certification_requirements.get(tracker.requirement_id)
+        if now is None:
+            now = datetime.now(timezone.utc)
         
-        # Check if expired
-        if datetime.now(timezone.utc) > tracker.end_date:
-            return ComplianceStatus.EXPIRED
+        expired = now > tracker.end_date
+        hours_completed = tracker.hours_completed
         
-        # Check hours
-        hours_met = tracker.hours_completed >= tracker.hours_required
-        
-        # Check categories if required
-        categories_met = True
-        if requirement and requirement.min_categories > 0:
-            categories_met = len(tracker.categories_covered) >= requirement.min_categories
+        # Requirements met: enough hours, and enough categories if required
+        met = hours_completed >= tracker.hours_required and (
+            not requirement
+            or requirement.min_categories <= 0
+            or len(tracker.categories_covered) >= requirement.min_categories
+        )
         
-        if hours_met and categories_met:
-            return ComplianceStatus.COMPLIANT
-        elif tracker.hours_completed > 0:
-            return ComplianceStatus.PARTIAL
-        else:
-            return ComplianceStatus.PENDING
+        return _STATUS_TABLE[(expired << 2) | (met << 1) | (hours_completed > 0)]
 
     def get_user_certification_trackers(
         self,
@@ -781,25 +969,23 @@ class ComplianceManager:
         status: Optional[ComplianceStatus] = None
     ) -> list[UserCertificationTracker]:
         """Get certification trackers for a user."""
-        trackers = [
-            t for t in self._user_trackers.values()
-            if t.username == username
-        ]
+        trackers = self._user_tracker_snapshot(username)
         
         if status:
-            trackers = [t for t in trackers if t.status == status]
+            status = ComplianceStatus(status)
+            return [t for t in trackers if _get_status(t) is status]
         
-        return trackers
+        return list(trackers)
 
     def get_user_compliance_summary(self, username: str) -> dict:
         """Get compliance summary for a user."""
         trackers = self.get_user_certification_trackers(username)
         training_hours = self.get_user_training_hours(username)
         
-        by_status = {}
-        for tracker in trackers:
-            status = tracker.status.value
-            by_status[status] = by_status.get(status, 0) + 1
+        by_status = {
+            status.value: count
+            for status, count in Counter(map(_get_status, trackers)).items()
+        }
         
         return {
             "username": username,
@@ -819,8 +1005,9 @@ class ComplianceManager:
         period_end: Optional[datetime] = None
     ) -> ComplianceReport:
         """Generate an individual compliance report."""
+        now = datetime.now(timezone.utc)
         if not period_end:
-            period_end = datetime.now(timezone.utc)
+            period_end = now
         if not period_start:
             period_start = period_end - timedelta(days=365)
         
@@ -831,13 +1018,15 @@ class ComplianceManager:
             username, period_start, period_end
         )
         trackers = self.get_user_certification_trackers(username)
+        # list.count runs in C and short-circuits on identity for enum members
+        statuses = list(map(_get_status, trackers))
         
         report = ComplianceReport(
             report_id=str(uuid.uuid4()),
             report_type="individual",
             title=f"Compliance Report - {username}",
             generated_by=generated_by,
-            generated_at=datetime.now(timezone.utc),
+            generated_at=now,
             period_start=period_start,
             period_end=period_end,
             data={
@@ -849,15 +1038,9 @@ class ComplianceManager:
                 "total_sessions": len(training_records),
                 "hours_by_category": training_hours["by_category"],
                 "hours_by_function": training_hours["by_function"],
-                "certifications_compliant": sum(
-                    1 for t in trackers if t.status == ComplianceStatus.COMPLIANT
-                ),
-                "certifications_pending": sum(
-                    1 for t in trackers if t.status == ComplianceStatus.PENDING
-                ),
-                "certifications_partial": sum(
-                    1 for t in trackers if t.status == ComplianceStatus.PARTIAL
-                )
+                "certifications_compliant": statuses.count(_CS_COMPLIANT),
+                "certifications_pending": statuses.count(_CS_PENDING),
+                "certifications_partial": statuses.count(_CS_PARTIAL)
             }
         )
         self._reports[report.report_id] = report
@@ -872,36 +1055,45 @@ class ComplianceManager:
         period_end: Optional[datetime] = None
     ) -> ComplianceReport:
         """Generate a team compliance report."""
+        now = datetime.now(timezone.utc)
         if not period_end:
-            period_end = datetime.now(timezone.utc)
+            period_end = now
         if not period_start:
             period_start = period_end - timedelta(days=365)
         
-        individual_data = []
-        total_hours = 0
+        # Each member is reported once, even if listed more than once
+        usernames = list(dict.fromkeys(usernames))
+        get_hours = self.get_user_training_hours
+        get_trackers = self.get_user_certification_trackers
+        
+        # Members are known up front, so size the output once
+        individual_data: list[Optional[dict]] = [None] * len(usernames)
+        member_hours = array("d")
         compliant_count = 0
         
-        for username in usernames:
-            hours = self.get_user_training_hours(username, period_start, period_end)
-            trackers = self.get_user_certification_trackers(username)
+        for i, username in enumerate(usernames):
+            hours = get_hours(username, period_start, period_end)
+            trackers = get_trackers(username)
             
-            total_hours += hours["total_hours"]
-            compliant_count += sum(
-                1 for t in trackers if t.status == ComplianceStatus.COMPLIANT
-            )
+            member_hours.append(hours["total_hours"])
+            compliant_count += list(map(_get_status, trackers)).count(_CS_COMPLIANT)
             
-            individual_data.append({
+            individual_data[i] = {
                 "username": username,
                 "total_hours": hours["total_hours"],
                 "certifications": [t.to_dict() for t in trackers]
-            })
+            }
+        
+        # Reduce the packed column in one C pass; fsum also avoids drift
+        # from accumulating many rounded per-member totals
+        total_hours = math.fsum(member_hours)
         
         report = ComplianceReport(
             report_id=str(uuid.uuid4()),
             report_type="team",
             title=f"Team Compliance Report - {team_name}",
             generated_by=generated_by,
-            generated_at=datetime.now(timezone.utc),
+            generated_at=now,
             period_start=period_start,
             period_end=period_end,
             data={
@@ -927,72 +1119,103 @@ class ComplianceManager:
         report_type: Optional[str] = None,
         limit: int = 50
     ) -> list[ComplianceReport]:
-        """List generated reports."""
-        reports = list(self._reports.values())
+        """List generated reports, newest first."""
+        # Reports are stored as they are generated, so walking the dict
+        # backwards yields them newest first without sorting
+        reports = reversed(self._reports.values())
         
         if report_type:
-            reports = [r for r in reports if r.report_type == report_type]
+            reports = (r for r in reports if r.report_type == report_type)
         
-        reports.sort(key=lambda r: r.generated_at, reverse=True)
-        return reports[:limit]
+        return list(itertools.islice(reports, max(limit, 0)))
 
-    def export_report(self, report_id: str, format: ReportFormat) -> Optional[str]:
-        """Export a report in the specified format."""
+    def export_report(
+        self, report_id: str, format: ReportFormat = ReportFormat.JSON
+    ) -> Optional[bytes]:
+        """Export a report in the specified format as UTF-8 bytes."""
         report = self._reports.get(report_id)
         if not report:
             return None
         
         if format == ReportFormat.JSON:
-            return json.dumps(report.to_dict(), indent=2)
+            # Encode the dataclass directly rather than via to_dict()
+            return _json_dumps(report, indent=True)
         elif format == ReportFormat.CSV:
-            return self._export_to_csv(report)
+            return self._export_to_csv(report).encode("utf-8")
         else:
             return None  # PDF would require additional libraries
 
     def _export_to_csv(self, report: ComplianceReport) -> str:
         """Export report to CSV format."""
-        lines = [
-            f"Report: {report.title}",
-            f"Generated: {report.generated_at.isoformat()}",
-            f"Period: {report.period_start.isoformat()} to {report.period_end.isoformat()}",
-            "",
-            "Summary:",
-        ]
+        buf = io.StringIO()
+        writer = csv.writer(buf, lineterminator="\n")
+        writer.writerows((
+            (f"Report: {report.title}",),
+            (f"Generated: {report.generated_at.isoformat()}",),
+            (f"Period: {report.period_start.isoformat()} to {report.period_end.isoformat()}",),
+            (),
+            ("Summary:",),
+        ))
+        writer.writerows(report.summary.items())
+        writer.writerows(((), ("Training Records:",)))
         
-        for key, value in report.summary.items():
-            lines.append(f"{key},{value}")
+        if "training_records" in report.data:
+            writer.writerow(("Record ID", "Scenario", "Duration (min)", "Score", "Passed"))
+            writer.writerows(
+                row if row[3] is not None else (*row[:3], "N/A", row[4])
+                for row in map(_REPORT_RECORD_ROW, report.data["training_records"])
+            )
         
-        lines.append("")
-        lines.append("Training Records:")
+        return buf.getvalue()
+
+    def export_training_records_csv(
+        self,
+        username: str,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None
+    ) -> Iterator[bytes]:
+        """
+        Stream a user's training records as UTF-8 CSV.
         
-        if "training_records" in report.data:
-            lines.append("Record ID,Scenario,Duration (min),Score,Passed")
-            for record in report.data["training_records"]:
-                lines.append(
-                    f"{record['record_id']},{record['scenario_name']},"
-                    f"{record['duration_minutes']},{record.get('score', 'N/A')},"
-                    f"{record['passed']}"
-                )
+        Yields the header and then chunks of up to _CSV_CHUNK_ROWS rows, so
+        memory use stays flat however many records the user has.
+        """
+        records = self.get_user_training_records(username, start_date, end_date)
+        buf = _ChunkBuffer()
+        writer = csv.writer(buf)
+        writer.writerow(_TRAINING_CSV_HEADER)
+        yield buf.drain()
         
-        return "\n".join(lines)
+        writerow = writer.writerow
+        for i, r in enumerate(records, 1):
+            writerow((
+                r.record_id, r.username, r.scenario_id, r.scenario_name,
+                r.exercise_id, r.exercise_name, r.started_at.isoformat(),
+                r.completed_at.isoformat() if r.completed_at else None,
+                r.duration_minutes, r.score, r.passed,
+                ";".join(c.value for c in r.nist_categories),
+                r.verified_by,
+                r.verified_at.isoformat() if r.verified_at else None
+            ))
+            if i % _CSV_CHUNK_ROWS == 0:
+                yield buf.drain()
+        if buf.parts:
+            yield buf.drain()
 
     def get_statistics(self) -> dict:
         """Get compliance reporting statistics."""
+        status_counts = Counter(map(_get_status, self._user_trackers.values()))
         return {
             "total_nist_mappings": len(self._nist_mappings),
             "total_training_records": len(self._training_records),
             "total_certification_requirements": len(self._certification_requirements),
-            "active_trackers": len([
-                t for t in self._user_trackers.values()
-                if t.status not in [ComplianceStatus.EXPIRED, ComplianceStatus.COMPLIANT]
-            ]),
+            "active_trackers": sum(
+                count for status, count in status_counts.items()
+                if status not in _INACTIVE_STATUSES
+            ),
             "generated_reports": len(self._reports),
             "compliance_by_status": {
-                status.value: len([
-                    t for t in self._user_trackers.values()
-                    if t.status == status
-                ])
-                for status in ComplianceStatus
+                status.value: status_counts[status] for status in _CS_MEMBERS
             }
         }
 
@@ -4,13 +4,13 @@ Supports both PostgreSQL (production) and SQLite (development/testing).
 """
 import os
 from typing import AsyncGenerator
+from sqlalchemy import event
 from sqlalchemy.ext.asyncio import (
     create_async_engine,
     AsyncSession,
     async_sessionmaker
 )
-from sqlalchemy.orm import DeclarativeBase
-from sqlalchemy.pool import NullPool
+from sqlalchemy.orm import DeclarativeBase, ORMExecuteState, Session
 
 # Database URL from environment, defaults to SQLite for development
 DATABASE_URL = os.environ.get(
@@ -19,21 +19,25 @@ DATABASE_URL = os.environ.get(
 )
 
 # Convert postgres:// to postgresql+asyncpg:// for async support
-if DATABASE_URL.startswith("postgresql://"):
-    DATABASE_URL = DATABASE_URL.replace(
-        "postgresql://", "postgresql+asyncpg://", 1
-    )
-elif DATABASE_URL.startswith("postgres://"):
-    DATABASE_URL = DATABASE_URL.replace(
-        "postgres://", "postgresql+asyncpg://", 1
-    )
+_ASYNC_DRIVER_PREFIXES = (
+    ("postgresql://", "postgresql+asyncpg://"),
+    ("postgres://", "postgresql+asyncpg://"),
+)
+for _old, _new in _ASYNC_DRIVER_PREFIXES:
+    if DATABASE_URL.startswith(_old):
+        DATABASE_URL = _new + DATABASE_URL[len(_old):]
+        break
 
 # Create async engine
-# Use NullPool for SQLite to avoid threading issues
-engine_kwargs = {}
+# Connections are pooled and reused across requests. aiosqlite gives each
+# connection its own thread, so file-backed SQLite pools safely; in-memory
+# SQLite keeps SQLAlchemy's single static connection, which takes no sizing.
+engine_kwargs = {"pool_pre_ping": True}
 if DATABASE_URL.startswith("sqlite"):
-    engine_kwargs["poolclass"] = NullPool
     engine_kwargs["connect_args"] = {"check_same_thread": False}
+if ":memory:" not in DATABASE_URL and DATABASE_URL != "sqlite+aiosqlite://":
+    engine_kwargs["pool_size"] = int(os.environ.get("DB_POOL_SIZE", "5"))
+    engine_kwargs["max_overflow"] = int(os.environ.get("DB_MAX_OVERFLOW", "10"))
 
 engine = create_async_engine(
     DATABASE_URL,
@@ -49,6 +53,32 @@ async_session_maker = async_sessionmaker(
 )
 
 
+# Record on each session whether it has written anything, so get_db() can
+# skip the COMMIT round-trip for read-only requests
+_WRITES_KEY = "has_writes"
+
+
+@event.listens_for(Session, "after_flush")
+def _mark_flush(session: Session, flush_context) -> None:
+    session.info[_WRITES_KEY] = True
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _mark_dml(state: ORMExecuteState) -> None:
+    # text() and other non-ORM statements report no DML kind, so anything
+    # that is not a select counts as a write
+    if not state.is_select:
+        state.session.info[_WRITES_KEY] = True
+
+
+def _has_writes(session: AsyncSession) -> bool:
+    """Whether the session has pending or already flushed changes."""
+    return bool(
+        session.new or session.dirty or session.deleted
+        or session.info.get(_WRITES_KEY)
+    )
+
+
 class Base(DeclarativeBase):
     """Base class for all SQLAlchemy models."""
     pass
@@ -61,11 +91,17 @@ async def init_db() -> None:
 
 
 async def get_db() -> AsyncGenerator[AsyncSession, None]:
-    """Dependency that provides a database session."""
+    """
+    Dependency that provides a database session.
+
+    The session is committed on exit only if it has changes to persist;
+    read-only requests just release the connection.
+    """
     async with async_session_maker() as session:
         try:
             yield session
-            await session.commit()
+            if _has_writes(session):
+                await session.commit()
         except Exception:
             await session.rollback()
             raise
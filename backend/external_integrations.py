@@ -8,14 +8,20 @@ Provides integration with external cybersecurity and network tools:
 - GNU Radio SDR integration
 """
 
+from collections import deque
 from enum import Enum
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Dict, List, Optional, Any, Callable
+from typing import Dict, List, Optional, Any, Callable, Tuple
+import bisect
+import itertools
 import json
+import time
 import uuid
 import re
 
+from _codegen import make_to_dict
+
 
 class IntegrationType(Enum):
     """Types of external integrations."""
@@ -45,32 +51,22 @@ class LogLevel(Enum):
     CRITICAL = "critical"
 
 
-@dataclass
+@make_to_dict
+@dataclass(slots=True, frozen=True)
 class MitreAttackTechnique:
-    """MITRE ATT&CK technique."""
+    """MITRE ATT&CK technique. Catalogue entries are shared and immutable."""
     technique_id: str  # e.g., T1059
     name: str
     tactic: str  # e.g., Execution
     description: str
-    platforms: List[str] = field(default_factory=list)
-    data_sources: List[str] = field(default_factory=list)
+    platforms: Tuple[str, ...] = ()
+    data_sources: Tuple[str, ...] = ()
     detection: str = ""
     url: str = ""
-    
-    def to_dict(self) -> dict:
-        return {
-            "technique_id": self.technique_id,
-            "name": self.name,
-            "tactic": self.tactic,
-            "description": self.description,
-            "platforms": self.platforms,
-            "data_sources": self.data_sources,
-            "detection": self.detection,
-            "url": self.url
-        }
 
 
-@dataclass
+@make_to_dict
+@dataclass(slots=True)
 class MitreAttackMapping:
     """Mapping of a scenario to MITRE ATT&CK techniques."""
     mapping_id: str
@@ -80,20 +76,13 @@ class MitreAttackMapping:
     created_at: datetime
     created_by: str
     notes: str = ""
-    
-    def to_dict(self) -> dict:
-        return {
-            "mapping_id": self.mapping_id,
-            "scenario_id": self.scenario_id,
-            "scenario_name": self.scenario_name,
-            "techniques": self.techniques,
-            "created_at": self.created_at.isoformat(),
-            "created_by": self.created_by,
-            "notes": self.notes
-        }
 
 
-@dataclass
+@make_to_dict(extra={
+    # Credentials never leave the server
+    "config": '{k: v for k, v in self.config.items() if k != "password" and k != "api_key"}'
+})
+@dataclass(slots=True)
 class IntegrationConfig:
     """Configuration for an external integration."""
     integration_id: str
@@ -106,23 +95,10 @@ class IntegrationConfig:
     error_message: Optional[str] = None
     created_at: datetime = field(default_factory=datetime.utcnow)
     created_by: str = ""
-    
-    def to_dict(self) -> dict:
-        return {
-            "integration_id": self.integration_id,
-            "integration_type": self.integration_type.value,
-            "name": self.name,
-            "enabled": self.enabled,
-            "config": {k: v for k, v in self.config.items() if k != "password" and k != "api_key"},
-            "status": self.status.value,
-            "last_connected": self.last_connected.isoformat() if self.last_connected else None,
-            "error_message": self.error_message,
-            "created_at": self.created_at.isoformat(),
-            "created_by": self.created_by
-        }
 
 
-@dataclass
+@make_to_dict
+@dataclass(slots=True)
 class LogForwardingRule:
     """Rule for forwarding logs to external systems."""
     rule_id: str
@@ -135,23 +111,10 @@ class LogForwardingRule:
     batch_size: int = 100
     flush_interval_seconds: int = 30
     created_at: datetime = field(default_factory=datetime.utcnow)
-    
-    def to_dict(self) -> dict:
-        return {
-            "rule_id": self.rule_id,
-            "name": self.name,
-            "integration_id": self.integration_id,
-            "enabled": self.enabled,
-            "log_levels": [l.value for l in self.log_levels],
-            "source_filter": self.source_filter,
-            "include_metadata": self.include_metadata,
-            "batch_size": self.batch_size,
-            "flush_interval_seconds": self.flush_interval_seconds,
-            "created_at": self.created_at.isoformat()
-        }
 
 
-@dataclass
+@make_to_dict
+@dataclass(slots=True)
 class NetworkEmulationConfig:
     """Configuration for network emulation (Mininet/CORE)."""
     config_id: str
@@ -162,18 +125,253 @@ class NetworkEmulationConfig:
     link_params: Dict[str, Any] = field(default_factory=dict)
     host_params: Dict[str, Any] = field(default_factory=dict)
     switch_params: Dict[str, Any] = field(default_factory=dict)
+
+
+# Built-in MITRE ATT&CK techniques, built once at import
+_BUILTIN_TECHNIQUES: Tuple[MitreAttackTechnique, ...] = (
+    MitreAttackTechnique(
+        technique_id="T1059",
+        name="Command and Scripting Interpreter",
+        tactic="Execution",
+        description="Adversaries may abuse command and script interpreters to execute commands, scripts, or binaries.",
+        platforms=("Windows", "Linux", "macOS"),
+        data_sources=("Process", "Command"),
+        detection="Monitor command-line arguments and script execution",
+        url="https://attack.mitre.org/techniques/T1059/"
+    ),
+    MitreAttackTechnique(
+        technique_id="T1059.001",
+        name="PowerShell",
+        tactic="Execution",
+        description="Adversaries may abuse PowerShell commands and scripts for execution.",
+        platforms=("Windows",),
+        data_sources=("Process", "Script"),
+        detection="Monitor PowerShell execution logs",
+        url="https://attack.mitre.org/techniques/T1059/001/"
+    ),
+    MitreAttackTechnique(
+        technique_id="T1059.004",
+        name="Unix Shell",
+        tactic="Execution",
+        description="Adversaries may abuse Unix shell commands for execution.",
+        platforms=("Linux", "macOS"),
+        data_sources=("Process", "Command"),
+        detection="Monitor shell command execution",
+        url="https://attack.mitre.org/techniques/T1059/004/"
+    ),
+    MitreAttackTechnique(
+        technique_id="T1078",
+        name="Valid Accounts",
+        tactic="Persistence",
+        description="Adversaries may obtain and abuse credentials of existing accounts.",
+        platforms=("Windows", "Linux", "macOS", "Cloud"),
+        data_sources=("Authentication", "User Account"),
+        detection="Monitor for unusual authentication activity",
+        url="https://attack.mitre.org/techniques/T1078/"
+    ),
+    MitreAttackTechnique(
+        technique_id="T1110",
+        name="Brute Force",
+        tactic="Credential Access",
+        description="Adversaries may use brute force techniques to gain access to accounts.",
+        platforms=("Windows", "Linux", "macOS", "Cloud"),
+        data_sources=("Authentication", "User Account"),
+        detection="Monitor for multiple failed authentication attempts",
+        url="https://attack.mitre.org/techniques/T1110/"
+    ),
+    MitreAttackTechnique(
+        technique_id="T1046",
+        name="Network Service Discovery",
+        tactic="Discovery",
+        description="Adversaries may scan for open ports and services on networked systems.",
+        platforms=("Windows", "Linux", "macOS"),
+        data_sources=("Network Traffic", "Process"),
+        detection="Monitor for port scanning activity",
+        url="https://attack.mitre.org/techniques/T1046/"
+    ),
+    MitreAttackTechnique(
+        technique_id="T1021",
+        name="Remote Services",
+        tactic="Lateral Movement",
+        description="Adversaries may use remote services to access internal systems.",
+        platforms=("Windows", "Linux", "macOS"),
+        data_sources=("Authentication", "Network Traffic"),
+        detection="Monitor for unusual remote service connections",
+        url="https://attack.mitre.org/techniques/T1021/"
+    ),
+    MitreAttackTechnique(
+        technique_id="T1021.001",
+        name="Remote Desktop Protocol",
+        tactic="Lateral Movement",
+        description="Adversaries may use RDP to connect to remote systems.",
+        platforms=("Windows",),
+        data_sources=("Network Traffic", "Process"),
+        detection="Monitor RDP connections",
+        url="https://attack.mitre.org/techniques/T1021/001/"
+    ),
+    MitreAttackTechnique(
+        technique_id="T1021.004",
+        name="SSH",
+        tactic="Lateral Movement",
+        description="Adversaries may use SSH to connect to remote systems.",
+        platforms=("Linux", "macOS"),
+        data_sources=("Network Traffic", "Process"),
+        detection="Monitor SSH connections",
+        url="https://attack.mitre.org/techniques/T1021/004/"
+    ),
+    MitreAttackTechnique(
+        technique_id="T1486",
+        name="Data Encrypted for Impact",
+        tactic="Impact",
+        description="Adversaries may encrypt data to disrupt system availability.",
+        platforms=("Windows", "Linux", "macOS"),
+        data_sources=("File", "Process"),
+        detection="Monitor for mass file encryption",
+        url="https://attack.mitre.org/techniques/T1486/"
+    ),
+    MitreAttackTechnique(
+        technique_id="T1071",
+        name="Application Layer Protocol",
+        tactic="Command and Control",
+        description="Adversaries may use application layer protocols for C2.",
+        platforms=("Windows", "Linux", "macOS"),
+        data_sources=("Network Traffic",),
+        detection="Monitor for unusual application protocol traffic",
+        url="https://attack.mitre.org/techniques/T1071/"
+    ),
+    MitreAttackTechnique(
+        technique_id="T1041",
+        name="Exfiltration Over C2 Channel",
+        tactic="Exfiltration",
+        description="Adversaries may exfiltrate data over the C2 channel.",
+        platforms=("Windows", "Linux", "macOS"),
+        data_sources=("Network Traffic",),
+        detection="Monitor for large data transfers over C2",
+        url="https://attack.mitre.org/techniques/T1041/"
+    ),
+    MitreAttackTechnique(
+        technique_id="T1190",
+        name="Exploit Public-Facing Application",
+        tactic="Initial Access",
+        description="Adversaries may exploit vulnerabilities in public-facing applications.",
+        platforms=("Windows", "Linux", "macOS", "Cloud"),
+        data_sources=("Application Log", "Network Traffic"),
+        detection="Monitor for exploitation attempts",
+        url="https://attack.mitre.org/techniques/T1190/"
+    ),
+    MitreAttackTechnique(
+        technique_id="T1566",
+        name="Phishing",
+        tactic="Initial Access",
+        description="Adversaries may send phishing messages to gain access.",
+        platforms=("Windows", "Linux", "macOS", "Cloud"),
+        data_sources=("Email", "Network Traffic"),
+        detection="Monitor for suspicious emails and attachments",
+        url="https://attack.mitre.org/techniques/T1566/"
+    ),
+    MitreAttackTechnique(
+        technique_id="T1003",
+        name="OS Credential Dumping",
+        tactic="Credential Access",
+        description="Adversaries may attempt to dump credentials from the OS.",
+        platforms=("Windows", "Linux", "macOS"),
+        data_sources=("Process", "File"),
+        detection="Monitor for credential dumping tools",
+        url="https://attack.mitre.org/techniques/T1003/"
+    ),
+)
+
+
+class _TechniqueCorpus:
+    """
+    Lowercased name, description and ID of every technique joined into one
+    string, so a text search is a run of str.find calls over the whole
+    catalogue rather than a substring test per technique.
+    """
+    __slots__ = ("_text", "_starts", "_ends", "_techniques")
     
-    def to_dict(self) -> dict:
-        return {
-            "config_id": self.config_id,
-            "name": self.name,
-            "topology_id": self.topology_id,
-            "emulator_type": self.emulator_type,
-            "controller": self.controller,
-            "link_params": self.link_params,
-            "host_params": self.host_params,
-            "switch_params": self.switch_params
-        }
+    def __init__(self, techniques: Tuple[MitreAttackTechnique, ...]):
+        parts = []
+        self._starts: List[int] = []
+        self._ends: List[int] = []
+        offset = 0
+        for tech in techniques:
+            # NUL separates fields and newline separates techniques, so a
+            # match can be checked against its technique's bounds
+            part = f"{tech.name}\x00{tech.description}\x00{tech.technique_id}".lower()
+            parts.append(part)
+            self._starts.append(offset)
+            offset += len(part)
+            self._ends.append(offset)
+            offset += 1
+        self._text = "\n".join(parts)
+        self._techniques = techniques
+    
+    def search(self, needle: str) -> Dict[str, MitreAttackTechnique]:
+        """Find techniques containing needle, as technique_id -> technique in catalogue order."""
+        text, starts, ends = self._text, self._starts, self._ends
+        matches: Dict[str, MitreAttackTechnique] = {}
+        pos = text.find(needle)
+        while pos != -1:
+            i = bisect.bisect_right(starts, pos) - 1
+            if pos + len(needle) <= ends[i]:
+                tech = self._techniques[i]
+                matches[tech.technique_id] = tech
+                # One hit per technique is enough; resume at the next one
+                pos = text.find(needle, ends[i] + 1)
+            else:
+                # The hit runs into the next technique; look again further on
+                pos = text.find(needle, pos + 1)
+        return matches
+
+
+def _index_techniques(techniques: Tuple[MitreAttackTechnique, ...]) -> tuple:
+    """
+    Build the technique lookup tables: by ID, by tactic and by platform (each
+    bucket maps technique_id -> technique in catalogue order), and the
+    search corpus.
+    """
+    by_id: Dict[str, MitreAttackTechnique] = {}
+    by_tactic: Dict[str, Dict[str, MitreAttackTechnique]] = {}
+    by_platform: Dict[str, Dict[str, MitreAttackTechnique]] = {}
+    for tech in techniques:
+        by_id[tech.technique_id] = tech
+        by_tactic.setdefault(tech.tactic, {})[tech.technique_id] = tech
+        for platform in tech.platforms:
+            by_platform.setdefault(platform, {})[tech.technique_id] = tech
+    return by_id, by_tactic, by_platform, _TechniqueCorpus(techniques)
+
+
+(
+    _BUILTIN_TECHNIQUE_INDEX,
+    _BUILTIN_TECHNIQUES_BY_TACTIC,
+    _BUILTIN_TECHNIQUES_BY_PLATFORM,
+    _BUILTIN_TECHNIQUE_CORPUS,
+) = _index_techniques(_BUILTIN_TECHNIQUES)
+
+
+# Forwarded entries kept for inspection; the oldest are dropped beyond this
+MAX_LOG_BUFFER = 10000
+
+# (epoch second, its formatted "YYYY-MM-DDTHH:MM:SS") for _utc_now_iso
+_iso_second = (-1, "")
+
+
+def _utc_now_iso() -> str:
+    """
+    Current UTC time formatted like datetime.utcnow().isoformat().
+    
+    The date and time of day are formatted once per second and reused;
+    only the microseconds are added per call.
+    """
+    global _iso_second
+    second, nanos = divmod(time.time_ns(), 1_000_000_000)
+    cached_second, prefix = _iso_second
+    if second != cached_second:
+        prefix = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(second))
+        _iso_second = (second, prefix)
+    micros = nanos // 1000
+    return f"{prefix}.{micros:06d}" if micros else prefix
 
 
 class ExternalIntegrations:
@@ -205,181 +403,30 @@ class ExternalIntegrations:
         "Impact"
     ]
     
-    def __init__(self):
+    def __init__(self, max_log_buffer: int = MAX_LOG_BUFFER):
         # Integration configurations
         self._integrations: Dict[str, IntegrationConfig] = {}
         
-        # MITRE ATT&CK data
-        self._techniques: Dict[str, MitreAttackTechnique] = {}
+        # MITRE ATT&CK data. The built-in catalogue and its indexes are
+        # immutable, so every instance shares the tables built at import.
+        self._techniques: Dict[str, MitreAttackTechnique] = _BUILTIN_TECHNIQUE_INDEX
+        self._techniques_by_tactic = _BUILTIN_TECHNIQUES_BY_TACTIC
+        self._techniques_by_platform = _BUILTIN_TECHNIQUES_BY_PLATFORM
+        self._technique_corpus = _BUILTIN_TECHNIQUE_CORPUS
         self._mappings: Dict[str, MitreAttackMapping] = {}
+        # Secondary index so scenario lookups avoid a full scan
+        self._mappings_by_scenario: Dict[str, List[str]] = {}
         
         # Log forwarding rules
         self._forwarding_rules: Dict[str, LogForwardingRule] = {}
-        self._log_buffer: List[Dict] = []
+        # Compiled source filters for rules that have one, by rule_id
+        self._compiled_filters: Dict[str, re.Pattern] = {}
+        # Rules subscribed to each level, rule_id -> rule in creation order
+        self._rules_by_level: Dict[LogLevel, Dict[str, LogForwardingRule]] = {}
+        self._log_buffer: deque = deque(maxlen=max_log_buffer)
         
         # Network emulation configs
         self._emulation_configs: Dict[str, NetworkEmulationConfig] = {}
-        
-        # Initialize built-in MITRE ATT&CK techniques
-        self._init_attack_techniques()
-    
-    def _init_attack_techniques(self):
-        """Initialize common MITRE ATT&CK techniques."""
-        techniques = [
-            MitreAttackTechnique(
-                technique_id="T1059",
-                name="Command and Scripting Interpreter",
-                tactic="Execution",
-                description="Adversaries may abuse command and script interpreters to execute commands, scripts, or binaries.",
-                platforms=["Windows", "Linux", "macOS"],
-                data_sources=["Process", "Command"],
-                detection="Monitor command-line arguments and script execution",
-                url="https://attack.mitre.org/techniques/T1059/"
-            ),
-            MitreAttackTechnique(
-                technique_id="T1059.001",
-                name="PowerShell",
-                tactic="Execution",
-                description="Adversaries may abuse PowerShell commands and scripts for execution.",
-                platforms=["Windows"],
-                data_sources=["Process", "Script"],
-                detection="Monitor PowerShell execution logs",
-                url="https://attack.mitre.org/techniques/T1059/001/"
-            ),
-            MitreAttackTechnique(
-                technique_id="T1059.004",
-                name="Unix Shell",
-                tactic="Execution",
-                description="Adversaries may abuse Unix shell commands for execution.",
-                platforms=["Linux", "macOS"],
-                data_sources=["Process", "Command"],
-                detection="Monitor shell command execution",
-                url="https://attack.mitre.org/techniques/T1059/004/"
-            ),
-            MitreAttackTechnique(
-                technique_id="T1078",
-                name="Valid Accounts",
-                tactic="Persistence",
-                description="Adversaries may obtain and abuse credentials of existing accounts.",
-                platforms=["Windows", "Linux", "macOS", "Cloud"],
-                data_sources=["Authentication", "User Account"],
-                detection="Monitor for unusual authentication activity",
-                url="https://attack.mitre.org/techniques/T1078/"
-            ),
-            MitreAttackTechnique(
-                technique_id="T1110",
-                name="Brute Force",
-                tactic="Credential Access",
-                description="Adversaries may use brute force techniques to gain access to accounts.",
-                platforms=["Windows", "Linux", "macOS", "Cloud"],
-                data_sources=["Authentication", "User Account"],
-                detection="Monitor for multiple failed authentication attempts",
-                url="https://attack.mitre.org/techniques/T1110/"
-            ),
-            MitreAttackTechnique(
-                technique_id="T1046",
-                name="Network Service Discovery",
-                tactic="Discovery",
-                description="Adversaries may scan for open ports and services on networked systems.",
-                platforms=["Windows", "Linux", "macOS"],
-                data_sources=["Network Traffic", "Process"],
-                detection="Monitor for port scanning activity",
-                url="https://attack.mitre.org/techniques/T1046/"
-            ),
-            MitreAttackTechnique(
-                technique_id="T1021",
-                name="Remote Services",
-                tactic="Lateral Movement",
-                description="Adversaries may use remote services to access internal systems.",
-                platforms=["Windows", "Linux", "macOS"],
-                data_sources=["Authentication", "Network Traffic"],
-                detection="Monitor for unusual remote service connections",
-                url="https://attack.mitre.org/techniques/T1021/"
-            ),
-            MitreAttackTechnique(
-                technique_id="T1021.001",
-                name="Remote Desktop Protocol",
-                tactic="Lateral Movement",
-                description="Adversaries may use RDP to connect to remote systems.",
-                platforms=["Windows"],
-                data_sources=["Network Traffic", "Process"],
-                detection="Monitor RDP connections",
-                url="https://attack.mitre.org/techniques/T1021/001/"
-            ),
-            MitreAttackTechnique(
-                technique_id="T1021.004",
-                name="SSH",
-                tactic="Lateral Movement",
-                description="Adversaries may use SSH to connect to remote systems.",
-                platforms=["Linux", "macOS"],
-                data_sources=["Network Traffic", "Process"],
-                detection="Monitor SSH connections",
-                url="https://attack.mitre.org/techniques/T1021/004/"
-            ),
-            MitreAttackTechnique(
-                technique_id="T1486",
-                name="Data Encrypted for Impact",
-                tactic="Impact",
-                description="Adversaries may encrypt data to disrupt system availability.",
-                platforms=["Windows", "Linux", "macOS"],
-                data_sources=["File", "Process"],
-                detection="Monitor for mass file encryption",
-                url="https://attack.mitre.org/techniques/T1486/"
-            ),
-            MitreAttackTechnique(
-                technique_id="T1071",
-                name="Application Layer Protocol",
-                tactic="Command and Control",
-                description="Adversaries may use application layer protocols for C2.",
-                platforms=["Windows", "Linux", "macOS"],
-                data_sources=["Network Traffic"],
-                detection="Monitor for unusual application protocol traffic",
-                url="https://attack.mitre.org/techniques/T1071/"
-            ),
-            MitreAttackTechnique(
-                technique_id="T1041",
-                name="Exfiltration Over C2 Channel",
-                tactic="Exfiltration",
-                description="Adversaries may exfiltrate data over the C2 channel.",
-                platforms=["Windows", "Linux", "macOS"],
-                data_sources=["Network Traffic"],
-                detection="Monitor for large data transfers over C2",
-                url="https://attack.mitre.org/techniques/T1041/"
-            ),
-            MitreAttackTechnique(
-                technique_id="T1190",
-                name="Exploit Public-Facing Application",
-                tactic="Initial Access",
-                description="Adversaries may exploit vulnerabilities in public-facing applications.",
-                platforms=["Windows", "Linux", "macOS", "Cloud"],
-                data_sources=["Application Log", "Network Traffic"],
-                detection="Monitor for exploitation attempts",
-                url="https://attack.mitre.org/techniques/T1190/"
-            ),
-            MitreAttackTechnique(
-                technique_id="T1566",
-                name="Phishing",
-                tactic="Initial Access",
-                description="Adversaries may send phishing messages to gain access.",
-                platforms=["Windows", "Linux", "macOS", "Cloud"],
-                data_sources=["Email", "Network Traffic"],
-                detection="Monitor for suspicious emails and attachments",
-                url="https://attack.mitre.org/techniques/T1566/"
-            ),
-            MitreAttackTechnique(
-                technique_id="T1003",
-                name="OS Credential Dumping",
-                tactic="Credential Access",
-                description="Adversaries may attempt to dump credentials from the OS.",
-                platforms=["Windows", "Linux", "macOS"],
-                data_sources=["Process", "File"],
-                detection="Monitor for credential dumping tools",
-                url="https://attack.mitre.org/techniques/T1003/"
-            )
-        ]
-        
-        for tech in techniques:
-            self._techniques[tech.technique_id] = tech
     
     # ============ Integration Management ============
     
@@ -470,7 +517,7 @@ class ExternalIntegrations:
             "success": True,
             "integration_id": integration_id,
             "status": integration.status.value,
-            "tested_at": datetime.utcnow().isoformat()
+            "tested_at": _utc_now_iso()
         }
     
     # ============ MITRE ATT&CK Integration ============
@@ -486,21 +533,24 @@ class ExternalIntegrations:
         search: Optional[str] = None
     ) -> List[MitreAttackTechnique]:
         """List MITRE ATT&CK techniques."""
-        techniques = list(self._techniques.values())
-        
+        buckets = []
         if tactic:
-            techniques = [t for t in techniques if t.tactic == tactic]
-        
+            buckets.append(self._techniques_by_tactic.get(tactic, {}))
         if platform:
-            techniques = [t for t in techniques if platform in t.platforms]
-        
+            buckets.append(self._techniques_by_platform.get(platform, {}))
         if search:
-            search_lower = search.lower()
+            buckets.append(self._technique_corpus.search(search.lower()))
+        
+        if not buckets:
+            techniques = list(self._techniques.values())
+        else:
+            # Walk the smallest bucket and probe the others; buckets keep
+            # catalogue order, so results come out in the same order
+            buckets.sort(key=len)
+            smallest, others = buckets[0], buckets[1:]
             techniques = [
-                t for t in techniques
-                if search_lower in t.name.lower() or
-                   search_lower in t.description.lower() or
-                   search_lower in t.technique_id.lower()
+                t for technique_id, t in smallest.items()
+                if all(technique_id in other for other in others)
             ]
         
         return techniques
@@ -534,6 +584,7 @@ class ExternalIntegrations:
         )
         
         self._mappings[mapping_id] = mapping
+        self._mappings_by_scenario.setdefault(scenario_id, []).append(mapping_id)
         return mapping
     
     def get_attack_mapping(self, mapping_id: str) -> Optional[MitreAttackMapping]:
@@ -542,10 +593,10 @@ class ExternalIntegrations:
     
     def get_mapping_for_scenario(self, scenario_id: str) -> Optional[MitreAttackMapping]:
         """Get ATT&CK mapping for a scenario."""
-        for mapping in self._mappings.values():
-            if mapping.scenario_id == scenario_id:
-                return mapping
-        return None
+        mapping_ids = self._mappings_by_scenario.get(scenario_id)
+        if not mapping_ids:
+            return None
+        return self._mappings[mapping_ids[0]]
     
     def list_attack_mappings(
         self,
@@ -579,10 +630,15 @@ class ExternalIntegrations:
     
     def delete_attack_mapping(self, mapping_id: str) -> bool:
         """Delete an ATT&CK mapping."""
-        if mapping_id in self._mappings:
-            del self._mappings[mapping_id]
-            return True
-        return False
+        mapping = self._mappings.pop(mapping_id, None)
+        if mapping is None:
+            return False
+        
+        mapping_ids = self._mappings_by_scenario[mapping.scenario_id]
+        mapping_ids.remove(mapping_id)
+        if not mapping_ids:
+            del self._mappings_by_scenario[mapping.scenario_id]
+        return True
     
     def get_mapping_details(self, mapping_id: str) -> Optional[dict]:
         """Get detailed mapping with full technique info."""
@@ -619,7 +675,12 @@ class ExternalIntegrations:
         batch_size: int = 100,
         flush_interval: int = 30
     ) -> LogForwardingRule:
-        """Create a log forwarding rule."""
+        """
+        Create a log forwarding rule.
+        
+        Raises ValueError if source_filter is not a valid regular expression.
+        """
+        compiled_filter = self._compile_source_filter(source_filter)
         rule_id = str(uuid.uuid4())
         
         rule = LogForwardingRule(
@@ -633,8 +694,22 @@ class ExternalIntegrations:
         )
         
         self._forwarding_rules[rule_id] = rule
+        if compiled_filter:
+            self._compiled_filters[rule_id] = compiled_filter
+        for level in rule.log_levels:
+            self._rules_by_level.setdefault(level, {})[rule_id] = rule
         return rule
     
+    @staticmethod
+    def _compile_source_filter(source_filter: Optional[str]) -> Optional[re.Pattern]:
+        """Compile a rule's source filter once, so forwarding skips re's cache."""
+        if not source_filter:
+            return None
+        try:
+            return re.compile(source_filter)
+        except re.error as e:
+            raise ValueError(f"Invalid source filter: {e}") from e
+    
     def get_forwarding_rule(self, rule_id: str) -> Optional[LogForwardingRule]:
         """Get a forwarding rule by ID."""
         return self._forwarding_rules.get(rule_id)
@@ -663,15 +738,27 @@ class ExternalIntegrations:
         source_filter: Optional[str] = None,
         batch_size: Optional[int] = None
     ) -> Optional[LogForwardingRule]:
-        """Update a forwarding rule."""
+        """
+        Update a forwarding rule.
+        
+        Raises ValueError if source_filter is not a valid regular expression.
+        """
         rule = self._forwarding_rules.get(rule_id)
         if not rule:
             return None
         
+        if source_filter is not None:
+            compiled_filter = self._compile_source_filter(source_filter)
+            if compiled_filter:
+                self._compiled_filters[rule_id] = compiled_filter
+            else:
+                self._compiled_filters.pop(rule_id, None)
+        
         if enabled is not None:
             rule.enabled = enabled
         if log_levels is not None:
             rule.log_levels = log_levels
+            self._reindex_rules_by_level()
         if source_filter is not None:
             rule.source_filter = source_filter
         if batch_size is not None:
@@ -683,9 +770,20 @@ class ExternalIntegrations:
         """Delete a forwarding rule."""
         if rule_id in self._forwarding_rules:
             del self._forwarding_rules[rule_id]
+            self._compiled_filters.pop(rule_id, None)
+            for rules in self._rules_by_level.values():
+                rules.pop(rule_id, None)
             return True
         return False
     
+    def _reindex_rules_by_level(self):
+        """Rebuild the level index, keeping rules in creation order."""
+        rules_by_level: Dict[LogLevel, Dict[str, LogForwardingRule]] = {}
+        for rule in self._forwarding_rules.values():
+            for level in rule.log_levels:
+                rules_by_level.setdefault(level, {})[rule.rule_id] = rule
+        self._rules_by_level = rules_by_level
+    
     def forward_log(
         self,
         level: LogLevel,
@@ -695,7 +793,7 @@ class ExternalIntegrations:
     ) -> int:
         """Forward a log entry to configured integrations."""
         log_entry = {
-            "timestamp": datetime.utcnow().isoformat(),
+            "timestamp": _utc_now_iso(),
             "level": level.value,
             "source": source,
             "message": message,
@@ -704,17 +802,15 @@ class ExternalIntegrations:
         
         # Check matching rules
         forwarded_count = 0
-        for rule in self._forwarding_rules.values():
+        compiled_filters = self._compiled_filters
+        for rule in self._rules_by_level.get(level, {}).values():
             if not rule.enabled:
                 continue
             
-            if level not in rule.log_levels:
+            source_filter = compiled_filters.get(rule.rule_id)
+            if source_filter and not source_filter.match(source):
                 continue
             
-            if rule.source_filter:
-                if not re.match(rule.source_filter, source):
-                    continue
-            
             # Add to buffer (in real implementation, would forward to integration)
             self._log_buffer.append({
                 "rule_id": rule.rule_id,
@@ -725,8 +821,10 @@ class ExternalIntegrations:
         return forwarded_count
     
     def get_log_buffer(self, limit: int = 100) -> List[Dict]:
-        """Get buffered logs (for testing/debugging)."""
-        return self._log_buffer[-limit:]
+        """Get the most recent buffered logs, oldest first (for testing/debugging)."""
+        recent = list(itertools.islice(reversed(self._log_buffer), max(limit, 0)))
+        recent.reverse()
+        return recent
     
     def clear_log_buffer(self):
         """Clear the log buffer."""
@@ -1,6 +1,6 @@
 from fastapi import FastAPI, HTTPException, Depends, Request, WebSocket, WebSocketDisconnect
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import Response, JSONResponse
+from fastapi.responses import Response, JSONResponse, StreamingResponse
 from pydantic import BaseModel
 from typing import List, Optional
 import uuid
@@ -46,6 +46,7 @@ from backup_recovery import (
 from external_integrations import (
     external_integrations, IntegrationType, IntegrationStatus, LogLevel
 )
+from _fastjson import dumps as _json_dumps
 from rf_ew_simulation import (
     rf_ew_simulator, SignalType, ModulationType, JammingType,
     ThreatType, SimulationStatus as RFSimStatus
@@ -224,9 +225,9 @@ async def system_status(
 # ============ Authentication Endpoints ============
 
 @app.post("/auth/login", response_model=Token)
-def login(login_data: LoginRequest, request: Request):
+async def login(login_data: LoginRequest, request: Request):
     """Authenticate user and return JWT token."""
-    user = authenticate_user(login_data.username, login_data.password)
+    user = await authenticate_user(login_data.username, login_data.password)
     if not user:
         log_action(
             action=AuditAction.FAILED_LOGIN,
@@ -262,12 +263,12 @@ def get_current_user_info(current_user: User = Depends(get_current_user)):
 
 
 @app.post("/auth/register", response_model=User)
-def register_user(
+async def register_user(
     user_data: UserCreate,
     current_user: User = Depends(require_role([UserRole.ADMIN]))
 ):
     """Register a new user (admin only)."""
-    new_user = create_user(user_data)
+    new_user = await create_user(user_data)
     log_action(
         action=AuditAction.CREATE_USER,
         username=current_user.username,
@@ -3953,7 +3954,9 @@ async def list_attack_techniques(
         platform=platform,
         search=search
     )
-    return [t.to_dict() for t in techniques]
+    # Techniques hold only strings and tuples, so orjson encodes the
+    # dataclasses directly with the same output as to_dict()
+    return Response(content=_json_dumps(techniques), media_type="application/json")
 
 
 @app.get("/mitre-attack/techniques/{technique_id}")
@@ -4083,14 +4086,17 @@ async def create_forwarding_rule(
     except ValueError as e:
         raise HTTPException(status_code=400, detail=f"Invalid log level: {e}")
     
-    rule = external_integrations.create_forwarding_rule(
-        name=request.name,
-        integration_id=request.integration_id,
-        log_levels=log_levels,
-        source_filter=request.source_filter,
-        batch_size=request.batch_size,
-        flush_interval=request.flush_interval
-    )
+    try:
+        rule = external_integrations.create_forwarding_rule(
+            name=request.name,
+            integration_id=request.integration_id,
+            log_levels=log_levels,
+            source_filter=request.source_filter,
+            batch_size=request.batch_size,
+            flush_interval=request.flush_interval
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     
     return rule.to_dict()
 
@@ -4135,13 +4141,16 @@ async def update_forwarding_rule_endpoint(
         except ValueError as e:
             raise HTTPException(status_code=400, detail=f"Invalid log level: {e}")
     
-    rule = external_integrations.update_forwarding_rule(
-        rule_id=rule_id,
-        enabled=request.enabled,
-        log_levels=log_levels,
-        source_filter=request.source_filter,
-        batch_size=request.batch_size
-    )
+    try:
+        rule = external_integrations.update_forwarding_rule(
+            rule_id=rule_id,
+            enabled=request.enabled,
+            log_levels=log_levels,
+            source_filter=request.source_filter,
+            batch_size=request.batch_size
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     
     if not rule:
         raise HTTPException(status_code=404, detail="Rule not found")
@@ -5011,6 +5020,30 @@ async def get_user_training_hours(
     )
 
 
+@app.get("/compliance/training/users/{username}/export")
+async def export_user_training_records(
+    username: str,
+    start_date: Optional[str] = None,
+    end_date: Optional[str] = None,
+    current_user: User = Depends(require_role([UserRole.ADMIN, UserRole.INSTRUCTOR]))
+) -> StreamingResponse:
+    """Stream a user's training records as CSV (admin/instructor only)."""
+    start = datetime.fromisoformat(start_date) if start_date else None
+    end = datetime.fromisoformat(end_date) if end_date else None
+    
+    return StreamingResponse(
+        compliance_manager.export_training_records_csv(
+            username=username,
+            start_date=start,
+            end_date=end
+        ),
+        media_type="text/csv",
+        headers={
+            "Content-Disposition": f'attachment; filename="training_records_{username}.csv"'
+        }
+    )
+
+
 # Certification Requirements
 
 @app.get("/compliance/certifications/requirements")
@@ -1,8 +1,22 @@
 """Tests for authentication and audit logging."""
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+from unittest.mock import patch
+
+import pytest
 from fastapi.testclient import TestClient
+from jose import JWTError, jwt
 from main import app
-from auth import users_db, UserRole
-from audit import clear_audit_logs
+from auth import (
+    UserRole, BCRYPT_ROUNDS, create_access_token, decode_token,
+    clear_token_cache, get_password_hash, verify_password, authenticate_user,
+    delete_user, list_users, require_role, get_user_from_token,
+    SECRET_KEY, ALGORITHM
+)
+from audit import (
+    AuditAction, MAX_AUDIT_LOGS, clear_audit_logs, get_audit_logs, log_action
+)
 
 client = TestClient(app)
 
@@ -101,8 +115,7 @@ def test_register_user_as_admin():
     assert data["role"] == UserRole.TRAINEE
 
     # Clean up
-    if "newuser" in users_db:
-        del users_db["newuser"]
+    delete_user("newuser")
 
 
 def test_register_user_as_trainee_forbidden():
@@ -207,3 +220,250 @@ def test_failed_login_audit():
     # Should have a failed login entry
     failed_logins = [log for log in logs if log["action"] == "failed_login"]
     assert len(failed_logins) >= 1
+
+
+def test_decode_token_is_cached():
+    """Repeated decodes of the same token reuse the cached payload."""
+    clear_token_cache()
+    token = create_access_token({"sub": "admin", "role": UserRole.ADMIN})
+
+    first = decode_token(token)
+    second = decode_token(token)
+
+    assert first is second
+    assert first["sub"] == "admin"
+
+
+def test_decode_token_rejects_expired_cached_token():
+    """A cached token is rejected once its expiry has passed."""
+    clear_token_cache()
+    token = create_access_token(
+        {"sub": "admin", "role": UserRole.ADMIN},
+        expires_delta=timedelta(seconds=1)
+    )
+    payload = decode_token(token)
+
+    with patch("auth.time.time", return_value=payload["exp"] + 1):
+        with pytest.raises(JWTError):
+            decode_token(token)
+
+
+def test_get_audit_logs_filters_newest_first():
+    """Filtered audit queries return the most recent matches first."""
+    clear_audit_logs()
+    for i in range(5):
+        log_action(AuditAction.LOGIN, username="alice", details=str(i))
+        log_action(AuditAction.LOGOUT, username="bob", details=str(i))
+
+    logs = get_audit_logs(username="alice", limit=3)
+
+    assert [log.details for log in logs] == ["4", "3", "2"]
+    assert all(log.action == AuditAction.LOGIN for log in logs)
+    assert get_audit_logs(username="alice", action=AuditAction.LOGOUT) == []
+    assert get_audit_logs(limit=0) == []
+
+
+def test_get_audit_logs_skips_evicted_entries():
+    """Index lookups ignore entries that have rotated out of the log."""
+    clear_audit_logs()
+    log_action(AuditAction.LOGIN, username="carol")
+    for _ in range(MAX_AUDIT_LOGS):
+        log_action(AuditAction.LOGOUT, username="dave")
+
+    assert get_audit_logs(username="carol") == []
+    assert get_audit_logs(action=AuditAction.LOGIN) == []
+    assert len(get_audit_logs(username="dave", limit=MAX_AUDIT_LOGS)) == MAX_AUDIT_LOGS
+
+
+def test_audit_user_index_bounded_by_live_entries():
+    """Users whose entries have all rotated out drop out of the index."""
+    import audit
+
+    clear_audit_logs()
+    for i in range(3 * MAX_AUDIT_LOGS):
+        log_action(AuditAction.FAILED_LOGIN, username=f"guess-{i}", success=False)
+
+    assert len(audit._by_user) == MAX_AUDIT_LOGS
+    assert get_audit_logs(username="guess-0") == []
+    newest = f"guess-{3 * MAX_AUDIT_LOGS - 1}"
+    assert [log.username for log in get_audit_logs(username=newest)] == [newest]
+
+
+def test_log_action_assigns_unique_ids():
+    """Each audit entry gets a distinct id and a timezone-aware timestamp."""
+    first_id = log_action(AuditAction.LOGIN, username="erin")
+    second_id = log_action(AuditAction.LOGOUT, username="erin")
+
+    second, first = get_audit_logs(username="erin", limit=2)
+    assert first_id != second_id
+    assert (first.id, second.id) == (first_id, second_id)
+    assert first.timestamp.tzinfo is not None
+
+
+def test_log_action_concurrent_writers():
+    """Entries logged from several threads are neither lost nor torn."""
+    clear_audit_logs()
+    users = ["t0", "t1", "t2", "t3"]
+
+    def write(username):
+        for i in range(MAX_AUDIT_LOGS // 4):
+            log_action(AuditAction.LOGIN, username=username, details=f"{username}-{i}")
+
+    with ThreadPoolExecutor(max_workers=len(users)) as pool:
+        list(pool.map(write, users))
+
+    logs = get_audit_logs(limit=MAX_AUDIT_LOGS)
+    assert len(logs) == MAX_AUDIT_LOGS
+    assert len({log.id for log in logs}) == MAX_AUDIT_LOGS
+    assert all(log.details.startswith(f"{log.username}-") for log in logs)
+    for username in users:
+        assert len(get_audit_logs(username=username, limit=MAX_AUDIT_LOGS)) == MAX_AUDIT_LOGS // 4
+
+
+def test_password_hash_uses_configured_rounds():
+    """New password hashes use the configured bcrypt work factor."""
+    hashed = get_password_hash("s3cret-pass")
+
+    assert hashed.startswith(f"$2b${BCRYPT_ROUNDS:02d}$")
+    assert verify_password("s3cret-pass", hashed)
+    assert not verify_password("wrong-pass", hashed)
+
+
+@pytest.mark.asyncio
+async def test_authenticate_user_async():
+    """authenticate_user verifies passwords without blocking the loop."""
+    user = await authenticate_user("admin", "admin123")
+    assert user is not None
+    assert user.username == "admin"
+
+    assert await authenticate_user("admin", "wrongpassword") is None
+    assert await authenticate_user("nobody", "admin123") is None
+
+
+def test_list_users_cache_invalidated_on_write():
+    """The cached user listing reflects creates and deletes."""
+    before = {user.username for user in list_users()}
+    assert list_users() is list_users()
+
+    login_response = client.post("/auth/login", json={
+        "username": "admin",
+        "password": "admin123"
+    })
+    token = login_response.json()["access_token"]
+    client.post(
+        "/auth/register",
+        json={"username": "listed", "password": "listedpass"},
+        headers={"Authorization": f"Bearer {token}"}
+    )
+    assert {user.username for user in list_users()} == before | {"listed"}
+
+    delete_user("listed")
+    assert {user.username for user in list_users()} == before
+
+
+def test_get_audit_logs_custom_action_names():
+    """Actions outside AuditAction round-trip and unknown filters match nothing."""
+    clear_audit_logs()
+    log_action("custom_event", username="frank")
+
+    logs = get_audit_logs(action="custom_event")
+
+    assert len(logs) == 1
+    assert logs[0].action == "custom_event"
+    assert get_audit_logs(action="never_logged") == []
+
+
+def test_require_role_reuses_checker_for_same_roles():
+    """Equal role sets share one dependency regardless of order or type."""
+    checker = require_role([UserRole.ADMIN, UserRole.INSTRUCTOR])
+
+    assert require_role((UserRole.INSTRUCTOR, UserRole.ADMIN)) is checker
+    assert require_role([UserRole.ADMIN]) is not checker
+
+
+def test_get_audit_logs_combined_filters():
+    """Combined user and action filters match only rows satisfying both."""
+    clear_audit_logs()
+    for _ in range(20):
+        log_action(AuditAction.LOGOUT, username="grace")
+    log_action(AuditAction.KILL_SWITCH, username="grace")
+    log_action(AuditAction.KILL_SWITCH, username="heidi")
+
+    logs = get_audit_logs(username="grace", action=AuditAction.KILL_SWITCH)
+
+    assert [(log.username, log.action) for log in logs] == [
+        ("grace", AuditAction.KILL_SWITCH)
+    ]
+
+
+def test_decode_token_rejects_tampered_and_foreign_tokens():
+    """Tokens with a bad signature, another algorithm or bad encoding fail."""
+    clear_token_cache()
+    token = create_access_token({"sub": "admin", "role": UserRole.ADMIN})
+    header, payload, signature = token.split(".")
+    forged_payload = create_access_token(
+        {"sub": "admin", "role": UserRole.ADMIN, "extra": 1}
+    ).split(".")[1]
+    foreign_alg = jwt.encode({"sub": "admin"}, "k" * 32, algorithm="HS512")
+
+    for bad in (
+        f"{header}.{forged_payload}.{signature}",
+        f"{header}.{payload}.",
+        foreign_alg,
+        "not-a-jwt",
+        "",
+    ):
+        with pytest.raises(JWTError):
+            decode_token(bad)
+    assert decode_token(token)["sub"] == "admin"
+
+
+def test_decode_token_validates_registered_claims_like_jose():
+    """nbf, iat, aud, sub and jti are checked as python-jose checks them."""
+    clear_token_cache()
+    now = int(time.time())
+
+    def sign(claims):
+        return jwt.encode(claims, SECRET_KEY, algorithm=ALGORITHM)
+
+    for claims in (
+        {"sub": "admin", "nbf": now + 3600},
+        {"sub": "admin", "nbf": "soon"},
+        {"sub": "admin", "iat": "yesterday"},
+        {"sub": "admin", "aud": "someone-else"},
+        {"sub": ["admin"]},
+        {"sub": "admin", "jti": 7},
+    ):
+        token = sign(claims)
+        with pytest.raises(JWTError):
+            jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
+        with pytest.raises(JWTError):
+            decode_token(token)
+
+    valid = sign({"sub": "admin", "iat": now, "nbf": now - 1, "jti": "abc"})
+    assert decode_token(valid) == jwt.decode(valid, SECRET_KEY, algorithms=[ALGORITHM])
+
+
+def test_decode_token_rechecks_nbf_on_cached_token():
+    """A cached not-yet-valid token is accepted once its nbf has passed."""
+    clear_token_cache()
+    nbf = int(time.time()) + 60
+    token = jwt.encode({"sub": "admin", "nbf": nbf}, SECRET_KEY, algorithm=ALGORITHM)
+
+    with patch("auth.time.time", return_value=nbf - 1):
+        with pytest.raises(JWTError):
+            decode_token(token)
+    with patch("auth.time.time", return_value=nbf):
+        assert decode_token(token)["sub"] == "admin"
+
+
+def test_current_user_projection_is_reused():
+    """Requests for the same user share one cached User projection."""
+    token = create_access_token({"sub": "instructor", "role": UserRole.INSTRUCTOR})
+
+    first = get_user_from_token(token)
+    second = get_user_from_token(token)
+
+    assert first is second
+    assert first.username == "instructor"
+    assert not hasattr(first, "hashed_password")
@@ -1,11 +1,13 @@
 """Tests for backup and disaster recovery."""
 
+import hashlib
 import pytest
 from datetime import datetime, timedelta
 
 from backup_recovery import (
     BackupManager, BackupType, BackupStatus, RestoreStatus,
-    CompressionType, backup_manager
+    CompressionType, ChecksumType, backup_manager, ZSTD_AVAILABLE,
+    CRC32C_AVAILABLE
 )
 
 
@@ -47,6 +49,27 @@ class TestBackupManager:
         assert "full" in metadata.tags
         assert "system" in metadata.tags
     
+    def test_full_backup_sections_round_trip(self, manager):
+        """Full backups store per-section checksums and decode intact."""
+        scenarios = {f"s{i}": {"name": "x" * 300} for i in range(500)}
+        metadata = manager.create_full_backup(
+            created_by="admin",
+            scenarios=scenarios,
+            users=[{"username": "user1", "role": "trainee"}],
+            audit_logs=[],
+            config={"setting1": "value1"}
+        )
+        
+        assert metadata.status == BackupStatus.COMPLETED
+        assert set(metadata.section_checksums) >= {"scenarios", "users", "audit_logs", "config"}
+        assert manager.verify_backup(metadata.backup_id)["valid"] is True
+        
+        backup = manager.get_backup(metadata.backup_id)
+        restored = backup.data
+        assert restored["scenarios"] == scenarios
+        assert restored["users"] == [{"username": "user1", "role": "trainee"}]
+        assert restored["audit_logs"] == []
+    
     def test_create_scenario_backup(self, manager):
         """Test creating a scenarios backup."""
         metadata = manager.create_scenario_backup(
@@ -70,6 +93,100 @@ class TestBackupManager:
         assert backup.metadata.backup_id == metadata.backup_id
         assert "config" in backup.data
     
+    def test_backup_stores_only_payload(self, manager):
+        """Test that backups keep serialized bytes and decode data on access."""
+        source = {"config": {"key": "value"}}
+        metadata = manager.create_backup(
+            backup_type=BackupType.CONFIG,
+            created_by="admin",
+            data=source
+        )
+        
+        backup = manager.get_backup(metadata.backup_id)
+        assert isinstance(backup.payload, bytes)
+        assert backup.data == source
+        assert backup.data is not source
+        assert backup.to_dict()["data"]["config"] == {"key": "value"}
+    
+    def test_identical_payloads_share_blobs(self, manager):
+        """Identical full-backup sections are stored once and freed with the last user."""
+        scenarios = {f"s{i}": {"name": "x" * 300} for i in range(200)}
+        first = manager.create_full_backup(
+            created_by="admin", scenarios=scenarios, users=[],
+            audit_logs=[], config={"setting": 1}
+        )
+        stored_once = manager.get_statistics()["stored_size_bytes"]
+        second = manager.create_full_backup(
+            created_by="admin", scenarios=scenarios, users=[],
+            audit_logs=[], config={"setting": 2}
+        )
+        
+        first_blobs = set(manager.get_backup(first.backup_id).blob_digests)
+        second_blobs = set(manager.get_backup(second.backup_id).blob_digests)
+        shared = first_blobs & second_blobs
+        assert any(":scenarios" in digest for digest in shared)
+        assert manager.get_statistics()["stored_size_bytes"] < 2 * stored_once
+        
+        manager.delete_backup(first.backup_id)
+        assert manager.get_backup(second.backup_id).data["scenarios"] == scenarios
+        assert manager.verify_backup(second.backup_id)["valid"] is True
+        manager.delete_backup(second.backup_id)
+        assert manager._blob_store == {}
+        assert manager.get_statistics()["stored_size_bytes"] == 0
+    
+    def test_incremental_backup_round_trip(self, manager):
+        """Incremental backups resolve their record and chunk pointers."""
+        data = {
+            "scenarios": {"s1": {"name": "One"}, "s2": {"name": "Two"}},
+            "audit_logs": [{"seq": i} for i in range(500)],
+            "note": "nightly"
+        }
+        metadata = manager.create_incremental_backup(created_by="admin", data=data)
+        
+        assert metadata.status == BackupStatus.COMPLETED
+        assert metadata.backup_type == BackupType.INCREMENTAL
+        restored = manager.get_backup(metadata.backup_id).data
+        assert restored["scenarios"] == data["scenarios"]
+        assert restored["audit_logs"] == data["audit_logs"]
+        assert restored["note"] == "nightly"
+        assert manager.verify_backup(metadata.backup_id)["valid"] is True
+    
+    def test_incremental_backup_stores_only_changed_records(self, manager):
+        """Unchanged records and log chunks are shared with earlier backups."""
+        scenarios = {f"s{i}": {"name": "x" * 500} for i in range(100)}
+        logs = [{"seq": i, "detail": "y" * 50} for i in range(2000)]
+        first = manager.create_incremental_backup(
+            created_by="admin", data={"scenarios": scenarios, "audit_logs": logs}
+        )
+        stored_after_first = manager.get_statistics()["stored_size_bytes"]
+        
+        changed = dict(scenarios, s0={"name": "changed"})
+        second = manager.create_incremental_backup(
+            created_by="admin",
+            data={"scenarios": changed, "audit_logs": logs + [{"seq": 2000}]}
+        )
+        added = manager.get_statistics()["stored_size_bytes"] - stored_after_first
+        
+        assert added < second.size_bytes / 4
+        manager.delete_backup(first.backup_id)
+        restored = manager.get_backup(second.backup_id).data
+        assert restored["scenarios"]["s0"] == {"name": "changed"}
+        assert restored["scenarios"]["s1"] == scenarios["s1"]
+        assert len(restored["audit_logs"]) == 2001
+    
+    def test_incremental_backup_detects_corrupted_record(self, manager):
+        """Verification checks the blobs an incremental backup points at."""
+        metadata = manager.create_incremental_backup(
+            created_by="admin", data={"scenarios": {"s1": {"name": "One"}}}
+        )
+        backup = manager.get_backup(metadata.backup_id)
+        digest = backup.ref_digests[0]
+        manager._blob_store[digest] = b'{"name":"Tampered"}'
+        
+        result = manager.verify_backup(metadata.backup_id)
+        assert result["valid"] is False
+        assert result["blobs"] == [digest]
+    
     def test_list_backups(self, manager):
         """Test listing backups."""
         # Create multiple backups
@@ -101,6 +218,34 @@ class TestBackupManager:
         admin_backups = manager.list_backups(created_by="admin")
         assert len(admin_backups) == 2
     
+    def test_list_backups_indexed_filters(self, manager):
+        """Filters combine, results are newest first and limit applies."""
+        first = manager.create_backup(
+            BackupType.SCENARIOS, "admin", data={}, tags=["nightly"]
+        )
+        second = manager.create_backup(
+            BackupType.SCENARIOS, "admin", data={}, tags=["manual"]
+        )
+        third = manager.create_backup(
+            BackupType.CONFIG, "admin", data={}, tags=["nightly"]
+        )
+        manager.verify_backup(first.backup_id)
+        
+        newest = manager.list_backups(limit=2)
+        assert [b.backup_id for b in newest] == [third.backup_id, second.backup_id]
+        
+        nightly = manager.list_backups(tags=["nightly", "missing"])
+        assert [b.backup_id for b in nightly] == [third.backup_id, first.backup_id]
+        
+        verified = manager.list_backups(
+            backup_type=BackupType.SCENARIOS, status=BackupStatus.VERIFIED
+        )
+        assert [b.backup_id for b in verified] == [first.backup_id]
+        
+        manager.delete_backup(third.backup_id)
+        assert manager.list_backups(backup_type=BackupType.CONFIG) == []
+        assert manager.list_backups(created_by="nobody") == []
+    
     def test_delete_backup(self, manager):
         """Test deleting a backup."""
         metadata = manager.create_backup(
@@ -125,6 +270,29 @@ class TestBackupManager:
         assert result["valid"] is True
         assert "checksum" in result
     
+    def test_verify_detects_corrupted_payload(self, manager):
+        """Verification hashes the stored bytes and catches corruption."""
+        metadata = manager.create_backup(
+            backup_type=BackupType.CONFIG,
+            created_by="admin",
+            data={"important": "data"}
+        )
+        backup = manager.get_backup(metadata.backup_id)
+        digest = backup.blob_digests[-1]
+        manager._blob_store[digest] = manager._blob_store[digest] + b" "
+        
+        result = manager.verify_backup(metadata.backup_id)
+        assert result["valid"] is False
+        assert result["error"] == "Checksum mismatch"
+    
+    def test_checksums_are_standard_sha256(self, manager):
+        """Checksums match plain SHA-256, whole or chunked."""
+        data = b"backup payload" * 100
+        expected = hashlib.sha256(data).hexdigest()
+        
+        assert manager._generate_checksum(data) == expected
+        assert manager._hash_stream([data[:7], data[7:500], data[500:]]) == expected
+    
     def test_verify_nonexistent_backup(self, manager):
         """Test verifying a nonexistent backup."""
         result = manager.verify_backup("nonexistent")
@@ -149,6 +317,28 @@ class TestBackupManager:
         assert restore_point.status == RestoreStatus.COMPLETED
         assert restore_point.items_restored > 0
     
+    def test_restore_backup_does_not_decode_payload(self, manager):
+        """Test restore counts items from metadata without decoding."""
+        metadata = manager.create_backup(
+            backup_type=BackupType.FULL,
+            created_by="admin",
+            data={"scenarios": {"s1": "data"}, "users": {"u1": "data"}}
+        )
+        
+        def fail_decode(*args):
+            raise AssertionError("payload decoded during restore")
+        
+        backup = manager._backups[metadata.backup_id]
+        object.__setattr__(backup, "_decode", fail_decode)
+        
+        restore_point = manager.restore_backup(
+            backup_id=metadata.backup_id,
+            created_by="admin"
+        )
+        
+        assert restore_point.status == RestoreStatus.COMPLETED
+        assert restore_point.items_restored == metadata.items_count
+    
     def test_restore_nonexistent_backup(self, manager):
         """Test restoring from nonexistent backup."""
         restore_point = manager.restore_backup(
@@ -176,6 +366,25 @@ class TestBackupManager:
         # Filter by backup
         points = manager.list_restore_points(backup_id=metadata.backup_id)
         assert len(points) == 2
+    
+    def test_list_restore_points_newest_first(self, manager):
+        """Test that restore points are listed newest-first."""
+        metadata = manager.create_backup(
+            backup_type=BackupType.CONFIG,
+            created_by="admin",
+            data={}
+        )
+        first = manager.restore_backup(metadata.backup_id, "admin")
+        failed = manager.restore_backup("nonexistent", "admin")
+        last = manager.restore_backup(metadata.backup_id, "admin")
+        
+        points = manager.list_restore_points()
+        assert [p.restore_id for p in points] == [
+            last.restore_id, failed.restore_id, first.restore_id
+        ]
+        
+        completed = manager.list_restore_points(status=RestoreStatus.COMPLETED, limit=1)
+        assert [p.restore_id for p in completed] == [last.restore_id]
 
 
 class TestLabSnapshots:
@@ -250,6 +459,45 @@ class TestLabSnapshots:
         s1_snapshots = manager.list_lab_snapshots(scenario_id="s1")
         assert len(s1_snapshots) == 2
     
+    def test_list_lab_snapshots_combined_filters(self, manager):
+        """Test that snapshot filters combine and track deletions."""
+        kept = manager.create_lab_snapshot(
+            lab_id="lab-1", scenario_id="s1", created_by="admin",
+            status="running", containers=[], networks=[]
+        )
+        removed = manager.create_lab_snapshot(
+            lab_id="lab-1", scenario_id="s1", created_by="admin",
+            status="running", containers=[], networks=[]
+        )
+        manager.create_lab_snapshot(
+            lab_id="lab-1", scenario_id="s2", created_by="admin",
+            status="running", containers=[], networks=[]
+        )
+        manager.delete_lab_snapshot(removed.snapshot_id)
+        
+        listed = manager.list_lab_snapshots(
+            lab_id="lab-1", scenario_id="s1", created_by="admin"
+        )
+        assert [s.snapshot_id for s in listed] == [kept.snapshot_id]
+        assert manager.list_lab_snapshots(lab_id="lab-1", created_by="nobody") == []
+    
+    def test_list_lab_snapshots_newest_first_with_limit(self, manager):
+        """Test that snapshot listings are newest-first and honour limit."""
+        snapshots = [
+            manager.create_lab_snapshot(
+                lab_id="lab-1", scenario_id="s1", created_by="admin",
+                status="running", containers=[], networks=[]
+            )
+            for _ in range(4)
+        ]
+        manager.delete_lab_snapshot(snapshots[3].snapshot_id)
+        
+        listed = manager.list_lab_snapshots(lab_id="lab-1", limit=2)
+        
+        assert [s.snapshot_id for s in listed] == [
+            snapshots[2].snapshot_id, snapshots[1].snapshot_id
+        ]
+    
     def test_delete_lab_snapshot(self, manager):
         """Test deleting a lab snapshot."""
         snapshot = manager.create_lab_snapshot(
@@ -283,6 +531,23 @@ class TestLabSnapshots:
         assert result["scenario_id"] == "scenario-456"
         assert len(result["containers"]) == 1
         assert "restored_at" in result
+    
+    def test_concurrent_snapshot_create_and_list(self, manager):
+        """Listing while other threads create snapshots sees consistent indexes."""
+        from concurrent.futures import ThreadPoolExecutor
+        
+        def create(i):
+            for j in range(200):
+                manager.create_lab_snapshot(
+                    f"lab-{i}", "scenario-1", "admin", "running", [], []
+                )
+                manager.list_lab_snapshots(scenario_id="scenario-1", limit=5)
+        
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            list(pool.map(create, range(4)))
+        
+        assert len(manager.list_lab_snapshots(scenario_id="scenario-1", limit=1000)) == 800
+        assert len(manager.list_lab_snapshots(lab_id="lab-0", limit=1000)) == 200
 
 
 class TestBackupSchedules:
@@ -416,6 +681,117 @@ class TestBackupSchedules:
         # Check schedule was updated
         updated_schedule = manager.get_schedule(schedule.schedule_id)
         assert updated_schedule.last_run is not None
+    
+    def test_next_run_relative_to_given_time(self, manager):
+        """Test that next runs are computed from the supplied clock reading."""
+        schedule = manager.create_schedule(
+            backup_type=BackupType.CONFIG,
+            created_by="admin",
+            frequency="daily",
+            time_of_day="02:00"
+        )
+        
+        before = manager._calculate_next_run(schedule, datetime(2024, 5, 1, 1, 0))
+        after = manager._calculate_next_run(schedule, datetime(2024, 5, 1, 3, 0))
+        
+        assert before == datetime(2024, 5, 1, 2, 0)
+        assert after == datetime(2024, 5, 2, 2, 0)
+    
+    def test_monthly_next_run_clamps_to_month_end(self, manager):
+        """Test that monthly schedules past a month's end run on its last day."""
+        schedule = manager.create_schedule(
+            backup_type=BackupType.FULL,
+            created_by="admin",
+            frequency="monthly",
+            time_of_day="04:30",
+            day_of_month=31
+        )
+        
+        in_february = manager._calculate_next_run(schedule, datetime(2023, 2, 10))
+        after_january = manager._calculate_next_run(schedule, datetime(2024, 1, 31, 5, 0))
+        after_december = manager._calculate_next_run(schedule, datetime(2023, 12, 31, 5, 0))
+        
+        assert in_february == datetime(2023, 2, 28, 4, 30)
+        assert after_january == datetime(2024, 2, 29, 4, 30)
+        assert after_december == datetime(2024, 1, 31, 4, 30)
+    
+    def test_weekly_next_run(self, manager):
+        """Test weekly next runs land on the scheduled weekday."""
+        schedule = manager.create_schedule(
+            backup_type=BackupType.FULL,
+            created_by="admin",
+            frequency="weekly",
+            time_of_day="03:00",
+            day_of_week=2
+        )
+        
+        # 2024-05-01 is a Wednesday (weekday 2)
+        next_run = manager._calculate_next_run(schedule, datetime(2024, 5, 1, 1, 0))
+        assert next_run == datetime(2024, 5, 8, 3, 0)
+    
+    def test_update_schedule_time_changes_next_run(self, manager):
+        """Test that changing time_of_day is reflected in later next runs."""
+        schedule = manager.create_schedule(
+            backup_type=BackupType.CONFIG,
+            created_by="admin",
+            frequency="daily",
+            time_of_day="02:00"
+        )
+        
+        manager.update_schedule(schedule.schedule_id, time_of_day="23:15")
+        
+        next_run = manager._calculate_next_run(schedule, datetime(2024, 5, 1, 12, 0))
+        assert next_run == datetime(2024, 5, 1, 23, 15)
+        assert schedule.next_run.hour == 23 and schedule.next_run.minute == 15
+    
+    def test_run_due_schedules(self, manager):
+        """Test that only enabled, due schedules run and each runs once."""
+        due = [
+            manager.create_schedule(BackupType.CONFIG, "admin", "daily", "02:00")
+            for _ in range(5)
+        ]
+        disabled = manager.create_schedule(BackupType.CONFIG, "admin", "daily", "02:00")
+        manager.update_schedule(disabled.schedule_id, enabled=False)
+        later = manager.create_schedule(BackupType.CONFIG, "admin", "daily", "02:00")
+        later.next_run = datetime.utcnow() + timedelta(days=2)
+        
+        results = manager.run_due_schedules(
+            lambda backup_type: {"config": {"k": "v"}},
+            now=datetime.utcnow() + timedelta(days=1, minutes=1)
+        )
+        
+        assert len(results) == 5
+        assert all(r.status == BackupStatus.COMPLETED for r in results)
+        assert {r.created_by for r in results} == {
+            f"scheduled:{s.schedule_id}" for s in due
+        }
+        assert manager.get_statistics()["total_backups"] == 5
+        assert all(s.last_run is not None for s in due)
+        assert disabled.last_run is None and later.last_run is None
+    
+    def test_scheduled_backups_capped_at_max_backups(self, manager):
+        """Test that a schedule keeps only its newest max_backups backups."""
+        schedule = manager.create_schedule(
+            backup_type=BackupType.CONFIG,
+            created_by="admin",
+            frequency="daily",
+            time_of_day="02:00",
+            max_backups=2
+        )
+        other = manager.create_backup(
+            backup_type=BackupType.CONFIG,
+            created_by="admin",
+            data={}
+        )
+        
+        runs = [
+            manager.run_scheduled_backup(schedule.schedule_id, lambda _: {"n": i})
+            for i in range(4)
+        ]
+        
+        remaining = manager.list_backups(created_by=f"scheduled:{schedule.schedule_id}")
+        assert {b.backup_id for b in remaining} == {r.backup_id for r in runs[2:]}
+        assert manager.get_backup(other.backup_id) is not None
 
 
 class TestBackupExportImport:
@@ -470,6 +846,38 @@ class TestBackupExportImport:
         assert imported.backup_type == BackupType.SCENARIOS
         assert "imported" in imported.tags
     
+    def test_export_import_without_orjson(self, manager, monkeypatch):
+        """Export and import fall back to the stdlib json module."""
+        import backup_recovery
+        
+        monkeypatch.setattr(backup_recovery, "ORJSON_AVAILABLE", False)
+        original = manager.create_backup(
+            backup_type=BackupType.CONFIG,
+            created_by="admin",
+            data={"setting": "value", 3: "int key"}
+        )
+        
+        exported = manager.export_backup(original.backup_id)
+        imported = BackupManager().import_backup(exported, format="json")
+        
+        assert imported.backup_type == BackupType.CONFIG
+        assert '"3": "int key"' in exported
+    
+    def test_export_import_yaml_round_trip(self, manager):
+        """Test that YAML exports import back and unsafe tags are rejected."""
+        original = manager.create_backup(
+            backup_type=BackupType.CONFIG,
+            created_by="admin",
+            data={"setting": "value"}
+        )
+        
+        exported = manager.export_backup(original.backup_id, format="yaml")
+        imported = BackupManager().import_backup(exported, format="yaml")
+        
+        assert imported.backup_type == BackupType.CONFIG
+        with pytest.raises(ValueError):
+            manager.import_backup("!!python/object/apply:os.system ['true']", format="yaml")
+    
     def test_import_invalid_content(self, manager):
         """Test importing invalid content."""
         with pytest.raises(ValueError):
@@ -510,6 +918,20 @@ class TestBackupStatistics:
         assert stats["total_snapshots"] == 1
         assert stats["active_schedules"] == 1
     
+    def test_statistics_track_deletes_and_status_changes(self, manager):
+        """Test that statistics stay in sync as backups change."""
+        kept = manager.create_backup(BackupType.CONFIG, "admin", data={"c": 1})
+        removed = manager.create_backup(BackupType.SCENARIOS, "admin", data={"s": 1})
+        manager.verify_backup(kept.backup_id)
+        manager.delete_backup(removed.backup_id)
+        
+        stats = manager.get_statistics()
+        
+        assert stats["total_backups"] == 1
+        assert stats["total_size_bytes"] == kept.size_bytes
+        assert stats["by_type"] == {"config": 1}
+        assert stats["by_status"] == {"verified": 1}
+    
     def test_cleanup_expired_backups(self, manager):
         """Test cleaning up expired backups."""
         # Create a backup with 0 day retention (immediately expired)
@@ -528,6 +950,55 @@ class TestBackupStatistics:
         count = manager.cleanup_expired_backups()
         assert count == 1
         assert manager.get_backup(metadata.backup_id) is None
+    
+    def test_cleanup_expired_backups_keeps_unexpired(self, manager):
+        """Test that cleanup leaves unexpired and already-deleted backups alone."""
+        expired = manager.create_backup(
+            backup_type=BackupType.CONFIG,
+            created_by="admin",
+            data={},
+            retention_days=0
+        )
+        deleted = manager.create_backup(
+            backup_type=BackupType.CONFIG,
+            created_by="admin",
+            data={},
+            retention_days=0
+        )
+        kept = manager.create_backup(
+            backup_type=BackupType.CONFIG,
+            created_by="admin",
+            data={},
+            retention_days=30
+        )
+        manager.delete_backup(deleted.backup_id)
+        
+        assert manager.cleanup_expired_backups() == 1
+        assert manager.get_backup(expired.backup_id) is None
+        assert manager.get_backup(kept.backup_id) is not None
+        assert manager.cleanup_expired_backups() == 0
+    
+    def test_cleanup_expired_backups_in_bulk(self, manager):
+        """Test that bulk cleanup keeps indexes and shared blobs consistent."""
+        expired = [
+            manager.create_backup(
+                BackupType.CONFIG, "admin", data={"same": 1}, tags=["old"],
+                retention_days=0
+            )
+            for _ in range(3)
+        ]
+        kept = manager.create_backup(
+            BackupType.CONFIG, "admin", data={"same": 1}, tags=["old"],
+            retention_days=30
+        )
+        
+        assert manager.cleanup_expired_backups() == 3
+        
+        assert [b.backup_id for b in manager.list_backups()] == [kept.backup_id]
+        assert [b.backup_id for b in manager.list_backups(tags=["old"])] == [kept.backup_id]
+        assert manager.get_statistics()["total_size_bytes"] == kept.size_bytes
+        assert manager.verify_backup(kept.backup_id)["valid"] is True
+        assert all(manager.get_backup(b.backup_id) is None for b in expired)
 
 
 class TestGlobalBackupManager:
@@ -579,6 +1050,60 @@ class TestDataclassSerialization:
         assert d["status"] == "completed"
         assert d["compression_type"] == "gzip"
     
+    def test_to_dict_cached_until_invalidated(self):
+        """Terminal records reuse to_dict output until the cache is dropped."""
+        from backup_recovery import BackupMetadata
+        
+        metadata = BackupMetadata(
+            backup_id="cached-id",
+            backup_type=BackupType.CONFIG,
+            created_at=datetime.utcnow(),
+            created_by="admin",
+            description="Test",
+            status=BackupStatus.IN_PROGRESS
+        )
+        assert metadata.to_dict() is not metadata.to_dict()
+        
+        metadata.status = BackupStatus.COMPLETED
+        first = metadata.to_dict()
+        assert metadata.to_dict() is first
+        
+        metadata.status = BackupStatus.VERIFIED
+        metadata.tags.append("checked")
+        metadata._invalidate_dict()
+        rebuilt = metadata.to_dict()
+        assert rebuilt is not first
+        assert rebuilt["status"] == "verified"
+        assert rebuilt["tags"] == ["checked"]
+    
+    def test_manager_updates_refresh_cached_dicts(self):
+        """Status and schedule changes made by the manager show in to_dict."""
+        manager = BackupManager()
+        metadata = manager.create_backup(
+            backup_type=BackupType.CONFIG,
+            created_by="admin",
+            data={"config": {"key": "value"}}
+        )
+        assert metadata.to_dict()["status"] == "completed"
+        manager.verify_backup(metadata.backup_id)
+        assert metadata.to_dict()["status"] == "verified"
+        
+        schedule = manager.create_schedule(
+            backup_type=BackupType.CONFIG,
+            frequency="daily",
+            time_of_day="02:00",
+            created_by="admin"
+        )
+        assert schedule.to_dict()["enabled"] is True
+        manager.update_schedule(schedule.schedule_id, enabled=False, max_backups=3)
+        assert schedule.to_dict()["enabled"] is False
+        assert schedule.to_dict()["max_backups"] == 3
+        
+        manager.update_schedule(schedule.schedule_id, enabled=True)
+        assert schedule.to_dict()["last_run"] is None
+        manager.run_scheduled_backup(schedule.schedule_id, lambda backup_type: {"k": 1})
+        assert schedule.to_dict()["last_run"] is not None
+    
     def test_lab_snapshot_to_dict(self):
         """Test LabSnapshot serialization."""
         from backup_recovery import LabSnapshot
@@ -617,3 +1142,150 @@ class TestDataclassSerialization:
         assert d["restore_id"] == "restore-123"
         assert d["status"] == "completed"
         assert d["items_restored"] == 10
+
+
+class TestBackupCompression:
+    """Tests for backup payload compression."""
+    
+    @pytest.fixture
+    def manager(self):
+        return BackupManager()
+    
+    def test_large_backup_is_compressed_and_round_trips(self, manager):
+        """Payloads above the threshold are compressed and restore intact."""
+        scenarios = {
+            f"s{i}": {"name": f"Scenario {i}", "notes": "x" * 200}
+            for i in range(1000)
+        }
+        metadata = manager.create_scenario_backup(created_by="admin", scenarios=scenarios)
+        
+        expected = CompressionType.ZSTD if ZSTD_AVAILABLE else CompressionType.GZIP
+        assert metadata.compressed is True
+        assert metadata.compression_type == expected
+        assert manager.verify_backup(metadata.backup_id)["valid"] is True
+        
+        payload, _, compressed, comp_type, _ = manager._serialize_backup(
+            {"scenarios": scenarios}
+        )
+        restored = manager._deserialize_backup(payload, compressed, comp_type)
+        assert restored == {"scenarios": scenarios}
+    
+    def test_gzip_backups_still_decompress(self, manager):
+        """Backups written with gzip remain readable."""
+        import gzip
+        import json
+        
+        payload = gzip.compress(json.dumps({"config": {"k": "v"}}).encode("utf-8"))
+        
+        restored = manager._deserialize_backup(payload, True, CompressionType.GZIP)
+        assert restored == {"config": {"k": "v"}}
+    
+    def test_gzip_fallback_uses_configured_level(self, manager, monkeypatch):
+        """Without zstd, payloads are gzip-compressed at the fast level."""
+        import gzip
+        import backup_recovery
+        
+        monkeypatch.setattr(backup_recovery, "ZSTD_AVAILABLE", False)
+        data = b'{"k": "' + b"v" * 10000 + b'"}'
+        
+        compressed, comp_type = manager._compress_data(data)
+        
+        assert comp_type == CompressionType.GZIP
+        assert len(compressed) == len(gzip.compress(data, compresslevel=1))
+        assert gzip.decompress(compressed) == data
+    
+    @pytest.mark.skipif(not ZSTD_AVAILABLE, reason="zstandard not installed")
+    def test_zstd_threads_single_inside_worker_pools(self, manager, monkeypatch):
+        """Compression inside the worker pools does not start zstd threads."""
+        import backup_recovery
+        
+        thread_counts = []
+        real_compressor = backup_recovery.zstandard.ZstdCompressor
+        
+        def recording_compressor(**kwargs):
+            thread_counts.append(kwargs["threads"])
+            return real_compressor(**kwargs)
+        
+        monkeypatch.setattr(
+            backup_recovery.zstandard, "ZstdCompressor", recording_compressor
+        )
+        data = b'{"k": "' + b"v" * 10000 + b'"}'
+        
+        manager._compress_data(data)
+        with backup_recovery._worker_pool(2) as pool:
+            pool.submit(manager._compress_data, data).result()
+        
+        assert thread_counts == [-1, 0]
+
+
+class TestBackupChecksums:
+    """Tests for backup checksum algorithms."""
+    
+    @pytest.fixture
+    def manager(self):
+        return BackupManager()
+    
+    @pytest.mark.skipif(not CRC32C_AVAILABLE, reason="google-crc32c not installed")
+    def test_crc32c_backup_verifies_and_detects_corruption(self, manager):
+        """CRC32C backups verify and catch payload corruption."""
+        metadata = manager.create_backup(
+            backup_type=BackupType.LAB_STATE,
+            created_by="admin",
+            data={"containers": ["c" * 200] * 1000},
+            checksum_algo=ChecksumType.CRC32C
+        )
+        
+        assert metadata.checksum_algo == ChecksumType.CRC32C
+        assert len(metadata.checksum) == 8
+        assert metadata.to_dict()["checksum_algo"] == "crc32c"
+        assert manager.verify_backup(metadata.backup_id)["valid"] is True
+        
+        backup = manager.get_backup(metadata.backup_id)
+        digest = backup.blob_digests[-1]
+        blob = manager._blob_store[digest]
+        manager._blob_store[digest] = blob[:-1] + bytes([blob[-1] ^ 1])
+        assert manager.verify_backup(metadata.backup_id)["valid"] is False
+    
+    @pytest.mark.skipif(not CRC32C_AVAILABLE, reason="google-crc32c not installed")
+    def test_scheduled_lab_state_backups_use_crc32c(self, manager):
+        """Integrity-only scheduled backups use CRC32C; others keep SHA-256."""
+        lab_schedule = manager.create_schedule(
+            BackupType.LAB_STATE, "admin", "daily", "02:00"
+        )
+        config_schedule = manager.create_schedule(
+            BackupType.CONFIG, "admin", "daily", "02:00"
+        )
+        
+        lab = manager.run_scheduled_backup(lab_schedule.schedule_id, lambda _: {"l": 1})
+        config = manager.run_scheduled_backup(config_schedule.schedule_id, lambda _: {"c": 1})
+        
+        assert lab.checksum_algo == ChecksumType.CRC32C
+        assert config.checksum_algo == ChecksumType.SHA256
+    
+    def test_blob_key_collisions_are_not_shared(self, manager):
+        """Blobs with the same key but different bytes are stored separately."""
+        first = manager._put_blob("crc32c:deadbeef", b"one")
+        second = manager._put_blob("crc32c:deadbeef", b"two")
+        again = manager._put_blob("crc32c:deadbeef", b"two")
+        
+        assert first != second
+        assert again == second
+        assert manager._load_blobs((first,)) == b"one"
+        assert manager._load_blobs((second,)) == b"two"
+        assert manager._blob_refs[second] == 2
+    
+    def test_crc32c_falls_back_to_sha256(self, manager, monkeypatch):
+        """Without google-crc32c, CRC32C requests use SHA-256."""
+        import backup_recovery
+        
+        monkeypatch.setattr(backup_recovery, "CRC32C_AVAILABLE", False)
+        metadata = manager.create_backup(
+            backup_type=BackupType.CONFIG,
+            created_by="admin",
+            data={"c": 1},
+            checksum_algo=ChecksumType.CRC32C
+        )
+        
+        assert metadata.checksum_algo == ChecksumType.SHA256
+        assert len(metadata.checksum) == 64
+        assert manager.verify_backup(metadata.backup_id)["valid"] is True
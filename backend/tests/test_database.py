@@ -0,0 +1,59 @@
+"""Tests for database session management."""
+import pytest
+import pytest_asyncio
+from sqlalchemy import literal, select, text
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+import database
+
+
+@pytest_asyncio.fixture
+async def session_maker(tmp_path, monkeypatch):
+    """Point get_db() at a throwaway SQLite database."""
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'test.db'}")
+    async with engine.begin() as conn:
+        await conn.execute(text("CREATE TABLE items (id INTEGER PRIMARY KEY, name TEXT)"))
+    maker = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    monkeypatch.setattr(database, "async_session_maker", maker)
+    yield maker
+    await engine.dispose()
+
+
+async def _run_in_get_db(statement, **params):
+    """Execute a statement inside the get_db() dependency and close it."""
+    db = database.get_db()
+    session = await db.__anext__()
+    await session.execute(statement, params)
+    with pytest.raises(StopAsyncIteration):
+        await db.__anext__()
+
+
+@pytest.mark.asyncio
+async def test_get_db_commits_text_dml(session_maker):
+    """Raw text() writes executed through get_db() are committed."""
+    await _run_in_get_db(
+        text("INSERT INTO items (id, name) VALUES (:id, :name)"), id=1, name="radio"
+    )
+    await _run_in_get_db(text("UPDATE items SET name = :name WHERE id = 1"), name="jammer")
+
+    async with session_maker() as session:
+        result = await session.execute(text("SELECT name FROM items WHERE id = 1"))
+        assert result.scalar_one() == "jammer"
+
+
+@pytest.mark.asyncio
+async def test_get_db_skips_commit_for_reads(session_maker, monkeypatch):
+    """ORM selects through get_db() do not issue a COMMIT."""
+    commits = []
+
+    async def record_commit(self):
+        commits.append(self)
+
+    monkeypatch.setattr(AsyncSession, "commit", record_commit)
+    db = database.get_db()
+    session = await db.__anext__()
+    await session.execute(select(literal(1)))
+    with pytest.raises(StopAsyncIteration):
+        await db.__anext__()
+
+    assert commits == []
@@ -149,6 +149,61 @@ class TestMitreAttack:
         assert len(ssh) > 0
         assert any("SSH" in t.name for t in ssh)
     
+    def test_techniques_are_immutable(self, integrations):
+        """Test catalogue techniques cannot be modified in place."""
+        import dataclasses
+        
+        technique = integrations.get_technique("T1059")
+        
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            technique.tactic = "Impact"
+        assert isinstance(technique.platforms, tuple)
+    
+    def test_instances_share_builtin_catalogue(self, integrations):
+        """Test new instances reuse the catalogue built at import."""
+        other = ExternalIntegrations()
+        
+        assert other.get_technique("T1059") is integrations.get_technique("T1059")
+        assert other.get_statistics()["total_techniques"] == 15
+    
+    def test_list_techniques_combined_filters(self, integrations):
+        """Test tactic and platform filters intersect in catalogue order."""
+        expected = [
+            t for t in integrations.list_techniques()
+            if t.tactic == "Lateral Movement" and "Linux" in t.platforms
+        ]
+        
+        result = integrations.list_techniques(tactic="Lateral Movement", platform="Linux")
+        
+        assert [t.technique_id for t in result] == ["T1021", "T1021.004"]
+        assert result == expected
+        assert integrations.list_techniques(tactic="Impact", platform="Cloud") == []
+        assert integrations.list_techniques(tactic="Unknown") == []
+    
+    def test_search_techniques_across_fields(self, integrations):
+        """Test search matches name, description or ID, case-insensitively."""
+        by_id = integrations.list_techniques(search="t1059.00")
+        by_name = integrations.list_techniques(search="POWERSHELL")
+        by_description = integrations.list_techniques(search="encrypt data")
+        
+        assert [t.technique_id for t in by_id] == ["T1059.001", "T1059.004"]
+        assert [t.technique_id for t in by_name] == ["T1059.001"]
+        assert [t.technique_id for t in by_description] == ["T1486"]
+        # Matches never span the boundary between two fields
+        assert integrations.list_techniques(search="interpreteradversaries") == []
+    
+    def test_search_combines_with_filters(self, integrations):
+        """Test search results intersect with tactic and platform filters."""
+        result = integrations.list_techniques(platform="Windows", search="t10")
+        
+        assert [t.technique_id for t in result] == [
+            "T1059", "T1059.001", "T1078", "T1046", "T1021", "T1021.001",
+            "T1071", "T1041", "T1003"
+        ]
+        assert integrations.list_techniques(tactic="Execution", search="ssh") == []
+        # A match never runs from one technique into the next
+        assert integrations.list_techniques(search="t1059\npowershell") == []
+    
     def test_get_tactics(self, integrations):
         """Test getting tactics list."""
         tactics = integrations.get_tactics()
@@ -209,6 +264,19 @@ class TestMitreAttack:
         assert mapping is not None
         assert mapping.scenario_name == "Test Scenario"
     
+    def test_get_mapping_for_scenario_after_delete(self, integrations):
+        """Test the scenario lookup falls back to the next mapping on delete."""
+        first = integrations.create_attack_mapping("s1", "First", ["T1059"], "admin")
+        second = integrations.create_attack_mapping("s1", "Second", ["T1046"], "admin")
+        
+        assert integrations.get_mapping_for_scenario("s1") is first
+        
+        integrations.delete_attack_mapping(first.mapping_id)
+        assert integrations.get_mapping_for_scenario("s1") is second
+        
+        integrations.delete_attack_mapping(second.mapping_id)
+        assert integrations.get_mapping_for_scenario("s1") is None
+    
     def test_list_attack_mappings(self, integrations):
         """Test listing ATT&CK mappings."""
         integrations.create_attack_mapping(
@@ -399,6 +467,81 @@ class TestLogForwarding:
         )
         assert count == 0
     
+    def test_forward_log_follows_rule_level_changes(self, integrations):
+        """Test level updates and deletes change which rules receive a log."""
+        first = integrations.create_forwarding_rule(
+            "First", "int-1", log_levels=[LogLevel.INFO]
+        )
+        second = integrations.create_forwarding_rule(
+            "Second", "int-1", log_levels=[LogLevel.DEBUG]
+        )
+        assert integrations.forward_log(LogLevel.DEBUG, "src", "msg") == 1
+        
+        integrations.update_forwarding_rule(first.rule_id, log_levels=[LogLevel.DEBUG])
+        assert integrations.forward_log(LogLevel.INFO, "src", "msg") == 0
+        integrations.clear_log_buffer()
+        assert integrations.forward_log(LogLevel.DEBUG, "src", "msg") == 2
+        assert [e["rule_id"] for e in integrations.get_log_buffer()] == [
+            first.rule_id, second.rule_id
+        ]
+        
+        integrations.delete_forwarding_rule(second.rule_id)
+        assert integrations.forward_log(LogLevel.DEBUG, "src", "msg") == 1
+    
+    def test_update_source_filter_applies_to_forwarding(self, integrations):
+        """Test changing or clearing a rule's source filter takes effect."""
+        rule = integrations.create_forwarding_rule(
+            "Forward auth logs", "int-1",
+            log_levels=[LogLevel.INFO],
+            source_filter="^cew_auth"
+        )
+        assert integrations.forward_log(LogLevel.INFO, "cew_api", "msg") == 0
+        
+        integrations.update_forwarding_rule(rule.rule_id, source_filter="^cew_api")
+        assert integrations.forward_log(LogLevel.INFO, "cew_api", "msg") == 1
+        
+        integrations.update_forwarding_rule(rule.rule_id, source_filter="")
+        assert integrations.forward_log(LogLevel.INFO, "anything", "msg") == 1
+    
+    def test_invalid_source_filter_rejected(self, integrations):
+        """Test invalid source filter patterns are rejected up front."""
+        with pytest.raises(ValueError):
+            integrations.create_forwarding_rule("Bad", "int-1", source_filter="(")
+        
+        rule = integrations.create_forwarding_rule("Good", "int-1", source_filter="^cew")
+        with pytest.raises(ValueError):
+            integrations.update_forwarding_rule(rule.rule_id, source_filter="[")
+        
+        assert rule.source_filter == "^cew"
+        assert integrations.list_forwarding_rules() == [rule]
+    
+    def test_log_timestamp_format(self, monkeypatch):
+        """Test log timestamps match datetime.isoformat() across seconds."""
+        import external_integrations
+        
+        clock = iter([
+            1_700_000_000_123_456_789,
+            1_700_000_000_999_999_999,
+            1_700_000_001_000_000_000,
+        ])
+        monkeypatch.setattr(external_integrations.time, "time_ns", lambda: next(clock))
+        
+        assert [external_integrations._utc_now_iso() for _ in range(3)] == [
+            "2023-11-14T22:13:20.123456",
+            "2023-11-14T22:13:20.999999",
+            "2023-11-14T22:13:21",
+        ]
+    
+    def test_forward_log_timestamp_is_current(self, integrations):
+        """Test forwarded entries carry the current UTC time."""
+        integrations.create_forwarding_rule("All", "int-1", log_levels=[LogLevel.INFO])
+        before = datetime.utcnow()
+        integrations.forward_log(LogLevel.INFO, "src", "msg")
+        after = datetime.utcnow()
+        
+        timestamp = datetime.fromisoformat(integrations.get_log_buffer()[0]["entry"]["timestamp"])
+        assert before <= timestamp <= after
+    
     def test_get_log_buffer(self, integrations):
         """Test getting the log buffer."""
         integration = integrations.create_integration(
@@ -417,6 +560,21 @@ class TestLogForwarding:
         buffer = integrations.get_log_buffer()
         assert len(buffer) == 2
     
+    def test_log_buffer_is_bounded(self):
+        """Test the buffer keeps only the newest entries and honours limit."""
+        integrations = ExternalIntegrations(max_log_buffer=3)
+        integrations.create_forwarding_rule("All", "int-1", log_levels=[LogLevel.INFO])
+        
+        for i in range(5):
+            integrations.forward_log(LogLevel.INFO, "src", f"Message {i}")
+        
+        messages = [e["entry"]["message"] for e in integrations.get_log_buffer()]
+        assert messages == ["Message 2", "Message 3", "Message 4"]
+        assert [e["entry"]["message"] for e in integrations.get_log_buffer(limit=2)] == [
+            "Message 3", "Message 4"
+        ]
+        assert integrations.get_statistics()["log_buffer_size"] == 3
+    
     def test_clear_log_buffer(self, integrations):
         """Test clearing the log buffer."""
         integration = integrations.create_integration(
@@ -598,6 +756,27 @@ class TestDataclassSerialization:
         # Password should be filtered
         assert "password" not in d["config"]
     
+    def test_integration_config_to_dict_redacts_credentials(self):
+        """Test credentials are dropped but other config and fields are kept."""
+        from external_integrations import IntegrationConfig
+        
+        config = IntegrationConfig(
+            integration_id="test-123",
+            integration_type=IntegrationType.ELASTICSEARCH,
+            name="ELK",
+            config={"host": "elk", "api_key": "k", "password": "p"},
+            last_connected=datetime(2024, 1, 1, 12, 0)
+        )
+        
+        d = config.to_dict()
+        assert d["config"] == {"host": "elk"}
+        assert config.config["api_key"] == "k"
+        assert d["last_connected"] == "2024-01-01T12:00:00"
+        assert list(d) == [
+            "integration_id", "integration_type", "name", "enabled", "config",
+            "status", "last_connected", "error_message", "created_at", "created_by"
+        ]
+    
     def test_mitre_attack_technique_to_dict(self):
         """Test MitreAttackTechnique serialization."""
         from external_integrations import MitreAttackTechnique
@@ -1,3 +1,5 @@
+import json
+
 from fastapi.testclient import TestClient
 from main import app, db, active_scenarios, lab_to_scenario
 from orchestrator import orchestrator
@@ -695,3 +697,19 @@ def test_container_logs_requires_auth():
     # Try without auth
     r = client.get("/labs/some-lab-id/containers/node1/logs")
     assert r.status_code == 401
+
+
+def test_list_attack_techniques_matches_to_dict():
+    from external_integrations import external_integrations
+
+    token = get_admin_token()
+    r = client.get(
+        "/mitre-attack/techniques",
+        params={"platform": "Linux"},
+        headers={"Authorization": f"Bearer {token}"}
+    )
+    assert r.status_code == 200
+    assert "application/json" in r.headers["content-type"]
+    # Tuple fields come back as JSON arrays
+    expected = [t.to_dict() for t in external_integrations.list_techniques(platform="Linux")]
+    assert r.json() == json.loads(json.dumps(expected))